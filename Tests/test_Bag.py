@@ -72,6 +72,253 @@ class TEST_Bag(unittest.TestCase):
         self.assertIsNotNone(task)
         pass
 
+    def test_bag_take_min_max(self):
+        ''''''
+        bag = Bag(1000, 100)
+        task1 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.9, 0.5, 0.5))
+        task2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal'))), Budget(0.5, 0.6, 0.6))
+        task3 = Task(Judgement(Statement(Term('swan'), Copula.Inheritance, Term('bird'))), Budget(0.1, 0.6, 0.6))
+        bag.put(task1)
+        bag.put(task2)
+        bag.put(task3)
+        self.assertIs(bag.take_max(remove=False), task1)
+        self.assertIs(bag.take_min(remove=False), task3)
+        self.assertIs(bag.take_min(remove=True), task3)
+        self.assertIs(bag.take_min(remove=True), task2)
+        self.assertIs(bag.take_max(remove=True), task1)
+        self.assertEqual(len(bag), bag.count())
+        self.assertEqual(len(bag), 0)
+        self.assertIsNone(bag.take())
+        pass
+
+    def test_bag_take_in_order(self):
+        '''the items of the same priority are taken in the order they are put, even after some of them are removed by key'''
+        def tasks():
+            return [Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), Budget(0.5, 0.5, 0.5)) for i in range(5)]
+        bag = Bag(1000, 100, take_in_order=True)
+        tasks1 = tasks()
+        for task in tasks1: bag.put(task)
+        self.assertEqual([bag.take() for _ in range(5)], tasks1)
+        self.assertIsNone(bag.take())
+
+        for task in tasks1: bag.put(task)
+        bag.take_by_key(tasks1[1])
+        bag.take_by_key(tasks1[3])
+        bag.put(tasks1[1])
+        self.assertEqual([bag.take_min() for _ in range(4)], [tasks1[0], tasks1[2], tasks1[4], tasks1[1]])
+
+        # a random take still reaches every item
+        bag = Bag(1000, 100, take_in_order=False)
+        tasks2 = tasks()
+        for task in tasks2: bag.put(task)
+        bag.take_by_key(tasks2[2])
+        taken = set(hash(bag.take(remove=False)) for _ in range(200))
+        self.assertEqual(taken, set(hash(task) for task in tasks2 if task is not tasks2[2]))
+        self.assertEqual(len(bag), bag.count())
+        pass
+
+    def test_bag_put_overflow(self):
+        '''the item with the lowest priority is popped when the bag is full'''
+        bag = Bag(2, 100)
+        task1 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.9, 0.5, 0.5))
+        task2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal'))), Budget(0.2, 0.6, 0.6))
+        task3 = Task(Judgement(Statement(Term('swan'), Copula.Inheritance, Term('bird'))), Budget(0.5, 0.6, 0.6))
+        task4 = Task(Judgement(Statement(Term('swan'), Copula.Inheritance, Term('animal'))), Budget(0.1, 0.6, 0.6))
+        self.assertIsNone(bag.put(task1))
+        self.assertIsNone(bag.put(task2))
+        self.assertIs(bag.put(task3), task2)
+        self.assertIs(bag.put(task4), task4)
+        self.assertIn(task1, bag)
+        self.assertIn(task3, bag)
+        self.assertEqual(len(bag), bag.count())
+        self.assertEqual(len(bag), 2)
+        pass
+
+    def test_bag_merge_then_take_by_key(self):
+        '''an item whose priority is raised by merging can still be removed by key'''
+        bag = Bag(1000, 100)
+        task = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.1, 0.5, 0.5))
+        bag.put(task)
+        bag.put(Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.9, 0.5, 0.5)))
+        self.assertIs(bag.take_max(remove=False), task)
+        self.assertIs(bag.take_by_key(task, remove=True), task)
+        self.assertEqual(len(bag), bag.count())
+        self.assertEqual(len(bag), 0)
+        pass
+
+    def test_bag_take_task_sum_tree(self):
+        '''take a task exactly in proportion to the priority'''
+        bag = Bag(1000, 100, sum_tree=True)
+        tasks = []
+        for i in range(40):
+            task = Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), Budget((i % 4 + 1)/4, 0.5, 0.5))
+            bag.put(task)
+            tasks.append(task)
+        # remove some of them, so that some slots of the sum-tree are reused
+        for task in tasks[:20]:
+            bag.take_by_key(task)
+        for task in tasks[:20]:
+            bag.put(task)
+        self.assertEqual(len(bag), bag.count())
+        self.assertEqual(len(bag), 40)
+
+        cnt = [0, 0, 0, 0]
+        n = 20000
+        for _ in range(n):
+            task = bag.take(remove=False)
+            cnt[int(round(task.budget.priority*4)) - 1] += 1
+        for i in range(4):
+            self.assertAlmostEqual(cnt[i]/n, (i+1)/10, delta=0.02)
+
+        for _ in range(40):
+            self.assertIsNotNone(bag.take(remove=True))
+        self.assertEqual(len(bag), bag.count())
+        self.assertEqual(len(bag), 0)
+        self.assertIsNone(bag.take())
+        pass
+
+    def test_bag_budget_store_decay_all(self):
+        '''decaying all the items in a single vectorized pass is the same as decaying them one by one'''
+        bag1 = Bag(1000, 100)
+        bag2 = Bag(1000, 100, budget_store=True)
+        tasks = []
+        for i in range(100):
+            budget = Budget(i/100, (i % 7 + 1)/8, (i % 5 + 1)/6)
+            task1 = Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), budget)
+            task2 = Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), budget)
+            bag1.put(task1)
+            bag2.put(task2)
+            tasks.append((task1, task2))
+        for _ in range(3):
+            bag1.decay_all()
+            bag2.decay_all()
+        for task1, task2 in tasks:
+            self.assertAlmostEqual(task1.budget.priority, task2.budget.priority)
+            self.assertEqual(bag1.level_lut[hash(task1)], bag2.level_lut[hash(task2)])
+        self.assertEqual(len(bag2), bag2.count())
+
+        # a task taken out of the bag keeps its budget, which is no longer held by the bag
+        task1, task2 = tasks[50]
+        budget = task2.budget
+        self.assertIs(bag2.take_by_key(task2), task2)
+        self.assertIs(task2.budget, budget)
+        self.assertIs(type(budget), Budget)
+        self.assertAlmostEqual(budget.priority, task1.budget.priority)
+        bag2.put(task2)
+        task1 = bag1.take_max()
+        task2 = bag2.take_max()
+        self.assertEqual(task1, task2)
+        self.assertAlmostEqual(task1.budget.priority, task2.budget.priority)
+        self.assertEqual(len(bag2), bag2.count())
+        self.assertEqual(len(bag2), 99)
+        pass
+
+    def test_bag_forget_all(self):
+        '''forgetting all the items in a single vectorized pass is the same as forgetting them one by one, and, in the lazy forgetting mode, the same as forgetting them when they are read'''
+        from pynars import Global
+        time = Global.time
+        try:
+            Global.time = 0
+            def tasks():
+                return [Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), Budget(i/100, (i % 7 + 1)/8, (i % 5 + 1)/6)) for i in range(100)]
+            bags = [Bag(1000, 100, lazy_forget=True), Bag(1000, 100, lazy_forget=True, budget_store=True), Bag(1000, 100, lazy_forget=True, sum_tree=True, budget_store=True), Bag(1000, 100, lazy_forget=True)]
+            for bag in bags:
+                for task in tasks(): bag.put(task)
+            Global.time = 7
+            bags[0].take_by_key(tasks()[30], remove=False)
+            bags[1].take_by_key(tasks()[30], remove=False)
+            Global.time = 20
+            for bag in bags[:3]: bag.forget_all()
+            for task1 in bags[0]:
+                for bag in bags[1:]:
+                    task2 = bag.take_by_key(task1, remove=False) # the last bag forgets the task when it is read
+                    self.assertAlmostEqual(task1.budget.priority, task2.budget.priority)
+                    self.assertEqual(task2.t_touched, 20)
+                    self.assertEqual(bags[0].level_lut[hash(task1)], bag.level_lut[hash(task2)])
+            for bag in bags: self.assertEqual(len(bag), bag.count())
+        finally:
+            Global.time = time
+        pass
+
+    def test_reasoner_forget_all(self):
+        '''the reasoner forgets all the concepts periodically, with their budgets stored as arrays'''
+        from pynars import Global
+        from pynars.Config import Config
+        from pynars.NARS import Reasoner
+        config = Config.cycles_forget_all_memory, Config.budget_store_memory, Config.lazy_forget
+        try:
+            nars = Reasoner(100, 100)
+            Config.cycles_forget_all_memory, Config.budget_store_memory, Config.lazy_forget = 5, True, True
+            nars.reset()
+            self.assertIsNotNone(nars.memory.concepts.budget_store)
+            for line in ('<robin-->bird>.', '<bird-->animal>.'):
+                nars.input_narsese(line, go_cycle=False)
+            nars.cycles(20)
+            t_forgotten = Global.time - 1 - (Global.time - 1) % 5
+            for concept in nars.memory.concepts:
+                self.assertGreaterEqual(concept.t_touched, t_forgotten)
+        finally:
+            Config.cycles_forget_all_memory, Config.budget_store_memory, Config.lazy_forget = config
+        pass
+
+    def test_bag_lazy_forget(self):
+        '''an item is forgotten by the cycles elapsed since it was last touched, when it is read'''
+        from pynars import Global
+        from pynars.Config import Config
+        time = Global.time
+        bag = Bag(1000, 100, lazy_forget=True)
+        task1 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.9, 0.5, 0.5))
+        task2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal'))), Budget(0.9, 0.5, 0.5))
+        bag.put(task1)
+        bag.put(task2)
+
+        # reading the items many times in the same cycle does not forget them
+        for _ in range(10):
+            bag.put_back(bag.take(remove=True))
+        self.assertEqual(task1.budget.priority, 0.9)
+
+        # after `Config.cycles_forget` cycles, the priority above the quality floor becomes `d` times of itself
+        Global.time += Config.cycles_forget
+        q = 0.5 * Config.quality_min
+        self.assertIs(bag.take_by_key(task1, remove=False), task1)
+        self.assertAlmostEqual(task1.budget.priority, q + (0.9 - q) * 0.5)
+        self.assertEqual(bag.level_lut[hash(task1)], bag.map_priority(task1.budget.priority))
+        # forgetting in two steps is the same as forgetting in one step
+        Global.time += Config.cycles_forget
+        self.assertAlmostEqual(bag.take_by_key(task1, remove=False).budget.priority, q + (0.9 - q) * 0.25)
+        self.assertAlmostEqual(bag.take_by_key(task2, remove=True).budget.priority, q + (0.9 - q) * 0.25)
+        self.assertIs(bag.take_max(), task1)
+        self.assertEqual(len(bag), bag.count())
+        self.assertEqual(len(bag), 0)
+        Global.time = time
+        pass
+
+    def test_bag_peek_touch(self):
+        '''the items are peeked in descending order of priorities without being taken out, and an item touched is updated as if it were put back'''
+        bag1 = Bag(1000, 100)
+        bag2 = Bag(1000, 100)
+        tasks = []
+        for i in range(20):
+            budget = Budget((i*7 % 20)/20, 0.5, 0.5)
+            task1 = Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), budget)
+            task2 = Task(Judgement(Statement(Term(f'robin_{i}'), Copula.Inheritance, Term('bird'))), budget)
+            bag1.put(task1)
+            bag2.put(task2)
+            tasks.append((task1, task2))
+        priorities = [task.budget.priority for task in bag1.peek()]
+        self.assertEqual(priorities, sorted(priorities, reverse=True))
+        self.assertEqual(len(priorities), 20)
+        self.assertEqual(len(bag1), 20)
+        self.assertIs(next(bag1.peek()), bag1.take_max(remove=False))
+
+        task1, task2 = tasks[3]
+        bag1.touch(task1)
+        bag2.put_back(bag2.take_by_key(task2))
+        self.assertAlmostEqual(task1.budget.priority, task2.budget.priority)
+        self.assertEqual(bag1.level_lut[hash(task1)], bag2.level_lut[hash(task2)])
+        self.assertEqual(len(bag1), bag1.count())
+        pass
+
     def test_bag_take_task(self):
         '''take a task using the priority'''
         bag = Bag(1000, 100)
@@ -0,0 +1,87 @@
+import unittest
+
+from pynars import Global
+from pynars.NARS.DataStructures import Buffer, Task
+from pynars.NARS.DataStructures._py.TimingWheel import TimingWheel
+from pynars.Narsese import Judgement, Term, Statement, Copula, Budget
+
+
+class TEST_Buffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.time = Global.time
+
+    def tearDown(self) -> None:
+        Global.time = self.time
+
+    def test_timing_wheel(self):
+        '''an item is given once the time reaches its deadline, whether it is near or far'''
+        wheel = TimingWheel(100, n_bits=2, n_wheels=2)
+        deadlines = [99, 101, 103, 104, 117, 130, 200, 1000]
+        for deadline in deadlines:
+            wheel.add(deadline, f'item_{deadline}')
+        self.assertEqual(len(wheel), len(deadlines))
+        expired = []
+        for time in range(101, 1001):
+            for deadline, item in wheel.advance(time):
+                self.assertEqual(item, f'item_{deadline}')
+                self.assertEqual(time, max(deadline, 101))
+                expired.append(deadline)
+        self.assertEqual(expired, deadlines)
+        self.assertEqual(len(wheel), 0)
+        pass
+
+    def test_expire(self):
+        '''a task is removed after it has stayed in the buffer for `max_duration` cycles'''
+        buffer = Buffer(100, 10, max_duration=5)
+        task1 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird'))), Budget(0.9, 0.5, 0.5))
+        buffer.put(task1)
+        Global.time += 3
+        task2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal'))), Budget(0.5, 0.5, 0.5))
+        buffer.put(task2)
+        self.assertEqual(buffer.put_time(task1), Global.time - 3)
+        self.assertEqual(buffer.put_time(task2), Global.time)
+        # the stamps, which may be shared, are not written
+        self.assertIsNone(task1.stamp.t_put)
+
+        # taking a task out and putting it back does not renew it
+        buffer.put(buffer.take_by_key(task1))
+        Global.time += 2
+        self.assertIs(buffer.take_max(remove=False), task1)
+        Global.time += 1
+        self.assertIs(buffer.take_max(remove=False), task2)
+        self.assertNotIn(task1, buffer)
+        self.assertEqual(len(buffer), 1)
+        Global.time += 2
+        self.assertIs(buffer.take(remove=False), task2)
+        Global.time += 1
+        self.assertIsNone(buffer.take())
+        self.assertEqual(len(buffer), buffer.count())
+        self.assertEqual(len(buffer), 0)
+        pass
+
+    def test_expire_derived(self):
+        '''a task derived from a premise put long ago stays in the buffer for `max_duration` cycles from when it is put'''
+        from pynars.NAL.Functions.StampFunctions import Stamp_merge
+        from pynars.Narsese import Stamp, Base
+        Global.time = 0
+        premise1 = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('bird')), Stamp(0, None, None, Base((1,)))), Budget(0.9, 0.5, 0.5))
+        premise2 = Task(Judgement(Statement(Term('bird'), Copula.Inheritance, Term('animal')), Stamp(0, None, None, Base((2,)))), Budget(0.9, 0.5, 0.5))
+        buffer = Buffer(100, 10, max_duration=10)
+        buffer.put(premise1)
+        self.assertEqual(buffer.put_time(premise1), 0)
+
+        Global.time = 20000
+        task = Task(Judgement(Statement(Term('robin'), Copula.Inheritance, Term('animal')), Stamp_merge(premise1.stamp, premise2.stamp)), Budget(0.9, 0.5, 0.5))
+        buffer = Buffer(100, 10, max_duration=10)
+        buffer.put(task)
+        self.assertEqual(buffer.put_time(task), 20000)
+        self.assertIsNone(buffer.put_time(premise1))
+        Global.time += 10
+        self.assertIs(buffer.take(remove=False), task)
+        self.assertEqual(len(buffer), 1)
+        Global.time += 1
+        self.assertIsNone(buffer.take())
+
+
+if __name__ == '__main__':
+    unittest.main()
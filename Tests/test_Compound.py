@@ -83,7 +83,157 @@ class TEST_Compound(unittest.TestCase):
         '''
         term = Narsese.parse("<(&&, <$x-->A>, <$y-->A>) ==> (&&, <$x-->B>, <$y-->C>)>.").term
         self.assertEqual(len(term[0].terms), 2)
-        
+
+    def test_intern(self):
+        '''
+        terms with the same structure have the same ID, and the terms of the sentences are interned.
+        '''
+        term1 = Narsese.parse("<(&&, <robin-->bird>, <robin-->[flying]>) ==> <robin-->animal>>.").term
+        term2 = Narsese.parse("<(&&, <robin-->[flying]>, <robin-->bird>) ==> <robin-->animal>>.").term
+        self.assertIs(term1, term2)
+        term3 = Statement(Compound.Conjunction(Statement.Inheritance(Term("robin"), Compound.IntensionalSet(Term("flying"))), Statement.Inheritance(Term("robin"), Term("bird"))), Copula.Implication, Statement.Inheritance(Term("robin"), Term("animal")))
+        self.assertIsNot(term3, term1)
+        self.assertEqual(term3.id, term1.id)
+        self.assertIs(term3.intern(), term1)
+
+        # the first term interned becomes the canonical one, and the ID is not released while any term of the structure is alive
+        from pynars.Narsese import term_table
+        swan1, swan2, swan3 = Term("swan_intern"), Term("swan_intern"), Term("swan_intern")
+        id_swan = hash(swan1)
+        hash(swan2)
+        self.assertIs(swan2.intern(), swan2)
+        self.assertIs(swan1.intern(), swan2)
+        hash(swan3)
+        self.assertIs(swan3.intern(), swan2)
+        del swan2, swan3
+        self.assertIs(term_table.get(id_swan).intern(), term_table.get(id_swan))
+        self.assertEqual(Term("swan_intern").id, id_swan)
+        del swan1
+        self.assertNotIn(Term("swan_intern"), term_table)
+        # the terms compared are kept alive, since the ID of a structure is released with the last term of it (see `test_release`)
+        robin, bird = Term("robin"), Term("bird")
+        self.assertNotEqual(robin.id, bird.id)
+        inheritance, similarity1, similarity2 = Statement.Inheritance(robin, bird), Statement.Similarity(robin, bird), Statement.Similarity(bird, robin)
+        self.assertNotEqual(inheritance.id, similarity1.id)
+        self.assertEqual(similarity1.id, similarity2.id)
+
+        # terms with variables are not shared, though they have the same ID
+        term1 = Narsese.parse("<<$x-->bird>==><$x-->animal>>.").term
+        term2 = Narsese.parse("<<$y-->bird>==><$y-->animal>>.").term
+        term3 = Narsese.parse("<<$x-->bird>==><$y-->animal>>.").term
+        self.assertIsNot(term1, term2)
+        self.assertEqual(term1.id, term2.id)
+        self.assertNotEqual(term1.id, term3.id)
+
+    def test_release(self):
+        '''
+        the ID of a structure is released with the last term holding it, and reused after a batch of IDs are recycled.
+        '''
+        from pynars.Narsese import TermTable
+        table = TermTable(n_recycle=2)
+        robin1, robin2, bird = Term("robin"), Term("robin"), Term("bird")
+        id_robin = table.id(robin1)
+        self.assertEqual(table.id(robin2), id_robin)
+        id_bird = table.id(bird)
+        # the liveness of an ID is tracked through its canonical term, which the other terms hold.
+        self.assertIs(table.get(id_robin), robin1)
+        self.assertIs(robin2._canonical, robin1)
+        del robin1
+        self.assertIn(robin2, table)
+        self.assertIsNotNone(table.get(id_robin))
+        del robin2
+        self.assertNotIn(Term("robin"), table)
+        self.assertEqual(len(table), 1)
+
+        # an ID released is not reused until the batch is recycled
+        swan = Term("swan")
+        self.assertNotIn(table.id(swan), (id_robin, id_bird))
+        del bird
+        self.assertEqual(table.generation, 1)
+        self.assertEqual(table.ids_recycled, {id_robin, id_bird})
+        robin = Term("robin")
+        self.assertIn(table.id(robin), (id_robin, id_bird))
+        self.assertEqual(len(table), 2)
+
+    def test_positions(self):
+        '''
+        the positions of all the components are obtained when constructing the term.
+        '''
+        term = Statement.Inheritance(
+            Compound(Connector.Product, Statement.Inheritance(Term("B"), Term("A")), Compound(Connector.ExtensionalDifference, Term("A"), Term("C"))),
+            Compound(Connector.Product, Compound(Connector.ExtensionalDifference, Term("C"), Statement.Inheritance(Term("B"), Statement.Inheritance(Term("B"), Term("A")))), Term("A"))
+        )
+        self.assertEqual(term.get_positions(Term("A")), [(0, 0, 1), (0, 1, 0), (1, 0, 1, 1, 1), (1, 1)])
+        self.assertEqual(term.get_positions(Statement.Inheritance(Term("B"), Term("A"))), [(0, 0), (1, 0, 1, 1)])
+        self.assertEqual(term.get_positions(term), [()])
+        self.assertIsNone(term.get_positions(Term("D")))
+        for component in term.components:
+            self.assertIn(component, term)
+            for position in term.get_positions(component):
+                self.assertEqual(term[position], component)
+        self.assertIn(term, term)
+        self.assertNotIn(Term("D"), term)
+        self.assertNotIn(term, Term("A"))
+
+    def test_hash64(self):
+        '''
+        the structural hash is the same for the terms with the same structure, and it does not depend on the process.
+        '''
+        import os, subprocess, sys
+        line = "<(&&, <$x-->bird>, <$x-->[flying]>) ==> <$x-->animal>>."
+        term1 = Narsese.parse(line).term
+        term2 = Narsese.parse("<(&&, <$y-->[flying]>, <$y-->bird>) ==> <$y-->animal>>.").term
+        term3 = Narsese.parse("<(&&, <$x-->bird>, <$y-->[flying]>) ==> <$x-->animal>>.").term
+        self.assertEqual(term1.hash64, term2.hash64)
+        self.assertNotEqual(term1.hash64, term3.hash64)
+        self.assertLess(term1.hash64, 1<<64)
+        self.assertEqual(Statement.Similarity(Term("robin"), Term("bird")).hash64, Statement.Similarity(Term("bird"), Term("robin")).hash64)
+        self.assertNotEqual(Statement.Inheritance(Term("robin"), Term("bird")).hash64, Statement.Inheritance(Term("bird"), Term("robin")).hash64)
+        self.assertNotEqual(Compound.Product(Term("robin"), Term("bird")).hash64, Compound.ExtensionalIntersection(Term("robin"), Term("bird")).hash64)
+
+        for seed in ('1', '2'):
+            code = f"from pynars import Narsese; print(Narsese.parse({line!r}).term.hash64)"
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env={**os.environ, 'PYTHONHASHSEED': seed}, cwd=Path(__file__).parent.parent).stdout
+            self.assertEqual(int(output.split()[-1]), term1.hash64)
+
+    def test_build(self):
+        '''
+        building a compound from the normalized components is the same as constructing it.
+        '''
+        A, B, C = Term("A"), Term("B"), Term("C")
+        AB = Compound(Connector.ExtensionalSet, A, B)
+        cases = [
+            (Connector.Conjunction, (A, B, A)), # de-duplicated
+            (Connector.Product, (Compound(Connector.Product, A, B), C)), # not unfolded, since the connector is not the same
+            (Connector.SequentialEvents, (Compound(Connector.SequentialEvents, A, B), C)), # unfolded
+            (Connector.ExtensionalDifference, (AB, Compound(Connector.ExtensionalSet, B))),
+            (Connector.IntensionalIntersection, (AB, Compound(Connector.ExtensionalSet, B, C))), # fallback: a commutative compound in a commutative compound
+            (Connector.Conjunction, (Narsese.parse("<$x-->A>.").term, Narsese.parse("<$x-->B>.").term)), # fallback: variables
+            (Connector.Disjunction, (A, A)), # fallback: a single component
+        ]
+        for connector, terms in cases:
+            term1 = Compound(connector, *terms)
+            term2 = Compound.build(connector, *terms)
+            self.assertEqual(term1, term2)
+            self.assertEqual(str(term1), str(term2))
+            self.assertEqual(term1.complexity, term2.complexity)
+            self.assertEqual(term1.hash64, term2.hash64)
+
+    def test_lazy_word(self):
+        '''
+        the word of a term is rendered on the first access, and the cached repr follows the variables renumbered in place.
+        '''
+        term = Statement.Inheritance(Compound.Product(Term("A"), Term("B")), Term("C"))
+        self.assertIsNone(term._word)
+        self.assertEqual(str(term), '<(*, A, B)-->C>')
+        self.assertEqual(term._word, '<(*, A, B)-->C>')
+        self.assertEqual(term.hash64, Narsese.parse('<(*, A, B)-->C>.').term.hash64)
+
+        term = Narsese.parse("<<$x-->A>==><$y-->B>>.").term
+        self.assertEqual(term.repr(), '<<$0-->A>==><$1-->B>>')
+        term.index_var.remap({0: 1, 1: 0})
+        self.assertEqual(term.repr(), '<<$1-->A>==><$0-->B>>')
+
 
 if __name__ == '__main__':
 
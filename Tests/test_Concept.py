@@ -38,6 +38,19 @@ class TEST_Concept(unittest.TestCase):
         self.assertEqual(task1, belief)
         pass
 
+    def test_compact_objects(self):
+        '''the core objects keep their attributes in slots rather than in a `__dict__`, and `get_size` still accounts for them'''
+        from pynars.NARS.DataStructures._py.Link import TaskLink
+        from pynars.utils.tools import get_size
+        task = Narsese.parser.parse('<(&&, <$x-->bird>, <$x-->[flying]>) ==> <$x-->animal>>. %0.9;0.9%')
+        concept = Concept(task.term, task.budget)
+        task_link = TaskLink(concept, task, task.budget, index=[])
+        for obj in (task.term, task.term.subject, task.term.subject[0, 0], task.truth, task.budget, task.stamp, task.sentence, task, task_link):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj))
+        self.assertGreater(get_size(task.sentence), get_size(task.term))
+        self.assertGreater(get_size(task), get_size(task.sentence))
+        pass
+
 
 if __name__ == '__main__':
     unittest.main()
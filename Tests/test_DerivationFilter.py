@@ -0,0 +1,119 @@
+import unittest
+
+from pynars import Global
+from pynars.Config import Config
+from pynars.NAL.Functions import Stamp_merge, Truth_deduction, Truth_exemplification
+from pynars.NARS.DataStructures import DerivationFilter, Buffer
+from pynars.Narsese import Task, Judgement, Budget
+import pynars.Narsese as Narsese
+
+
+class TEST_DerivationFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.time = Global.time
+
+    def tearDown(self) -> None:
+        Global.time = self.time
+
+    def derive(self, line1: str, line2: str):
+        '''the tasks derived twice from the same premises, by deduction and by exemplification'''
+        premise1, premise2 = Narsese.parse(line1), Narsese.parse(line2)
+        def derive_once():
+            return [
+                Task(Judgement(Narsese.parse(line).term, Stamp_merge(premise1.stamp, premise2.stamp), truth_function(premise1.truth, premise2.truth)), Budget(0.5, 0.5, 0.5))
+                for line, truth_function in (('<robin-->animal>.', Truth_deduction), ('<animal-->robin>.', Truth_exemplification))
+            ]
+        return derive_once(), derive_once()
+
+    def test_filter(self):
+        '''a task derived again from the same evidence is dropped, while those from different evidence are not'''
+        tasks1, tasks2 = self.derive('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%')
+        derivation_filter = DerivationFilter(100, 10)
+        self.assertEqual(derivation_filter.filter(tasks1), tasks1)
+        self.assertEqual(derivation_filter.filter(tasks2), [])
+        self.assertEqual(derivation_filter.info()['dropped'], len(tasks2))
+        self.assertTrue(all(task in derivation_filter for task in tasks2))
+
+        # the same conclusion from other premises, i.e., other evidence
+        tasks3, _ = self.derive('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%')
+        self.assertEqual([str(task) for task in tasks3], [str(task) for task in tasks1])
+        self.assertEqual(derivation_filter.filter(tasks3), tasks3)
+
+        # the same conclusion with another truth-value
+        tasks4, _ = self.derive('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %0.5;0.9%')
+        self.assertEqual(len(derivation_filter.filter(tasks4)), len(tasks4))
+
+    def test_merge(self):
+        '''a duplicate is merged into the task seen if it's still in the buffer, and dropped otherwise'''
+        tasks1, tasks2 = self.derive('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%')
+        task1, task2 = tasks1[0], tasks2[0]
+        task2.budget.priority = 0.9
+        buffer = Buffer(100, 10)
+        derivation_filter = DerivationFilter(100, 10)
+        for task in derivation_filter.filter(tasks1, buffer): buffer.put(task)
+        priority = task1.budget.priority
+        self.assertEqual(derivation_filter.filter([task2], buffer), [])
+        self.assertEqual(derivation_filter.info()['merged'], 1)
+        self.assertGreater(task1.budget.priority, priority)
+        self.assertGreaterEqual(task1.budget.priority, task2.budget.priority)
+        self.assertIs(buffer.take_max(remove=False), task1)
+        self.assertEqual(len(buffer), len(tasks1))
+
+        buffer.take_by_key(task1)
+        self.assertEqual(derivation_filter.filter([task2], buffer), [])
+        self.assertEqual(derivation_filter.info()['dropped'], 1)
+        self.assertNotIn(task1, buffer)
+
+    def test_eviction(self):
+        '''a key is forgotten after the duration, or when there are more keys than the capacity'''
+        tasks1, tasks2 = self.derive('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%')
+        derivation_filter = DerivationFilter(100, 10)
+        derivation_filter.filter(tasks1)
+        Global.time += 9
+        self.assertEqual(derivation_filter.filter(tasks2), [])
+        Global.time += 1
+        self.assertEqual(derivation_filter.filter(tasks2), tasks2)
+        self.assertEqual(len(derivation_filter), len(tasks2))
+
+        derivation_filter = DerivationFilter(1, 10)
+        derivation_filter.filter(tasks1[:2])
+        self.assertEqual(len(derivation_filter), 1)
+        self.assertEqual(derivation_filter.filter(tasks2[:1]), tasks2[:1])
+
+    def test_reasoner(self):
+        '''the duplicates are not put into the internal experience'''
+        from pynars.NARS import Reasoner
+        capacity = Config.capacity_derivation_filter
+        try:
+            nars = Reasoner(100, 100)
+            Config.capacity_derivation_filter = 1000
+            nars.reset()
+            self.assertIsNotNone(nars.derivation_filter)
+            for line in ('<robin-->bird>.', '<bird-->animal>.', '<swan-->bird>.', '<bird-->[flying]>.'):
+                nars.input_narsese(line, go_cycle=False)
+            for _ in range(100):
+                tasks_derived, *_ = nars.cycle()
+                keys = [DerivationFilter.key(task) for task in tasks_derived]
+                self.assertEqual(len(keys), len(set(keys)))
+            self.assertEqual(nars.derivation_filter.n_passed, len(nars.derivation_filter))
+        finally:
+            Config.capacity_derivation_filter = capacity
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_DerivationFilter
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -72,5 +72,41 @@ class TEST_Base(unittest.TestCase):
         self.assertNotEqual(h1, h2)
         pass
 
+    def test_overlap_ids(self):
+        '''the overlap is checked by the IDs of the evidence, which are kept sorted'''
+        base1 = Base((5, 1, 9, 3))
+        self.assertEqual(tuple(base1), (1, 3, 5, 9))
+        self.assertTrue(base1.is_overlaped(Base((4, 9))))
+        self.assertFalse(base1.is_overlaped(Base((2, 4, 6, 8))))
+        self.assertFalse(base1.is_overlaped(Base((10, 11))))
+        self.assertFalse(base1.is_overlaped(Base()))
+        self.assertFalse(base1.is_overlaped(None))
+        self.assertEqual(Base((3, 1)), Base((1, 3, 3)))
+
+    def test_max_length(self):
+        '''a base is no longer than `Config.max_evidence_length`, and the most recent evidence of both bases is kept when they are interleaved'''
+        from copy import deepcopy
+        from pynars.Config import Config
+        max_evidence_length = Config.max_evidence_length
+        try:
+            Config.max_evidence_length = 4
+            self.assertEqual(tuple(Base(range(10))), (6, 7, 8, 9))
+            base1, base2 = Base((1, 2, 3, 4)), Base((5, 6, 7))
+            base3 = Base.interleave(base1, base2)
+            self.assertEqual(tuple(base3), (3, 4, 6, 7))
+            self.assertEqual(tuple(base1 | base2), tuple(base3))
+            self.assertEqual(tuple(Base((1, 2)) | Base((2, 3))), (1, 2, 3))
+            base1 |= base2
+            self.assertEqual(tuple(base1), tuple(base3))
+            base1.add(10)
+            self.assertEqual(tuple(base1), (4, 6, 7, 10))
+            base4 = deepcopy(base1)
+            self.assertEqual(base4, base1)
+            base4.extend(Base((11,)))
+            self.assertEqual(tuple(base4), (6, 7, 10, 11))
+            self.assertEqual(tuple(base1), (4, 6, 7, 10))
+        finally:
+            Config.max_evidence_length = max_evidence_length
+
 if __name__ == '__main__':
     unittest.main()
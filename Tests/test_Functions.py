@@ -0,0 +1,156 @@
+import unittest
+
+import numpy as np
+
+from pynars.Config import Config
+from pynars.NAL.Functions import *
+from pynars.Narsese import Truth, Budget
+
+
+class TEST_Functions(unittest.TestCase):
+    '''
+    the vectorized functions agree with the scalar ones element-wise.
+    '''
+
+    def setUp(self):
+        rng = np.random.default_rng(137)
+        n = 200
+        self.f1, self.f2 = rng.uniform(0.0, 1.0, (2, n))
+        self.c1, self.c2 = rng.uniform(0.01, 0.99, (2, n))
+        # some extreme values
+        self.f1[:4] = (0.0, 1.0, 0.0, 1.0)
+        self.f2[:4] = (0.0, 0.0, 1.0, 1.0)
+        self.p1, self.d1, self.q1, self.p2, self.d2 = rng.uniform(0.0, 1.0, (5, n))
+        self.complexity = rng.integers(1, 20, n)
+        self.n_cycles = rng.integers(0, 500, n)
+        self.k = Config.k
+
+    def truths(self):
+        return [(Truth(f1, c1, self.k), Truth(f2, c2, self.k)) for f1, c1, f2, c2 in zip(self.f1, self.c1, self.f2, self.c2)]
+
+    def assert_truths(self, truths, f, c):
+        self.assertEqual(f.shape, (len(truths),))
+        # where the confidence is 0, e.g., the negation of a truth derived with a frequency of 0, the frequency is undefined in both versions
+        self.assertTrue(np.allclose(f, [truth.f for truth in truths], equal_nan=True))
+        self.assertTrue(np.allclose(c, [truth.c for truth in truths]))
+
+    def assert_budgets(self, budgets, p, d, q):
+        self.assertTrue(np.allclose(p, [budget.priority for budget in budgets]))
+        self.assertTrue(np.allclose(d, [budget.durability for budget in budgets]))
+        self.assertTrue(np.allclose(q, [budget.quality for budget in budgets]))
+
+    def test_extended_boolean(self):
+        x, y, z = self.f1, self.f2, self.c1
+        self.assertTrue(np.allclose(And_array(x, y, z), [And(*v) for v in zip(x, y, z)]))
+        self.assertTrue(np.allclose(Or_array(x, y, z), [Or(*v) for v in zip(x, y, z)]))
+        self.assertTrue(np.allclose(Average_array(x, y), [Average(*v) for v in zip(x, y)]))
+        self.assertTrue(np.allclose(Scalar_array(x), [Scalar(v) for v in x]))
+        self.assertTrue(np.allclose(And_array(x, 0.5), x*0.5))
+
+    def test_uncertainty_mapping(self):
+        truths = [truth for truth, _ in self.truths()]
+        w_plus, w_minus = w_from_truth_array(self.f1, self.c1, self.k)
+        w = [w_from_truth(truth) for truth in truths]
+        self.assertTrue(np.allclose(w_plus, [w_plus for w_plus, _ in w]))
+        self.assertTrue(np.allclose(w_minus, [w_minus for _, w_minus in w]))
+        self.assert_truths([truth_from_w(*w, self.k) for w in zip(w_plus, w_plus+w_minus)], *truth_from_w_array(w_plus, w_plus+w_minus, self.k))
+        f, c = truth_from_w_array(np.zeros(3), np.zeros(3), self.k)
+        self.assertEqual(f.tolist(), [0.5]*3)
+        self.assertEqual(c.tolist(), [0.0]*3)
+
+    def test_truth_two_premises(self):
+        pairs = self.truths()
+        functions = (
+            (Truth_revision, Truth_revision_array),
+            (Truth_deduction, Truth_deduction_array),
+            (Truth_analogy, Truth_analogy_array),
+            (Truth_resemblance, Truth_resemblance_array),
+            (Truth_abduction, Truth_abduction_array),
+            (Truth_induction, Truth_induction_array),
+            (Truth_exemplification, Truth_exemplification_array),
+            (Truth_comparison, Truth_comparison_array),
+            (Truth_intersection, Truth_intersection_array),
+            (Truth_union, Truth_union_array),
+            (Truth_difference, Truth_difference_array),
+            (Truth_deconjuntion, Truth_deconjuntion_array),
+            (Truth_dedisjunction, Truth_dedisjunction_array),
+            (Desire_strong, Desire_strong_array),
+            (Desire_weak, Desire_weak_array),
+            (Desire_deduction, Desire_deduction_array),
+            (Desire_induction, Desire_induction_array),
+        )
+        for function, function_array in functions:
+            with self.subTest(function.__name__ if function.__name__ != '<lambda>' else function_array.__name__):
+                self.assert_truths([function(truth1, truth2) for truth1, truth2 in pairs], *function_array(self.f1, self.c1, self.f2, self.c2, self.k))
+
+    def test_truth_single_premise(self):
+        truths = [truth for truth, _ in self.truths()]
+        for function, function_array in ((Truth_negation, Truth_negation_array), (Truth_conversion, Truth_conversion_array), (Truth_contraposition, Truth_contraposition_array)):
+            with self.subTest(function.__name__):
+                self.assert_truths([function(truth) for truth in truths], *function_array(self.f1, self.c1, self.k))
+        self.assertTrue(np.allclose(Truth_expectation_array(self.f1, self.c1), [truth.e for truth in truths]))
+        self.assertTrue(np.allclose(truth_to_quality_array(self.f1, self.c1), [truth_to_quality(truth) for truth in truths]))
+
+    def test_budget_inference(self):
+        pairs = self.truths()
+        budgets_tasklink = [Budget(p, d, 0.5) for p, d in zip(self.p1, self.d1)]
+        budgets_termlink = [Budget(p, d, 0.5) for p, d in zip(self.p2, self.d2)]
+        class _Content:
+            def __init__(self, complexity): self.complexity = complexity
+        contents = [_Content(complexity) for complexity in self.complexity]
+
+        for function, function_array in ((Budget_forward, Budget_forward_array), (Budget_backward, Budget_backward_array), (Budget_backward_weak, Budget_backward_weak_array)):
+            with self.subTest(function.__name__):
+                self.assert_budgets([function(truth, budget) for (truth, _), budget in zip(pairs, budgets_tasklink)], *function_array(self.f1, self.c1, self.p1, self.d1))
+                self.assert_budgets([function(truth, budget1, budget2) for (truth, _), budget1, budget2 in zip(pairs, budgets_tasklink, budgets_termlink)], *function_array(self.f1, self.c1, self.p1, self.d1, self.p2, self.d2))
+
+        self.assert_budgets([Budget_forward_compound(content, truth, budget1, budget2) for content, (truth, _), budget1, budget2 in zip(contents, pairs, budgets_tasklink, budgets_termlink)],
+                            *Budget_forward_compound_array(self.complexity, self.f1, self.c1, self.p1, self.d1, self.p2, self.d2))
+        self.assert_budgets([Budget_backward_compound(content, budget1, budget2) for content, budget1, budget2 in zip(contents, budgets_tasklink, budgets_termlink)],
+                            *Budget_backward_compound_array(self.complexity, self.p1, self.d1, self.p2, self.d2))
+        self.assert_budgets([Budget_backward_weak_compound(content, budget1) for content, budget1 in zip(contents, budgets_tasklink)],
+                            *Budget_backward_weak_compound_array(self.complexity, self.p1, self.d1))
+
+    def test_budget_revision(self):
+        pairs = self.truths()
+        truths_derived = [Truth_revision(truth1, truth2) for truth1, truth2 in pairs]
+        f_derived, c_derived = Truth_revision_array(self.f1, self.c1, self.f2, self.c2, self.k)
+        p1, d1, p2, d2 = self.p1.copy(), self.d1.copy(), self.p2.copy(), self.d2.copy()
+        results = [
+            Budget_revision(Budget(p, d, 0.5), truth1, truth2, truth_derived, Budget(0.5, 0.5, 0.5), Budget(p_termlink, d_termlink, 0.5))
+            for p, d, p_termlink, d_termlink, (truth1, truth2), truth_derived in zip(self.p1, self.d1, self.p2, self.d2, pairs, truths_derived)
+        ]
+        budget, budget_task, budget_tasklink, budget_termlink = Budget_revision_array(self.p1, self.d1, self.f1, self.c1, self.f2, self.c2, f_derived, c_derived, self.p2, self.d2)
+        self.assert_budgets([result[0] for result in results], *budget)
+        self.assert_budgets([result[1] for result in results], *budget_task, [0.5]*len(results))
+        self.assert_budgets([result[2] for result in results], *budget_tasklink, [0.5]*len(results))
+        self.assert_budgets([result[3] for result in results], *budget_termlink, [0.5]*len(results))
+        # the arrays given are not modified
+        for array, array_copied in zip((self.p1, self.d1, self.p2, self.d2), (p1, d1, p2, d2)):
+            self.assertTrue(np.array_equal(array, array_copied))
+        self.assertIsNone(Budget_revision_array(self.p1, self.d1, self.f1, self.c1, self.f2, self.c2, f_derived, c_derived)[3])
+
+    def test_budget_bag(self):
+        budgets = [Budget(p, d, q) for p, d, q in zip(self.p1, self.d1, self.q1)]
+        self.assertTrue(np.allclose(Budget_decay_array(self.p1, self.d1, self.q1), [Budget_decay(budget, replace=False).priority for budget in budgets]))
+        self.assertTrue(np.allclose(Budget_forget_array(self.p1, self.d1, self.q1, self.n_cycles), [Budget_forget(budget, n, replace=False).priority for budget, n in zip(budgets, self.n_cycles)]))
+        self.assertTrue(np.allclose(Budget_summary_array(self.p1, self.d1, self.q1), [budget.summary for budget in budgets]))
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_Functions
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
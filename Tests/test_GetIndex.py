@@ -76,6 +76,21 @@ class TEST_Get_Index(unittest.TestCase):
         self.assertEqual(len(indexes), 1)
         self.assertEqual(indexes[0], [])
         pass
+
+    def test_get_index_6(self):
+        '''The indices of a term not within the compound are `None`, and those of each component, as used by `Concept` to build links, are neither `None` nor `[[]]`.'''
+        term_compound = Narsese.parser.parse("<(&&, <$x-->A>, <$x-->B>) ==> <(*, $x, C)-->D>>.").term
+        self.assertIsNone(Link.get_index(term_compound, Term("E")))
+        self.assertIsNone(Link.get_index(Term("A"), term_compound))
+        for term in term_compound.components:
+            indexes = Link.get_index(term_compound, term)
+            self.assertIsNotNone(indexes)
+            self.assertGreater(len(indexes), 0)
+            self.assertNotIn([], indexes)
+            for index in indexes:
+                self.assertEqual(term_compound[index], term)
+        pass
+
 if __name__ == '__main__':
 
     test_classes_to_run = [
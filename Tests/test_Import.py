@@ -0,0 +1,65 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import Dict
+
+
+def import_time(module: str) -> Dict[str, int]:
+    '''
+    import the module in a fresh process, and get the cumulative import time (in microseconds) of each module loaded, by `python -X importtime`. The total time is keyed by `''`.
+    '''
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}, cwd=Path(__file__).parent.parent).stderr
+    times = {'': 0}
+    for line in output.splitlines():
+        match = re.match(r'import time:\s*(\d+) \|\s*(\d+) \| (\s*)(\S+)', line)
+        if match is None: continue
+        times[match.group(4)] = int(match.group(2))
+        if len(match.group(3)) == 0: times[''] += int(match.group(2)) # a top-level import
+    return times
+
+
+class TEST_Import(unittest.TestCase):
+
+    budget = float(os.environ.get('PYNARS_IMPORT_BUDGET', 0)) # seconds, for importing the core reasoner; the wall-clock time depends on the machine, so it is checked only if set
+    modules_heavy = ('matplotlib', 'networkx', 'PySide2', 'sparse_lut', 'concurrent.futures.process')
+
+    def test_lazy_dependencies(self):
+        '''
+        the heavy modules are not loaded by importing the core reasoner, but on their first use.
+        '''
+        times = import_time('pynars.NARS')
+        self.assertIn('pynars.NARS', times)
+        for module in self.modules_heavy:
+            self.assertNotIn(module, times)
+
+    @unittest.skipUnless(budget > 0, 'set the environment variable `PYNARS_IMPORT_BUDGET` (in seconds) to benchmark the import time')
+    def test_budget(self):
+        '''
+        the time of importing the core reasoner is within the budget. The modules taking the longest are reported otherwise.
+        '''
+        times = import_time('pynars.NARS')
+        total = times.pop('') / 1e6
+        top = '\n'.join(f'{t/1e3:10.1f}ms  {module}' for module, t in sorted(times.items(), key=lambda item: -item[1])[:20])
+        self.assertLess(total, self.budget, f'importing `pynars.NARS` takes {total:.3f}s:\n{top}')
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_Import
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -11,6 +11,11 @@ import Narsese
 
 class TEST_InferenceEngine(unittest.TestCase):
 
+    def setUp(self):
+        # the engine of `utils_for_test` may be replaced by the other tests
+        import Tests.utils_for_test as utils_for_test
+        utils_for_test.engine = utils_for_test.nars.inference
+
     def test_validation(self):
         ''''''
         engine = GeneralEngine()
@@ -39,7 +44,233 @@ class TEST_InferenceEngine(unittest.TestCase):
         
         pass
 
-        
+    def test_rule_cache(self):
+        '''
+        the matched rules are cached by the signature of the premises, and they are the same as those matched without the cache.
+        '''
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        engine = nars.inference
+        GeneralEngine.rule_cache.clear()
+        rules, task, belief, concept, task_link, term_link, *_ = rule_map_two_premises('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%', 'bird.')
+        self.assertGreater(len(rules), 0)
+        self.assertEqual(GeneralEngine.rule_cache.misses, 1)
+        self.assertEqual(GeneralEngine.rule_cache.hits, 0)
+
+        self.assertIs(engine.match_rule(task, belief, belief.term, task_link, term_link), rules)
+        self.assertEqual(GeneralEngine.rule_cache.hits, 1)
+        self.assertEqual(GeneralEngine._match_rule(task, belief, belief.term, task_link, term_link), rules)
+
+        # a question of the same terms is of another signature
+        rule_map_two_premises('<bird-->animal>?', '<robin-->bird>. %1.0;0.9%', 'bird.')
+        self.assertEqual(GeneralEngine.rule_cache.misses, 2)
+        pass
+
+    def test_rule_cache_recycled(self):
+        '''
+        the rules cached for the IDs of the terms released are purged once the IDs are recycled.
+        '''
+        from pynars.NARS.RuleMap import RuleCache
+        from pynars.Narsese import Term, term_table
+        rule_cache = RuleCache(100)
+        term = Term('robin')
+        rule_cache.put((hash(term), None), 'kept')
+        id_released = hash(Term('robin_released'))
+        rule_cache.put((id_released, None), 'purged')
+        generation, i = term_table.generation, 0
+        while term_table.generation == generation:
+            hash(Term(f'robin_{i}'))
+            i += 1
+        self.assertIn(id_released, term_table.ids_recycled)
+        self.assertIsNone(rule_cache.get((id_released, None)))
+        self.assertEqual(rule_cache.get((hash(term), None)), 'kept')
+        self.assertEqual(len(rule_cache), 1)
+        pass
+
+    def test_rule_profiler(self):
+        '''
+        the calls and the derivations of each rule are counted, and in the sampling mode, only one in every `sampling` runs is profiled.
+        '''
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        engine = nars.inference
+        from pynars.NARS.RuleMap import RuleProfiler
+        rules, task, belief, concept, task_link, term_link, *_ = rule_map_two_premises('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%', 'bird.')
+        self.assertGreater(len(rules), 0)
+        try:
+            GeneralEngine.rule_profiler = RuleProfiler()
+            tasks1 = engine.inference(task, belief, belief.term, task_link, term_link, rules)
+            GeneralEngine.rule_profiler = None
+            tasks2 = engine.inference(task, belief, belief.term, task_link, term_link, rules)
+            self.assertEqual([task.term for task in tasks1], [task.term for task in tasks2])
+
+            profiler = GeneralEngine.rule_profiler = RuleProfiler(sampling=2)
+            for _ in range(4): engine.inference(task, belief, belief.term, task_link, term_link, rules)
+            self.assertEqual(profiler.info(), dict(runs=4, profiled=2, sampling=2, rules=len(rules)))
+            report = profiler.report('calls')
+            self.assertEqual(len(report), len(rules))
+            for row in report:
+                self.assertEqual(row['calls'], 4)
+                self.assertEqual(row['derived'], 4)
+                self.assertLessEqual(row['accepted'], row['derived'])
+                self.assertGreater(row['time'], 0)
+            self.assertEqual(len(profiler.format(top=1).splitlines()), 2)
+            profiler.clear()
+            self.assertEqual(len(profiler), 0)
+        finally:
+            GeneralEngine.rule_profiler = None
+
+    def test_step_premise_selection(self):
+        '''
+        the term-links are not taken out of the bag in a step, and only those fired are updated.
+        '''
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        from pynars.Config import Config
+        engine = nars.inference
+        *_, concept, task_link, term_link, _, _ = rule_map_two_premises('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%', 'bird.')
+        concept.task_links.put_back(task_link)
+        concept.term_links.put_back(term_link)
+        for line in ('<bird-->[flying]>. %1.0;0.9%', '<swan-->bird>. %0.9;0.9%', '<bird-->(&, animal, [flying])>. %1.0;0.9%'):
+            nars.memory.accept(Narsese.parse(line))
+        n_term_links_fired = Config.n_term_links_fired
+        try:
+            for n in (1, 2):
+                Config.n_term_links_fired = n
+                term_links = list(concept.term_links)
+                priorities = [term_link.budget.priority for term_link in term_links]
+                tasks_derived, _ = engine.step(concept)
+                self.assertGreater(len(tasks_derived), 0)
+                self.assertEqual(list(concept.term_links), term_links)
+                self.assertEqual(len(concept.term_links), concept.term_links.count())
+                n_changed = sum(term_link.budget.priority != priority for term_link, priority in zip(term_links, priorities))
+                self.assertGreater(n_changed, 0)
+                self.assertLessEqual(n_changed, n)
+        finally:
+            Config.n_term_links_fired = n_term_links_fired
+
+    def test_batch_inference(self):
+        '''
+        the premises surviving the budget threshold, evaluated as arrays, are the same as those from which the tasks derived are above the threshold, and the batched step derives only the tasks above the threshold.
+        '''
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        from pynars.Config import Config
+        from pynars.NARS.InferenceEngine.GeneralEngine.vectorized_rules import survive, rules_vectorized
+        engine = nars.inference
+        pairs = (
+            ('<bird-->animal>. %{};{}%', '<robin-->bird>. %{};{}%', 'bird.'),
+            ('<robin-->bird>. %{};{}%', '<bird-->animal>. %{};{}%', 'bird.'),
+            ('<bird-->animal>. %{};{}%', '<bird-->[flying]>. %{};{}%', 'bird.'),
+            ('<robin-->animal>. %{};{}%', '<swan-->animal>. %{};{}%', 'animal.'),
+        )
+        truths = ((1.0, 0.9), (0.6, 0.9), (0.3, 0.4), (0.9, 0.2), (0.1, 0.8))
+        firings = []
+        for line1, line2, line3 in pairs:
+            for (f1, c1), (f2, c2) in zip(truths, truths[1:]+truths[:1]):
+                rules, task, belief, concept, task_link, term_link, *_ = rule_map_two_premises(line1.format(f1, c1), line2.format(f2, c2), line3)
+                firings.append((rules, (task, belief, task_link, term_link)))
+        budget_thresh = Config.budget_thresh
+        try:
+            n_vectorized = 0
+            for Config.budget_thresh in (0.01, 0.2, 0.3, 0.5):
+                for rules, premise in firings:
+                    for rule in rules:
+                        if rule not in rules_vectorized: continue
+                        n_vectorized += 1
+                        task = rule(*premise)
+                        survived, qualities = survive(rule, [premise])
+                        self.assertEqual(survived, [task.budget.is_above_thresh], rule.__qualname__)
+                        self.assertAlmostEqual(qualities[0], task.budget.quality)
+            self.assertGreater(n_vectorized, 0)
+
+            Config.budget_thresh = 0.3
+            tasks_each, _ = engine.inference_batch([(task, belief, belief.term, task_link, term_link, rules) for rules, (task, belief, task_link, term_link) in firings])
+            self.assertEqual(len(tasks_each), len(firings))
+            for tasks, (rules, (task, belief, task_link, term_link)) in zip(tasks_each, firings):
+                tasks_expected = [task for task in engine.inference(task, belief, belief.term, task_link, term_link, rules) if task is not None and task.budget.is_above_thresh]
+                self.assertEqual(sorted(str(task) for task in tasks), sorted(str(task) for task in tasks_expected))
+        finally:
+            Config.budget_thresh = budget_thresh
+
+    def test_step_batch(self):
+        '''
+        the premises of several concepts are fired together in a batched step.
+        '''
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        engine = nars.inference
+        concepts = []
+        for line1, line2, line3 in (('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%', 'bird.'), ('<swan-->bird>. %1.0;0.9%', '<bird-->[flying]>. %1.0;0.9%', 'bird.')):
+            *_, concept, task_link, term_link, _, _ = rule_map_two_premises(line1, line2, line3)
+            concept.task_links.put_back(task_link)
+            concept.term_links.put_back(term_link)
+            concepts.append(concept)
+        n_task_links = [len(concept.task_links) for concept in concepts]
+        tasks_derived = engine.step_batch(concepts)
+        self.assertGreater(len(tasks_derived), 0)
+        self.assertTrue(all(task.budget.is_above_thresh for task in tasks_derived))
+        self.assertEqual([len(concept.task_links) for concept in concepts], n_task_links)
+
+    def test_step_batch_term_links(self):
+        '''
+        the term-links fired in a batched step are updated as in a step, including by the tasks below the threshold, which are not derived.
+        '''
+        import random
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        from pynars.Config import Config
+        engine = nars.inference
+        budget_thresh = Config.budget_thresh
+        try:
+            for thresh in (0.01, 0.3, 0.5, 0.9):
+                budgets = []
+                for step in (lambda concept: engine.step(concept)[0], lambda concept: engine.step_batch([concept])):
+                    Config.budget_thresh = budget_thresh
+                    *_, concept, task_link, term_link, _, _ = rule_map_two_premises('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%', 'bird.')
+                    concept.task_links.put_back(task_link)
+                    concept.term_links.put_back(term_link)
+                    random.seed(0)
+                    Config.budget_thresh = thresh
+                    step(concept)
+                    budgets.append([(term_link.budget.priority, term_link.budget.durability) for term_link in concept.term_links])
+                for budget_step, budget_batch in zip(*budgets):
+                    self.assertAlmostEqual(budget_step[0], budget_batch[0])
+                    self.assertAlmostEqual(budget_step[1], budget_batch[1])
+        finally:
+            Config.budget_thresh = budget_thresh
+
+    def test_step_batch_profiled(self):
+        '''
+        the rules called in a batched step are profiled.
+        '''
+        from Tests.utils_for_test import rule_map_two_premises, nars
+        from pynars.NARS.RuleMap import RuleProfiler
+        engine = nars.inference
+        rules, task, belief, concept, task_link, term_link, *_ = rule_map_two_premises('<bird-->animal>. %1.0;0.9%', '<robin-->bird>. %1.0;0.9%', 'bird.')
+        try:
+            profiler = GeneralEngine.rule_profiler = RuleProfiler()
+            tasks_each, _ = engine.inference_batch([(task, belief, belief.term, task_link, term_link, rules)])
+            self.assertEqual(len(profiler), len(rules))
+            self.assertEqual(sum(row['accepted'] for row in profiler.report()), len(tasks_each[0]))
+        finally:
+            GeneralEngine.rule_profiler = None
+
+    def test_cycle_batch_execute(self):
+        '''
+        an executable goal is executed in a cycle where the concepts are fired in a batch.
+        '''
+        from pynars.Config import Config
+        from pynars.NARS import Reasoner
+        n_concepts_batched = Config.n_concepts_batched
+        try:
+            nars = Reasoner(100, 100)
+            Config.n_concepts_batched = 4
+            executed = []
+            nars.register_operation('left', lambda arguments, task, memory: executed.append(task))
+            nars.input_narsese('<robin-->bird>.', go_cycle=False)
+            nars.input_narsese('<(*, {SELF}) --> ^left>! :|:', go_cycle=False)
+            nars.cycles(10)
+            self.assertGreater(len(executed), 0)
+            self.assertEqual(executed[0].term, Narsese.parse('<(*, {SELF}) --> ^left>! :|:').term)
+        finally:
+            Config.n_concepts_batched = n_concepts_batched
+
+
 
 if __name__ == '__main__':
 
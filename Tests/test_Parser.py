@@ -284,6 +284,73 @@ class TEST_Parser(unittest.TestCase):
         content = Narsese.parser.parse(line).sentence
         pass
 
+    def test_parse_lines(self):
+        '''
+        the lines are parsed in bulk, in order, from a gzipped file, with the repeated lines parsed only once, and each task stamped as a new input.
+        '''
+        import gzip, tempfile, os
+        from pynars.Narsese.Parser import parser
+        lines = ['// comment', '<robin-->bird>. %0.9;0.8%', '10', '<robin-->bird>. %0.9;0.8%', '<robin-->[flying]>? :|:', '<robin-->', '(&&, <$x-->bird>, <$x-->animal>)!']
+        with tempfile.TemporaryDirectory() as dirname:
+            path = os.path.join(dirname, 'input.nal.gz')
+            with gzip.open(path, 'wt') as f: f.write('\n'.join(lines))
+            for workers in (1, 2):
+                parser.parse_cache._tasks.clear()
+                results = [(line, task) for lines_batch, tasks in parser.parse_lines(parser.read_lines(path), workers, batch_size=2) for line, task in zip(lines_batch, tasks)]
+                self.assertEqual([line for line, _ in results], [lines[1], lines[3], lines[4], lines[5], lines[6]])
+                (_, task1), (_, task2), (_, task3), (_, task4), (_, task5) = results
+                self.assertIsNone(task4)
+                self.assertEqual(task1.term, Narsese.parse(lines[1]).term)
+                self.assertEqual(hash(task1.term), hash(Narsese.parse(lines[1]).term))
+                self.assertIsNot(task1, task2)
+                self.assertEqual(task2.truth.f, 0.9)
+                self.assertEqual(task2.truth.c, 0.8)
+                self.assertNotEqual(tuple(task1.stamp.evidential_base), tuple(task2.stamp.evidential_base))
+                self.assertTrue(task3.is_question)
+                self.assertEqual(task3.sentence.tense, Tense.Present)
+                self.assertTrue(task5.is_goal)
+                self.assertEqual(task5.term, Narsese.parse('(&&, <$y-->bird>, <$y-->animal>)!').term)
+
+    def test_ingest(self):
+        '''
+        the tasks ingested are counted only if they are accepted by the Narsese channel, and none is dropped if the reasoner cycles.
+        '''
+        from pynars.NARS import Reasoner
+        lines = [f'<robin_{i}-->bird>.' for i in range(300)] + ['<robin-->']
+        nars = Reasoner(100, 100)
+        self.assertEqual(nars.ingest(lines, go_cycle=False), 100)
+        self.assertEqual(len(nars.narsese_channel), 100)
+        nars.reset()
+        self.assertEqual(nars.ingest(lines, batch_size=64), 300)
+        self.assertEqual(len(nars.narsese_channel), 0)
+        pass
+
+    def test_simple_parser(self):
+        '''
+        the common form of Narsese is parsed without Lark, and the result is the same as that by Lark.
+        '''
+        from pynars import Global
+        parser = Narsese.parser
+        lines = [
+            '<robin-->bird>.', '<robin --> bird>. %0.9;0.8%', '$0.8;0.5;0.7$ <robin<->bird>? :|:', '$.8$<A ==> B>! :/: %1;.9;2%', 
+            '<A =/> B>@ :\\:', '< 会飞 --> B >. :!-3: % 0 ; 0.9 %', '<1 </> 2>.'
+        ]
+        for line in lines:
+            input_id = Global._input_id
+            task1 = parser._parser_simple.parse(line)
+            Global._input_id = input_id
+            task2 = parser._parser.parse(line)
+            self.assertIsNotNone(task1)
+            self.assertEqual(task1.term, task2.term)
+            self.assertEqual(task1.sentence.repr(), task2.sentence.repr())
+            self.assertEqual(tuple(task1.budget), tuple(task2.budget))
+            self.assertEqual(task1.stamp.t_occurrence, task2.stamp.t_occurrence)
+            self.assertEqual(tuple(task1.stamp.evidential_base), tuple(task2.stamp.evidential_base))
+        
+        # the other forms are left to Lark
+        for line in ['<{robin}-->bird>.', '<robin{--bird>.', '<$x-->bird>.', '<robin-->bird>? %1.0;0.9%', '<"robin"-->bird>.', '(robin-->bird).', '<robin-->bird>']:
+            self.assertIsNone(parser._parser_simple.parse(line))
+
     # def test_list(self):
     #     line = '(#,a,b,c,d).'
     #     content = Narsese.parser.parse(line).sentence
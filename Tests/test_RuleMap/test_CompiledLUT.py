@@ -0,0 +1,87 @@
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+
+from sparse_lut import SparseLUT, Any
+
+from pynars.Config import Config
+from pynars.NAL.Inference import LocalRules, SyllogisticRules
+from pynars.NARS.InferenceEngine import TemporalEngine
+from pynars.NARS.RuleMap import CompiledLUT
+
+
+class TEST_CompiledLUT(unittest.TestCase):
+
+    def test_lookup(self):
+        '''
+        the compiled map retrieves the same rules as the `SparseLUT`, for any indices.
+        '''
+        shape = (3, 4, 3, 2)
+        lut = SparseLUT(shape)
+        lut.add([0, Any, Any, 1], SyllogisticRules.deduction)
+        lut.add([Any, 1, 2, Any], SyllogisticRules.induction)
+        lut.add([Any, 1, 2, Any], LocalRules.revision)
+        lut.add([2, [0, 3], 0, 0], SyllogisticRules.abduction)
+        lut.build()
+
+        with tempfile.TemporaryDirectory() as root:
+            CompiledLUT.compile(lut, Path(root)/'LUT.rulemap')
+            compiled = CompiledLUT(Path(root)/'LUT.rulemap')
+            self.assertEqual(len(compiled), len(lut))
+            for indices in itertools.product(*[[None, *range(n), n] for n in shape]):
+                rules1, rules2 = lut[indices], compiled[indices]
+                if rules1 is None: self.assertIsNone(rules2, indices)
+                else: self.assertEqual(list(rules1), list(rules2), indices)
+            self.assertIs(compiled[0, 0, 0, 1], compiled[0, 3, 1, 1])
+            self.assertIsNotNone(compiled[0, 2])
+            self.assertIsNone(compiled[1, 0])
+            compiled.close()
+
+    def test_cache(self):
+        '''
+        the rule-map is compiled into the cache directory once, and then loaded by the content hash of the rules.
+        '''
+        cache_dir = Config.cache_dir
+        try:
+            with tempfile.TemporaryDirectory() as root:
+                Config.cache_dir = root
+                engine = TemporalEngine()
+                rule_map = engine.rule_map
+                self.assertIsInstance(rule_map.map, CompiledLUT)
+                file_paths = list(Path(root).glob('*.rulemap'))
+                self.assertEqual(file_paths, [rule_map.map.file_path])
+                self.assertIn(rule_map.digest(*sorted({1,2,3,4,5,6,7,8,9})), file_paths[0].name)
+                rules = [(indices, list(rule_map[indices])) for indices in itertools.product(*[range(n) for n in rule_map.shape]) if rule_map[indices] is not None]
+                self.assertGreater(len(rules), 0)
+
+                mtime = file_paths[0].stat().st_mtime_ns
+                self.assertTrue(rule_map.open(*sorted({1,2,3,4,5,6,7,8,9})))
+                self.assertIsNot(engine.rule_map.map, None)
+                self.assertEqual(file_paths[0].stat().st_mtime_ns, mtime)
+                for indices, rules_ in rules:
+                    self.assertEqual(list(rule_map[indices]), rules_)
+                self.assertNotEqual(rule_map.digest(7), rule_map.digest(1, 7))
+                rule_map.map.close()
+        finally:
+            Config.cache_dir = cache_dir
+            TemporalEngine()
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_CompiledLUT
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
@@ -37,6 +37,76 @@ class TEST_Table(unittest.TestCase):
         self.assertEqual(table.last(), task1)
         pass
 
+    def test_order_and_capacity(self):
+        '''the tasks are in descending order of priority, and the one with the lowest priority is dropped when the table is full'''
+        table = Table(3)
+        tasks = [Narsese.parser.parse(f'<robin_{i}-->bird>. %0.9;{c}%') for i, c in enumerate((0.5, 0.7, 0.6, 0.7, 0.4))]
+        for task in tasks:
+            table.add(task, task.truth.c)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.values(), (tasks[1], tasks[3], tasks[2]))
+        self.assertEqual(table.keys(), (0.7, 0.7, 0.6))
+        self.assertIn(tasks[2], table)
+        self.assertNotIn(tasks[0], table)
+        self.assertNotIn(tasks[4], table)
+
+        # a duplicate task replaces the old one
+        task = Narsese.parser.parse('<robin_2-->bird>. %0.9;0.8%')
+        table.add(task, task.truth.c)
+        self.assertEqual(len(table), 3)
+        self.assertIs(table.first(), task)
+        self.assertIs(table.last(), tasks[3])
+        pass
+
+    def test_best_match(self):
+        '''`best_match` is the same as taking the maximum of `calculate_solution_quality` over the table'''
+        from pynars import Global
+        from pynars.NAL.Functions.Tools import calculate_solution_quality
+        time = Global.time
+        Global.time = 20
+        table = Table(100)
+        lines = [
+            '<robin_0-->bird>. %0.9;0.5%',
+            '<robin_1-->bird>. %0.2;0.6%',
+            '<robin_2-->bird>. :|: %0.9;0.95%',
+            '<robin_3-->bird>. :/: %0.8;0.9%',
+            '<robin_4-->bird>. :\\: %0.7;0.85%',
+            '<(&&, <robin_5-->bird>, <robin_6-->bird>)-->bird>. %0.6;0.55%',
+        ]
+        for line in lines:
+            task = Narsese.parser.parse(line)
+            table.add(task, task.truth.c)
+        for line in ('<robin_0-->bird>?', '<robin_0-->bird>. %0.9;0.5%', '<robin_0-->bird>? :|:', '<robin_0-->bird>? :/:'):
+            sentence = Narsese.parser.parse(line).sentence
+            for rate_by_confidence in (True, False):
+                _, task = max(((calculate_solution_quality(sentence, task.sentence, rate_by_confidence), task) for task in table), key=lambda quality: quality[0])
+                self.assertIs(table.best_match(sentence, rate_by_confidence), task)
+        self.assertIsNone(Table(100).best_match(sentence))
+        Global.time = time
+        pass
+
+    def test_update(self):
+        '''the order and `best_match` follow a confidence changed in place by the mental operation `doubt`'''
+        from pynars.Config import Config
+        from pynars.NAL.MentalOperation._execute import doubt
+        rate_discount_c = Config.rate_discount_c
+        try:
+            Config.rate_discount_c = 0.5
+            table = Table(100)
+            task1 = Narsese.parser.parse('<robin-->bird>. %0.9;0.9%')
+            task2 = Narsese.parser.parse('<swan-->bird>. %0.9;0.6%')
+            for task in (task1, task2):
+                table.add(task, task.truth.c)
+            sentence = Narsese.parser.parse('<robin-->bird>?').sentence
+            self.assertIs(table.best_match(sentence), task1)
+            doubt([task1], table)
+            self.assertAlmostEqual(task1.truth.c, 0.45)
+            self.assertEqual(list(table), [task2, task1])
+            self.assertIs(table.best_match(sentence), task2)
+            self.assertEqual(len(table), 2)
+        finally:
+            Config.rate_discount_c = rate_discount_c
+
         
 
 if __name__ == '__main__':
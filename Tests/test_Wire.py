@@ -0,0 +1,128 @@
+import unittest
+
+from pynars import Narsese
+from pynars.Narsese import Compound, Connector, Term, Terms, Statement, Task, Judgement
+from pynars.Narsese import WireEncoder, WireDecoder, encode_tasks, decode_tasks
+
+
+class TEST_Wire(unittest.TestCase):
+
+    def assertSameTask(self, task1: Task, task2: Task):
+        self.assertEqual(type(task1.sentence), type(task2.sentence))
+        self.assertEqual(task1.term, task2.term)
+        self.assertEqual(task1.term.hash64, task2.term.hash64)
+        self.assertEqual(str(task1.term), str(task2.term))
+        self.assertEqual(tuple(task1.budget), tuple(task2.budget))
+        self.assertEqual(tuple(task1.truth) if task1.truth is not None else None, tuple(task2.truth) if task2.truth is not None else None)
+        stamp1, stamp2 = task1.stamp, task2.stamp
+        self.assertEqual((stamp1.t_creation, stamp1.t_occurrence, stamp1.t_put, stamp1.is_external), (stamp2.t_creation, stamp2.t_occurrence, stamp2.t_put, stamp2.is_external))
+        if stamp1.evidential_base is None: self.assertIsNone(stamp2.evidential_base)
+        else: self.assertEqual(list(stamp1.evidential_base), list(stamp2.evidential_base))
+        self.assertEqual(task1.input_id, task2.input_id)
+
+    def test_round_trip(self):
+        '''
+        the tasks are the same after being encoded and decoded, including the variables, intervals, operations, tenses and the stamps.
+        '''
+        lines = [
+            '$0.8;0.5;0.9$ <robin-->bird>. %0.9;0.8%',
+            '<robin-->[flying]>? :|:',
+            '<(&&, <$x-->bird>, <#y-->animal>) ==> <$x-->?z>>@',
+            '(&/, <a-->b>, +5, <(*, {SELF}, x)-->^left>)! :/: %1.0;0.6%',
+            '<{tim}-->(/, livingIn, _, {graz})>.',
+            '(--, <(|, boy, girl)-->[strong]>). :\\:',
+        ]
+        tasks = [Narsese.parse(line) for line in lines]
+        for task in tasks:
+            task2, = decode_tasks(encode_tasks([task]))
+            self.assertSameTask(task, task2)
+        for task1, task2 in zip(tasks, decode_tasks(encode_tasks(tasks))):
+            self.assertSameTask(task1, task2)
+
+    def test_derived_compounds(self):
+        '''
+        a compound is decoded as it was, without being processed again.
+        '''
+        def compound(connector: Connector, *terms: Term):
+            compound = Compound.__new__(Compound)
+            compound._is_commutative = connector.is_commutative
+            compound._init_terms(connector, Terms.build(terms, connector.is_commutative))
+            return compound
+        # `(&, {A}, {B})` would be processed into `{}` by `Compound.__init__`, which cannot construct `{}` either.
+        intersection = compound(Connector.ExtensionalIntersection, Compound.ExtensionalSet(Term("A")), Compound.ExtensionalSet(Term("B")))
+        empty = compound(Connector.ExtensionalSet)
+        for term in (intersection, empty):
+            task = Task(Judgement(Statement.Inheritance(term, Term("C"))))
+            task2, = decode_tasks(encode_tasks([task]))
+            self.assertSameTask(task, task2)
+
+    def test_references(self):
+        '''
+        the common terms are encoded only once in a stream, and the buffer is decoded in place from any offset.
+        '''
+        task = Narsese.parse('<(*, (&, bird, animal), [flying])-->(&, bird, animal)>.')
+        encoder = WireEncoder()
+        encoder.write_task(task)
+        size = len(encoder)
+        encoder.write_task(task)
+        self.assertLess(len(encoder) - size, size)
+
+        buffer = bytearray(b'\x00'*3) + encoder.buffer
+        decoder = WireDecoder(memoryview(buffer)[3:])
+        task1, task2 = decoder.read_tasks()
+        self.assertTrue(decoder.is_end)
+        self.assertSameTask(task, task1)
+        self.assertSameTask(task, task2)
+        self.assertIs(task1.term, task2.term)
+
+    def test_corrupted(self):
+        '''
+        a buffer which is not encoded by `WireEncoder`, of another version, truncated or corrupted, raises `ValueError` rather than any other error.
+        '''
+        import random
+        from struct import pack
+        lines = [
+            '$0.8;0.5;0.9$ <robin-->bird>. %0.9;0.8%',
+            '<(&&, <$x-->bird>, <#y-->animal>) ==> <$x-->?z>>@',
+            '(&/, <a-->b>, +5, <(*, {SELF}, x)-->^left>)! :/: %1.0;0.6%',
+            '<(*, (&, bird, animal), [flying])-->(&, bird, animal)>.',
+        ]
+        tasks = [Narsese.parse(line) for line in lines]
+        buffer = encode_tasks(tasks)
+        self.assertEqual(len(decode_tasks(encode_tasks([]))), 0)
+        with self.assertRaises(ValueError): decode_tasks(b'')
+        with self.assertRaises(ValueError): decode_tasks(b'NARS' + buffer[4:])
+        with self.assertRaises(ValueError): decode_tasks(buffer[:4] + pack('<H', 2) + buffer[6:])
+
+        # a buffer truncated at the end of a task is decoded into the tasks before
+        for n in range(len(buffer)):
+            try: tasks_decoded = decode_tasks(buffer[:n])
+            except ValueError: continue
+            self.assertLess(len(tasks_decoded), len(tasks))
+
+        random.seed(0)
+        for i in range(len(buffer)):
+            for value in (0, 255, buffer[i] ^ 1, random.randrange(256)):
+                corrupted = bytearray(buffer)
+                corrupted[i] = value
+                try: decode_tasks(corrupted)
+                except ValueError: pass
+
+
+if __name__ == '__main__':
+
+    test_classes_to_run = [
+        TEST_Wire
+    ]
+
+    loader = unittest.TestLoader()
+
+    suites = []
+    for test_class in test_classes_to_run:
+        suite = loader.loadTestsFromTestCase(test_class)
+        suites.append(suite)
+
+    suites = unittest.TestSuite(suites)
+
+    runner = unittest.TextTestRunner()
+    results = runner.run(suites)
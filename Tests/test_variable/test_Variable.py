@@ -9,7 +9,7 @@ import Narsese
 from pynars.Narsese import Compound, Connector
 from pynars.NAL.MetaLevelInference.VariableSubstitution import *
 from pynars.Narsese._py.Variable import VarPrefix, Variable
-from pynars.utils.IndexVar import IndexVar
+from pynars.utils.IndexVar import IndexVar, _build
 
 class TEST_Variable(unittest.TestCase):
 
@@ -66,6 +66,31 @@ class TEST_Variable(unittest.TestCase):
         pass
 
 
+    def test_index_var_5(self):
+        '''
+        the layout of the variables is not rebuilt for the terms of the same shape, and the variables of the components are renumbered along with the term.
+        '''
+        term1 = Narsese.parse("<<$y-->C> ==> <<$x-->A> ==> <$y-->B>>>.").term
+        n_misses = _build.cache_info().misses
+        term2 = Narsese.parse("<<$z-->D> ==> <<$w-->E> ==> <$z-->F>>>.").term
+        self.assertEqual(_build.cache_info().misses, n_misses)
+        self.assertEqual(term1._index_var.var_independent, [0, 1, 0])
+        self.assertEqual(term1._index_var.names_var, {'$y': 0, '$x': 1})
+        self.assertEqual(term2._index_var.names_var, {'$z': 0, '$w': 1})
+        # `<<$x-->A> ==> <$y-->B>>` has been renumbered as a component, and so has `<$y-->B>`
+        self.assertEqual(term1.predicate._index_var.var_independent, [1, 0])
+        self.assertEqual(term1.predicate.predicate._index_var.var_independent, [0])
+        self.assertEqual(term1.predicate.subject._index_var.var_independent, [1])
+
+        # the variables of a term built from the components keep their identities
+        term3 = Statement(term1.subject, Copula.Implication, term1.predicate.predicate)
+        self.assertEqual(term3._index_var.var_independent, [0, 0])
+        self.assertEqual(term3, Narsese.parse("<<$x-->C> ==> <$x-->B>>.").term)
+        term4 = Statement(term1.subject, Copula.Implication, term1.predicate.subject)
+        self.assertEqual(term4, Narsese.parse("<<$x-->C> ==> <$y-->A>>.").term)
+        pass
+
+
     def test_unification_0(self):
         ''''''
         stat1: Statement = Narsese.parse("<<$x-->A>==><<$y-->B>==><$x-->C>>>.").term
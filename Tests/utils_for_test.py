@@ -66,6 +66,7 @@ def rule_map_task_only(premise1: str, conecept_term: str, index_concept_task: tu
 
 
 def memory_accept_revision(judgement1: str, judgement2: str):
+    nars.reset()
     task1 = Narsese.parse(judgement1)
     nars.memory.accept(task1)
     task2 = Narsese.parse(judgement2)
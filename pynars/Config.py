@@ -49,14 +49,32 @@ class Config:
     capacity_term_link: int = 100
     capacity_table: int = 100
 
+    # the numbers of the task-links and of the term-links fired for each concept selected in a cycle; the term-links are tried in descending order of their priorities, without being taken out of the bag
+    n_task_links_fired: int = 1
+    n_term_links_fired: int = 1
+    # if n > 0, n concepts are selected in each cycle, and the premises selected from them are fired together by `GeneralEngine.step_batch`, where the budgets of the tasks derived are evaluated as arrays, so that those below the threshold are not derived
+    n_concepts_batched: int = 0
+
+    # whether to select items from a bag exactly in proportion to their priorities, by a sum-tree
+    sum_tree_memory: bool = False
+    sum_tree_task_link: bool = False
+    sum_tree_term_link: bool = False
+    sum_tree_buffer: bool = False
+
+    # whether to store the budgets of the concepts as arrays, so that they are forgotten in a single vectorized pass, see `Bag.forget_all`
+    budget_store_memory: bool = False
+    cycles_forget_all_memory: int = 0  # if n > 0, all the concepts are forgotten by time every n cycles, see `Bag.forget_all`
+
     complexity_unit: float = 1.0  # 1.0 - oo
 
     quality_min: float = 0.3
     cycles_per_duration: int = 5
     n_forget_durations: int = 2
     cycles_forget = cycles_per_duration * n_forget_durations
+    lazy_forget: bool = False  # if True, an item is forgotten by the cycles elapsed since it was last touched, when it is read, rather than each time it is put back
 
     revision_max_occurence_distance: int = 10
+    max_evidence_length: int = 100  # the maximum length of an evidential base, beyond which the oldest evidence is dropped
 
     truth_epsilon = 0.01
     budget_epsilon = 0.0001
@@ -73,6 +91,13 @@ class Config:
     n_sequence_attempts = 10
     n_op_condition_attempts = 10
 
+    # if the capacity is positive, the tasks derived again within the duration (in cycles) from the same evidence are dropped before they are put into the internal experience, see `DerivationFilter`
+    capacity_derivation_filter: int = 0
+    duration_derivation_filter: int = 100
+
+    rule_profiling: int = 0  # if n > 0, the calls, the time and the derivations of each rule are profiled in one of every n inference steps, see `GeneralEngine.rule_profiler`
+    cache_dir: str = None  # the directory of the compiled rule-maps; if None, the environment variable `PYNARS_CACHE_DIR` or `~/.cache/pynars` is used
+
     @classmethod
     def check(cls):
         '''Check if each parameter is valid'''
@@ -106,6 +131,9 @@ def load(file_path: str):
             content = json.load(f)
     except:
         raise f"Error when openning the file `{file_path}`."
+    Config.cache_dir = content.get('PROGRAM', {}).get('CACHE_DIR', Config.cache_dir)
+    Config.rule_profiling = content.get('PROGRAM', {}).get('RULE_PROFILING', Config.rule_profiling)
+
     # set driver mode (py/pyx/cypy/cpp)
     try:
         pass  # TODO
@@ -152,13 +180,31 @@ def load(file_path: str):
             Config.nlevels_term_link = concept.get('NUM_LEVELS_TERMLINK_BAG', Config.nlevels_term_link)
             Config.capacity_term_link = concept.get('CAPACITY_TERMLINK_BAG', Config.capacity_term_link)
             Config.capacity_table = concept.get('CAPACITY_TABLE', Config.capacity_table)
+            Config.n_task_links_fired = concept.get('NUM_TASKLINKS_FIRED', Config.n_task_links_fired)
+            Config.n_term_links_fired = concept.get('NUM_TERMLINKS_FIRED', Config.n_term_links_fired)
+            Config.n_concepts_batched = concept.get('NUM_CONCEPTS_BATCHED', Config.n_concepts_batched)
+
+        bag: dict = defaults.get('BAG', None)
+        if bag is not None:
+            Config.sum_tree_memory = bag.get('SUM_TREE_MEMORY', Config.sum_tree_memory)
+            Config.sum_tree_task_link = bag.get('SUM_TREE_TASKLINK', Config.sum_tree_task_link)
+            Config.sum_tree_term_link = bag.get('SUM_TREE_TERMLINK', Config.sum_tree_term_link)
+            Config.sum_tree_buffer = bag.get('SUM_TREE_BUFFER', Config.sum_tree_buffer)
+            Config.budget_store_memory = bag.get('BUDGET_STORE_MEMORY', Config.budget_store_memory)
+            Config.cycles_forget_all_memory = bag.get('FORGET_ALL_CYCLES_MEMORY', Config.cycles_forget_all_memory)
         Config.complexity_unit = defaults.get('COMPLEXITY_UNIT', Config.complexity_unit)
         Config.quality_min = defaults.get('QUALITY_MIN', Config.quality_min)
         Config.cycles_per_duration = defaults.get('CYCLES_PER_DURATION', Config.cycles_per_duration)
         Config.n_forget_durations = defaults.get('NUM_FORGET_DURATIONS', Config.n_forget_durations)
         Config.cycles_forget = Config.cycles_per_duration * Config.n_forget_durations
+        Config.lazy_forget = defaults.get('LAZY_FORGET', Config.lazy_forget)
+        derivation_filter: dict = defaults.get('DERIVATION_FILTER', None)
+        if derivation_filter is not None:
+            Config.capacity_derivation_filter = derivation_filter.get('CAPACITY', Config.capacity_derivation_filter)
+            Config.duration_derivation_filter = derivation_filter.get('DURATION', Config.duration_derivation_filter)
         Config.revision_max_occurence_distance = defaults.get('REVISION_MAX_OCCURRENCE_DISTANCE',
                                                               Config.revision_max_occurence_distance)
+        Config.max_evidence_length = defaults.get('MAX_EVIDENCE_LENGTH', Config.max_evidence_length)
 
         Config.rate_discount_c = defaults.get('RATE_DISCOUNT_CONFIDENCE', Config.rate_discount_c)
 
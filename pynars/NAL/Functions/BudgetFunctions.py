@@ -2,10 +2,12 @@
 from copy import deepcopy
 from math import log2
 
+import numpy as np
+
 from pynars.Config import Config
 from pynars.Narsese import Budget, Truth, Term
 from .ExtendedBooleanFunctions import *
-from .Tools import truth_to_quality
+from .Tools import truth_to_quality, truth_to_quality_array
 from .UncertaintyMappingFunctions import w_to_c
 
 
@@ -133,6 +135,21 @@ def Budget_decay(budget: Budget, replace = True):
     return budget
 
 
+def Budget_forget(budget: Budget, n_cycles: int, replace = True):
+    """
+    The time-based counterpart of `Budget_decay`, computed in closed form over `n_cycles` elapsed cycles.
+    After `Config.cycles_forget` cycles, the part of the priority above the quality floor becomes `d` times of itself; forgetting over `n1` cycles and then `n2` cycles is the same as forgetting over `n1+n2` cycles.
+    """
+    if not replace: budget = deepcopy(budget)
+    Q = Config.quality_min
+    C = Config.cycles_forget
+    p = budget.priority
+    q = budget.quality * Q
+    d = budget.durability
+    budget.priority = q + (p - q) * pow(d, n_cycles / C)
+    return budget
+
+
 def Budget_merge(budget_base: Budget, budget_merged: Budget, replace = True):
     """
     Ref: The Conceptual Design of OpenNARS 3.1.0
@@ -161,6 +178,134 @@ def Budget_merge(budget_base: Budget, budget_merged: Budget, replace = True):
     return budget_base
 
 
+def Budget_decay_array(priority: np.ndarray, durability: np.ndarray, quality: np.ndarray):
+    """
+    The vectorized version of `Budget_decay`, which decays many budgets, stored as arrays, in a single pass.
+
+    Returns:
+        the decayed priorities.
+    """
+    Q = Config.quality_min
+    C = Config.cycles_forget
+    q = quality * Q
+    return q + (priority - q) * np.power(durability, 1.0 / (priority * C + 1e-3))
+
+
+def Budget_forget_array(priority: np.ndarray, durability: np.ndarray, quality: np.ndarray, n_cycles):
+    """
+    The vectorized version of `Budget_forget`, where `n_cycles` is either a number or an array.
+
+    Returns:
+        the forgotten priorities.
+    """
+    Q = Config.quality_min
+    C = Config.cycles_forget
+    q = quality * Q
+    return q + (priority - q) * np.power(durability, n_cycles / C)
+
+
+def Budget_revision_array(priority_task: np.ndarray, durability_task: np.ndarray, f_task: np.ndarray, c_task: np.ndarray,
+                          f_belief: np.ndarray, c_belief: np.ndarray, f_derived: np.ndarray, c_derived: np.ndarray,
+                          priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None):
+    """
+    The vectorized version of `Budget_revision`, which evaluates many revisions, with the budgets and the truth-values stored as arrays, in a single pass. None of the arrays is modified.
+
+    Returns:
+        the priorities, durabilities and qualities of the tasks derived;
+        the priorities and durabilities of the tasks revised;
+        the priorities and durabilities of the task-links revised;
+        the priorities and durabilities of the term-links revised, or None if `priority_termlink` is None.
+    """
+    e_derived = c_derived * (f_derived - 0.5) + 0.5
+    diff_task = np.abs(c_task * (f_task - 0.5) + 0.5 - e_derived)
+    priority_task = priority_task * (1 - diff_task)
+    durability_task = durability_task * (1 - diff_task)
+    budget_tasklink = priority_task * diff_task, durability_task * diff_task
+    budget_termlink = None
+    if priority_termlink is not None:
+        diff_belief = np.abs(c_belief * (f_belief - 0.5) + 0.5 - e_derived)
+        budget_termlink = priority_termlink * (1 - diff_belief), durability_termlink * (1 - diff_belief)
+    diff = c_derived - np.maximum(c_task, c_belief)
+    priority = 1 - (1 - diff) * (1 - priority_task)
+    durability = (diff + durability_task) / 2
+    quality = truth_to_quality_array(f_derived, c_derived)
+    return (priority, durability, quality), (priority_task, durability_task), budget_tasklink, budget_termlink
+
+
+def Budget_inference_array(quality: np.ndarray, priority_tasklink: np.ndarray, durability_tasklink: np.ndarray,
+                           priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None, complexity = 1.0):
+    """
+    The vectorized version of `Budget_inference`, where `complexity` is either a number or an array.
+
+    Returns:
+        the priorities, durabilities and qualities.
+    """
+    complexity = 1 + np.log2(complexity)
+    priority = priority_tasklink
+    durability = durability_tasklink / complexity
+    quality = quality / complexity
+    if priority_termlink is not None:
+        priority = 1 - (1 - priority) * (1 - priority_termlink)
+        durability = durability * durability_termlink
+    return priority, durability, quality
+
+
+def Budget_forward_array(f: np.ndarray, c: np.ndarray, priority_tasklink: np.ndarray, durability_tasklink: np.ndarray,
+                         priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None):
+    """
+    The vectorized version of `Budget_forward`, which evaluates the budgets of many tasks derived, with the truth-values of the tasks and the budgets of the links stored as arrays, in a single pass.
+
+    Returns:
+        the priorities, durabilities and qualities.
+    """
+    return Budget_inference_array(truth_to_quality_array(f, c), priority_tasklink, durability_tasklink, priority_termlink, durability_termlink)
+
+
+Budget_backward_array = Budget_forward_array
+
+
+def Budget_backward_weak_array(f: np.ndarray, c: np.ndarray, priority_tasklink: np.ndarray, durability_tasklink: np.ndarray,
+                               priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None):
+    """
+    The vectorized version of `Budget_backward_weak`.
+    """
+    return Budget_inference_array(w_to_c(1, Config.k) * truth_to_quality_array(f, c), priority_tasklink, durability_tasklink, priority_termlink, durability_termlink)
+
+
+def Budget_forward_compound_array(complexity: np.ndarray, f: np.ndarray, c: np.ndarray, priority_tasklink: np.ndarray, durability_tasklink: np.ndarray,
+                                  priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None):
+    """
+    The vectorized version of `Budget_forward_compound`, with the complexities of the contents instead of the contents.
+    """
+    return Budget_inference_array(truth_to_quality_array(f, c), priority_tasklink, durability_tasklink, priority_termlink, durability_termlink,
+                                  Config.complexity_unit * complexity)
+
+
+def Budget_backward_compound_array(complexity: np.ndarray, priority_tasklink: np.ndarray, durability_tasklink: np.ndarray,
+                                   priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None):
+    """
+    The vectorized version of `Budget_backward_compound`, with the complexities of the contents instead of the contents.
+    """
+    return Budget_inference_array(np.ones_like(complexity, dtype=float), priority_tasklink, durability_tasklink, priority_termlink, durability_termlink,
+                                  Config.complexity_unit * complexity)
+
+
+def Budget_backward_weak_compound_array(complexity: np.ndarray, priority_tasklink: np.ndarray, durability_tasklink: np.ndarray,
+                                        priority_termlink: np.ndarray = None, durability_termlink: np.ndarray = None):
+    """
+    The vectorized version of `Budget_backward_weak_compound`, with the complexities of the contents instead of the contents.
+    """
+    return Budget_inference_array(np.full_like(complexity, w_to_c(1, Config.k), dtype=float), priority_tasklink, durability_tasklink, priority_termlink, durability_termlink,
+                                  Config.complexity_unit * complexity)
+
+
+def Budget_summary_array(priority: np.ndarray, durability: np.ndarray, quality: np.ndarray):
+    """
+    The vectorized version of `Budget.summary`, which is compared with `Config.budget_thresh` (see `Budget.is_above_thresh`).
+    """
+    return durability * (priority + quality) / 2.0
+
+
 """Task"""
 """Concept"""
 """Task-Link"""
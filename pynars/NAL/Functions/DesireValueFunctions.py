@@ -1,6 +1,7 @@
 from typing import Callable
 from pynars.Narsese import Truth
 from .ExtendedBooleanFunctions import *
+import numpy as np
 from .UncertaintyMappingFunctions import w_to_c
 
 DesireFuncion = Callable[[Truth, Truth], Truth]
@@ -13,3 +14,20 @@ Desire_weak: DesireFuncion = lambda desire1, desire2: Truth(And(desire1.f, desir
 Desire_deduction: DesireFuncion = lambda desire1, desire2: Truth(And(desire1.f, desire2.f), And(desire1.c, desire2.c), desire1.k)
 
 Desire_induction: DesireFuncion = lambda desire1, desire2: Truth(desire1.f, w_to_c(And(desire2.f, desire1.c, desire2.c), desire1.k), desire1.k)
+
+
+'''vectorized versions, which compute the desire-values of many premises, stored as arrays, in a single pass, and return the frequencies and the confidences'''
+def Desire_strong_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * f2, c1 * c2 * f2
+
+
+def Desire_weak_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * f2, c1 * c2 * f2 * w_to_c(1.0, k)
+
+
+def Desire_deduction_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * f2, c1 * c2
+
+
+def Desire_induction_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1, w_to_c(f2 * c1 * c2, k)
@@ -9,4 +9,12 @@ Average = lambda *x: np.mean(x)
 def Scalar(x): 
     x = 0.5 + 4*(x-0.5)**3 
     x = 0.001 if x < 0.001 else 0.999 if x > 0.999 else x
-    return x
\ No newline at end of file
+    return x
+
+'''vectorized versions, which are element-wise over arrays'''
+And_array = lambda *x: np.prod(np.broadcast_arrays(*x), axis=0)
+Or_array  = lambda *x: 1 - np.prod(1-np.array(np.broadcast_arrays(*x)), axis=0)
+Average_array = lambda *x: np.mean(np.broadcast_arrays(*x), axis=0)
+
+def Scalar_array(x):
+    return np.clip(0.5 + 4*(x-0.5)**3, 0.001, 0.999)
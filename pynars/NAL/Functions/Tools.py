@@ -11,12 +11,18 @@ from pynars.Narsese import Sentence, Judgement, Truth, Task
 from copy import deepcopy
 # import Config, Global
 from math import sqrt
+import numpy as np
 from pynars.Narsese import Sentence, Stamp, Term
 from pynars.Narsese import TRUE, FALSE, UNSURE
 from pynars.Narsese import Goal, Quest, Question
 
 def truth_to_quality(truth: Truth) -> float:
     return max(truth.e, (1 - truth.e)*0.75); 
+
+def truth_to_quality_array(f: np.ndarray, c: np.ndarray) -> np.ndarray:
+    '''The vectorized version of `truth_to_quality`.'''
+    e = c * (f - 0.5) + 0.5
+    return np.maximum(e, (1 - e)*0.75)
     
 def distribute_budget_among_links(budget: Budget, n_links: int) -> Budget:
     return Budget(budget.priority/sqrt(n_links), budget.durability, budget.quality)
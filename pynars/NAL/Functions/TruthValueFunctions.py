@@ -1,4 +1,5 @@
 from typing import Callable
+import numpy as np
 from pynars.Narsese import Truth, truth_analytic
 from .ExtendedBooleanFunctions import *
 # from .Tools import *
@@ -119,3 +120,92 @@ Truth_deconjuntion: TruthFunction = lambda truth1, truth2: Truth_negation(
 # F_ddj     {(||, A, B).; B.} |- A.
 Truth_dedisjunction: TruthFunction = lambda truth1, truth2: Truth_deduction(
     Truth_intersection(truth1, Truth_negation(truth2)), truth_analytic)
+
+'''vectorized versions'''
+# Each of them computes the truth-values of many premises, with the frequencies and the confidences stored as arrays, in a single pass, and returns the frequencies and the confidences. `k` is either a number or an array.
+
+
+'''local inference'''
+def Truth_revision_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    w_p_1, w_m_1 = w_from_truth_array(f1, c1, k)
+    w_p_2, w_m_2 = w_from_truth_array(f2, c2, k)
+    w_p, w_m = F_revision(w_p_1, w_p_2, w_m_1, w_m_2)
+    return truth_from_w_array(w_p, w_m + w_p, k)
+
+
+def Truth_expectation_array(f: np.ndarray, c: np.ndarray):
+    '''return: e'''
+    return F_expectation(f, c)
+
+
+'''immediate inference'''
+def Truth_negation_array(f: np.ndarray, c: np.ndarray, k):
+    w_plus, w_minus = F_negation(*w_from_truth_array(f, c, k))
+    w = w_plus + w_minus
+    return w_to_f(w_plus, w), w_to_c(w, k)
+
+
+def Truth_conversion_array(f: np.ndarray, c: np.ndarray, k):
+    w_plus = f * c
+    return truth_from_w_array(w_plus, w_plus, k)
+
+
+def Truth_contraposition_array(f: np.ndarray, c: np.ndarray, k):
+    w_minus = (1 - f) * c
+    return truth_from_w_array(np.zeros_like(w_minus), w_minus, k)
+
+
+'''strong syllogism'''
+def Truth_deduction_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    f = f1 * f2
+    return f, f * c1 * c2
+
+
+def Truth_analogy_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * f2, f2 * c1 * c2
+
+
+def Truth_resemblance_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * f2, Or_array(f1, f2) * c1 * c2
+
+
+'''weak syllogism'''
+def Truth_abduction_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return truth_from_w_array(f1 * f2 * c1 * c2, f1 * c1 * c2, k)
+
+
+def Truth_induction_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return truth_from_w_array(f1 * f2 * c1 * c2, f2 * c1 * c2, k)
+
+
+def Truth_exemplification_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    w = f1 * f2 * c1 * c2
+    return truth_from_w_array(w, w, k)
+
+
+def Truth_comparison_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return truth_from_w_array(f1 * f2 * c1 * c2, Or_array(f1, f2) * c1 * c2, k)
+
+
+'''term composition'''
+def Truth_intersection_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * f2, c1 * c2
+
+
+def Truth_union_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return Or_array(f1, f2), c1 * c2
+
+
+def Truth_difference_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    return f1 * (1 - f2), c1 * c2
+
+
+def Truth_deconjuntion_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    f, c = Truth_intersection_array(*Truth_negation_array(f1, c1, k), f2, c2, k)
+    f, c = Truth_deduction_array(f, c, truth_analytic.f, truth_analytic.c, k)
+    return Truth_negation_array(f, c, k)
+
+
+def Truth_dedisjunction_array(f1: np.ndarray, c1: np.ndarray, f2: np.ndarray, c2: np.ndarray, k):
+    f, c = Truth_intersection_array(f1, c1, *Truth_negation_array(f2, c2, k), k)
+    return Truth_deduction_array(f, c, truth_analytic.f, truth_analytic.c, k)
@@ -1,3 +1,4 @@
+import numpy as np
 from pynars.Narsese import Truth
 
 fc_to_w_plus    = lambda f, c, k: k*f*c/(1-c)
@@ -15,4 +16,15 @@ def truth_from_w(w_plus, w, k):
 
 def w_from_truth(truth: Truth):
     f, c, k = truth.f, truth.c, truth.k
-    return fc_to_w_plus(f, c, k), fc_to_w_minus(f, c, k)
\ No newline at end of file
+    return fc_to_w_plus(f, c, k), fc_to_w_minus(f, c, k)
+
+def truth_from_w_array(w_plus: np.ndarray, w: np.ndarray, k):
+    '''The vectorized version of `truth_from_w`, which returns the frequencies and the confidences.'''
+    valid = w != 0
+    f = np.where(valid, w_plus / np.where(valid, w, 1), 0.5)
+    c = np.where(valid, w / (w + k), 0.0)
+    return f, c
+
+def w_from_truth_array(f: np.ndarray, c: np.ndarray, k):
+    '''The vectorized version of `w_from_truth`.'''
+    return fc_to_w_plus(f, c, k), fc_to_w_minus(f, c, k)
@@ -97,9 +97,9 @@ def deduction_sequence_replace(task: Task, belief: Belief, budget_tasklink: Budg
     interval2: Interval = compound2.terms[-1]
     if interval1.is_interval and interval2.is_interval:
         interval = interval1 + interval2
-        compound = Compound(compound2.connector, *compound2.terms[:-1], interval)
+        compound = Compound.build(compound2.connector, *compound2.terms[:-1], interval)
     else:
-        compound = Compound(compound2.connector, *compound2.terms, *compound1.terms)
+        compound = Compound.build(compound2.connector, *compound2.terms, *compound1.terms)
 
     statement = Statement(compound, stat1.copula, stat1.predicate)
 
@@ -154,7 +154,7 @@ def abduction(task: Task, belief: Belief, budget_tasklink: Budget=None, budget_t
             if compound.is_multiple_only and len(compound_terms)==1:
                 compound = compound_terms[0]
             else:
-                compound = Compound(compound.connector, *compound_terms)
+                compound = Compound.build(compound.connector, *compound_terms)
 
     statement = compound
 
@@ -298,7 +298,7 @@ def sequence(task: Task, belief: Belief, budget_tasklink: Budget=None, budget_te
         if compound.is_multiple_only and len(compound_terms)==1:
             compound = compound_terms[0]
         else:
-            compound = Compound(compound.connector, *compound_terms)
+            compound = Compound.build(compound.connector, *compound_terms)
 
     statement = compound
 
@@ -408,7 +408,7 @@ def sequence_predictive_implication(task: Task, belief: Belief, budget_tasklink:
         if compound.is_multiple_only and len(compound_terms)==1:
             compound = compound_terms[0]
         else:
-            compound = Compound(compound.connector, *compound_terms)
+            compound = Compound.build(compound.connector, *compound_terms)
 
     statement = Statement(compound, stat1.copula, stat1.predicate)
 
@@ -34,11 +34,13 @@ def believe(statement: Term, term_truth: Term):
     return Task(sentence, budget)
 
 
-def doubt(beliefs: List[Belief]):
+def doubt(beliefs: List[Belief], table: 'Table'=None):
     ''''''
     for belief in beliefs:
         # discount the confidence of the beleif
         belief.truth.c = belief.truth.c * Config.rate_discount_c
+        # the belief is ranked by its confidence in the table
+        if table is not None: table.update(belief, belief.truth.c)
     return None
 
 
@@ -50,11 +52,12 @@ def evaluate(statement: Term):
     return Task(sentence, budget)
 
 
-def hesitate(desires: List[Desire]):
+def hesitate(desires: List[Desire], table: 'Table'=None):
     ''''''
     for desire in desires:
         # discount the confidence of the desire
         desire.truth.c = desire.truth.c * Config.rate_discount_c
+        if table is not None: table.update(desire, desire.truth.c)
     return None
 
 
@@ -2,7 +2,6 @@ from typing import Dict, List, Tuple
 
 from bidict import bidict
 from pynars.Narsese import Term
-from pynars.utils.IndexVar import IntVar
 
 from .Substitution import Substitution
 
@@ -11,7 +10,7 @@ class Elimination(Substitution):
     '''
     the substitution of var-to-const
     '''
-    def __init__(self, term_src: Term, term_tgt: Term, ivar_src: List[IntVar]=None, iconst_tgt: List[Term]=None, dvar_src: List[IntVar]=None, dconst_tgt: List[Term]=None, qvar_src: List[IntVar]=None, qconst_tgt: List[Term]=None) -> None:
+    def __init__(self, term_src: Term, term_tgt: Term, ivar_src: List[int]=None, iconst_tgt: List[Term]=None, dvar_src: List[int]=None, dconst_tgt: List[Term]=None, qvar_src: List[int]=None, qconst_tgt: List[Term]=None) -> None:
         super().__init__(term_src, term_tgt) #, ivar_src, iconst_tgt, dvar_src, dconst_tgt, qvar_src, qconst_tgt)
 
         # is_conflict_ivar = is_conflict_dvar = is_conflict_qvar = False
@@ -41,7 +40,7 @@ class Elimination(Substitution):
         return not self.is_conflict_ivar and len(self.mapping_ivar) > 0
 
     @staticmethod
-    def check_conflict(vars: List[IntVar], consts: List[Term]) -> Tuple[bool, Dict[IntVar, Term]]:
+    def check_conflict(vars: List[int], consts: List[Term]) -> Tuple[bool, Dict[int, Term]]:
         '''
         no conflict:
             (&&, <$x-->A>, <$y-->A>)
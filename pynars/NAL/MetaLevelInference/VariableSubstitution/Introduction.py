@@ -1,6 +1,5 @@
 from typing import List
 from pynars.Narsese import Term
-from pynars.utils.IndexVar import IntVar
 
 from .Substitution import Substitution
 
@@ -8,7 +7,7 @@ class Introduction(Substitution):
     '''
     the substitution of const-to-var
     '''
-    def __init__(self, term_src: Term, term_tgt: Term, iconst_src: List[Term]=None, ivar_tgt: List[IntVar]=None, dconst_src: List[Term]=None, dvar_tgt: List[IntVar]=None, qconst_src: List[Term]=None, qvar_tgt: List[IntVar]=None) -> None:
+    def __init__(self, term_src: Term, term_tgt: Term, iconst_src: List[Term]=None, ivar_tgt: List[int]=None, dconst_src: List[Term]=None, dvar_tgt: List[int]=None, qconst_src: List[Term]=None, qvar_tgt: List[int]=None) -> None:
         super().__init__(term_src, term_tgt, iconst_src, ivar_tgt, dconst_src, dvar_tgt, qconst_src, qvar_tgt)
 
 
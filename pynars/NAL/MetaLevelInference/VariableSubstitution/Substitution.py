@@ -3,14 +3,13 @@ from typing import List
 
 from bidict import bidict
 from pynars.Narsese import Term
-from pynars.utils.IndexVar import IntVar
 
 
 class Substitution:
     '''
     the substitutions between the terms of the same type, that is, ivar-to-ivar, dvar-to-dvar, qvar-to-qvar, const-to-const
     '''
-    def __init__(self, term_src: Term, term_tgt: Term, ivar_src: List[IntVar]=None, ivar_tgt: List[IntVar]=None, dvar_src: List[IntVar]=None, dvar_tgt: List[IntVar]=None, qvar_src: List[IntVar]=None, qvar_tgt: List[IntVar]=None, const_src: List[Term]=None, const_tgt: List[Term]=None) -> None:
+    def __init__(self, term_src: Term, term_tgt: Term, ivar_src: List[int]=None, ivar_tgt: List[int]=None, dvar_src: List[int]=None, dvar_tgt: List[int]=None, qvar_src: List[int]=None, qvar_tgt: List[int]=None, const_src: List[Term]=None, const_tgt: List[Term]=None) -> None:
         '''
         len(src) == len(tgt)
         '''
@@ -63,15 +62,9 @@ class Substitution:
             mapping_const = self.mapping_const.inverse  if mapping_const is not None else None
 
 
-        ivar = [int(var) for var in term_src.index_var.var_independent]
-        dvar = [int(var) for var in term_src.index_var.var_dependent]
-        qvar = [int(var) for var in term_src.index_var.var_query]
-
         # TODO: replace var with var
         term = deepcopy(term_src)
-        term.index_var.var_independent = [var(mapping_ivar.get(var_int, None)) for var, var_int in zip(term._index_var.var_independent, ivar)]
-        term.index_var.var_dependent = [var(mapping_dvar.get(var_int, None)) for var, var_int in zip(term._index_var.var_dependent, dvar)]
-        term.index_var.var_query = [var(mapping_qvar.get(var_int, None)) for var, var_int in zip(term._index_var.var_query, qvar)]
+        term.index_var.remap(mapping_ivar, mapping_dvar, mapping_qvar)
 
         return term
     
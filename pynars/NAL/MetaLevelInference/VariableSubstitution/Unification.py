@@ -8,7 +8,7 @@ from typing import Callable, Dict, List, Tuple, Union
 from bidict import bidict
 from pynars.Narsese import Term
 from pynars.Narsese import Statement, Compound
-from pynars.utils.IndexVar import IndexVar, IntVar
+from pynars.utils.IndexVar import IndexVar
 from pynars.utils.tools import find_pos_with_pos, find_var_with_pos
 
 from .Substitution import Substitution
@@ -17,7 +17,7 @@ from .Introduction import Introduction
 
 # find_var_with_pos: Callable = lambda pos_search, variables, positions: [var for var, pos in zip(variables, positions) if pos[:len(pos_search)] == pos_search] # find those variables with a common head of position. e.g. pos_search=[0], variables=[1, 1, 2, 2], and positions=[[0, 2, 0, 0], [0, 2, 1, 0], [0, 3, 0], [1, 0]], then return [1, 1, 2]
 # find_pos_with_pos: Callable = lambda pos_search, positions: [pos for pos in positions if pos[:len(pos_search)] == pos_search]
-def unification__var_var(term1: Term, term2: Term, pos_common1: List[IntVar], pos_common2: List[IntVar]) -> Substitution:
+def unification__var_var(term1: Term, term2: Term, pos_common1: List[int], pos_common2: List[int]) -> Substitution:
     '''
     It should be ensured that `term1[pos_common1].equal(term2[pos_common2]) == True`.
     '''
@@ -34,13 +34,13 @@ def unification__var_var(term1: Term, term2: Term, pos_common1: List[IntVar], po
     return Substitution(term1, term2, ivar1, ivar2, dvar1, dvar2, qvar1, qvar2)
 
 
-def unification__const_var(term1: Term, term2: Term, pos_common1: List[IntVar], pos_common2: List[IntVar]) -> Introduction:
+def unification__const_var(term1: Term, term2: Term, pos_common1: List[int], pos_common2: List[int]) -> Introduction:
     ''''''
 
     return Introduction(...)
 
 
-def unification__var_const(term1: Term, term2: Term, pos_common1: List[IntVar], pos_common2: List[IntVar]) -> Elimination:
+def unification__var_const(term1: Term, term2: Term, pos_common1: List[int], pos_common2: List[int]) -> Elimination:
     '''
     It should be ensured that `term1[pos_common1].equal(term2[pos_common2]) == True`.
     e.g. 
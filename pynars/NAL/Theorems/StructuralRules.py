@@ -352,9 +352,9 @@ def inheritance_theorem5(task: Task, term_concept: Term, budget_tasklink: Budget
     '''
     return Judgement(
         Statement(
-            Compound(
+            Compound.build(
                 Connector.Product, 
-                Compound(
+                Compound.build(
                     Connector.ExtensionalImage, R, place_holder, T
                 ),
                 T
@@ -374,9 +374,9 @@ def inheritance_theorem6(task: Task, term_concept: Term, budget_tasklink: Budget
         Statement(
             R,
             Copula.Inheritance,
-            Compound(
+            Compound.build(
                 Connector.Product, 
-                Compound(
+                Compound.build(
                     Connector.IntensionalImage, R, place_holder, T
                 ),
                 T
@@ -406,7 +406,7 @@ def similarity_theorem1(R: Term, T: Term):
     '''
     return Judgement(
         Statement(
-            Compound(Connector.Negation, Compound(Connector.Negation, T)),
+            Compound.build(Connector.Negation, Compound.build(Connector.Negation, T)),
             Copula.Inheritance,
             T
         ),
@@ -422,8 +422,8 @@ def similarity_theorem2_1(T1: Term, T2: Term, *Ts: Term):
         T: Compound
         assert isinstance(T, Compound) and T.connector == Connector.ExtensionalSet
     
-    term1 = Compound(Connector.IntensionalIntersection, *Ts)
-    term2 = Compound(Connector.ExtensionalSet, *(T[0] for T in Ts))
+    term1 = Compound.build(Connector.IntensionalIntersection, *Ts)
+    term2 = Compound.build(Connector.ExtensionalSet, *(T[0] for T in Ts))
 
     return Judgement(
         Statement(
@@ -440,8 +440,8 @@ def similarity_theorem2_2(T1: Term, T2: Term, *Ts: Term):
     '''
     Ts: List[Compound] = (T1, T2, *Ts)
     
-    term1 = Compound(Connector.IntensionalIntersection,  *(Compound(Connector.ExtensionalSet, T) for T in Ts))
-    term2 = Compound(Connector.ExtensionalSet, *Ts)
+    term1 = Compound.build(Connector.IntensionalIntersection,  *(Compound.build(Connector.ExtensionalSet, T) for T in Ts))
+    term2 = Compound.build(Connector.ExtensionalSet, *Ts)
 
     return Judgement(
         Statement(
@@ -459,8 +459,8 @@ def similarity_theorem3_1(T1: Term, T2: Term, *Ts: Term):
         T: Compound
         assert isinstance(T, Compound) and T.connector == Connector.ExtensionalSet
     
-    term1 = Compound(Connector.ExtensionalIntersection, *Ts)
-    term2 = Compound(Connector.IntensionalSet, *(T[0] for T in Ts))
+    term1 = Compound.build(Connector.ExtensionalIntersection, *Ts)
+    term2 = Compound.build(Connector.IntensionalSet, *(T[0] for T in Ts))
 
     return Judgement(
         Statement(
@@ -475,8 +475,8 @@ def similarity_theorem3_2(T1: Term, T2: Term, *Ts: Term):
     '''(&, ([, T1), ..., ([, Tn))          ([, T1, ..., Tn)'''
     Ts: List[Compound] = (T1, T2, *Ts)
     
-    term1 = Compound(Connector.ExtensionalIntersection,  *(Compound(Connector.IntensionalSet, T) for T in Ts))
-    term2 = Compound(Connector.IntensionalSet, *Ts)
+    term1 = Compound.build(Connector.ExtensionalIntersection,  *(Compound.build(Connector.IntensionalSet, T) for T in Ts))
+    term2 = Compound.build(Connector.IntensionalSet, *Ts)
 
     return Judgement(
         Statement(
@@ -494,8 +494,8 @@ def similarity_theorem4(T1: Term, T2: Term, *Ts: Term):
     Ts: List[Compound] = (T1, T2, *Ts)
     Ts = Ts[:-1]
     Tn = Ts[-1]
-    term1 = Compound(Connector.ExtensionalDifference, Compound(Connector.ExtensionalSet, *Ts), Compound(Connector.ExtensionalSet, Tn))
-    term2 = Compound(Connector.ExtensionalSet, *Ts)
+    term1 = Compound.build(Connector.ExtensionalDifference, Compound.build(Connector.ExtensionalSet, *Ts), Compound.build(Connector.ExtensionalSet, Tn))
+    term2 = Compound.build(Connector.ExtensionalSet, *Ts)
 
     return Judgement(
         Statement(
@@ -513,8 +513,8 @@ def similarity_theorem5(T1: Term, T2: Term, *Ts: Term):
     Ts: List[Compound] = (T1, T2, *Ts)
     Ts = Ts[:-1]
     Tn = Ts[-1]
-    term1 = Compound(Connector.IntensionalDifference, Compound(Connector.IntensionalSet, *Ts), Compound(Connector.IntensionalSet, Tn))
-    term2 = Compound(Connector.IntensionalSet, *Ts)
+    term1 = Compound.build(Connector.IntensionalDifference, Compound.build(Connector.IntensionalSet, *Ts), Compound.build(Connector.IntensionalSet, Tn))
+    term2 = Compound.build(Connector.IntensionalSet, *Ts)
 
     return Judgement(
         Statement(
@@ -529,7 +529,7 @@ def similarity_theorem6(T1: Term, T2: Term):
     '''
     (/, (*, T1, T2), _, T2) <-> T1
     '''
-    term1 = Compound(Connector.ExtensionalImage, Compound(Connector.Product, T1, T2), place_holder, T2)
+    term1 = Compound.build(Connector.ExtensionalImage, Compound.build(Connector.Product, T1, T2), place_holder, T2)
     term2 = T1
 
     return Judgement(
@@ -545,7 +545,7 @@ def similarity_theorem7(T1: Term, T2: Term):
     '''
     (\, (*, T1, T2), _, T2) <-> T1
     '''
-    term1 = Compound(Connector.IntensionalImage, Compound(Connector.Product, T1, T2), place_holder, T2)
+    term1 = Compound.build(Connector.IntensionalImage, Compound.build(Connector.Product, T1, T2), place_holder, T2)
     term2 = T1
 
     return Judgement(
@@ -808,9 +808,9 @@ def implication_theorem21(M: Term, T1: Term, T2: Term):
     '''
     return Judgement(
         Statement(
-            Statement(M, Copula.Inheritance, Compound(Connector.ExtensionalDifference, T1, T2)),
+            Statement(M, Copula.Inheritance, Compound.build(Connector.ExtensionalDifference, T1, T2)),
             Copula.Implication,
-            Compound(Connector.Negation, Statement(M, Copula.Inheritance, T2))
+            Compound.build(Connector.Negation, Statement(M, Copula.Inheritance, T2))
         ),
         Truth(1, 1, 0)
     )
@@ -821,9 +821,9 @@ def implication_theorem22(M: Term, T1: Term, T2: Term):
     '''
     return Judgement(
         Statement(
-            Statement(Compound(Connector.IntensionalDifference, T1, T2), Copula.Inheritance, M),
+            Statement(Compound.build(Connector.IntensionalDifference, T1, T2), Copula.Inheritance, M),
             Copula.Implication,
-            Compound(Connector.Negation, Statement(T2, Copula.Inheritance, M))
+            Compound.build(Connector.Negation, Statement(T2, Copula.Inheritance, M))
         ),
         Truth(1, 1, 0)
     )
@@ -837,7 +837,7 @@ def implication_theorem23(task: Task, term_concept: Term, budget_tasklink: Budge
         Statement(
             Statement(S, Copula.Inheritance, P),
             Copula.Implication,
-            Statement(Compound(Connector.ExtensionalImage, S, M), Copula.Inheritance,Compound(Connector.ExtensionalImage, P, M))
+            Statement(Compound.build(Connector.ExtensionalImage, S, M), Copula.Inheritance,Compound.build(Connector.ExtensionalImage, P, M))
         ),
         Truth(1, 1, 0)
     )
@@ -851,7 +851,7 @@ def implication_theorem24(task: Task, term_concept: Term, budget_tasklink: Budge
         Statement(
             Statement(S, Copula.Inheritance, P),
             Copula.Implication,
-            Statement(Compound(Connector.IntensionalImage, S, M), Copula.Inheritance,Compound(Connector.IntensionalImage, P, M))
+            Statement(Compound.build(Connector.IntensionalImage, S, M), Copula.Inheritance,Compound.build(Connector.IntensionalImage, P, M))
         ),
         Truth(1, 1, 0)
     )
@@ -865,7 +865,7 @@ def implication_theorem25(task: Task, term_concept: Term, budget_tasklink: Budge
         Statement(
             Statement(S, Copula.Inheritance, P),
             Copula.Implication,
-            Statement(Compound(Connector.ExtensionalImage, M, P), Copula.Inheritance,Compound(Connector.ExtensionalImage, M, S))
+            Statement(Compound.build(Connector.ExtensionalImage, M, P), Copula.Inheritance,Compound.build(Connector.ExtensionalImage, M, S))
         ),
         Truth(1, 1, 0)
     )
@@ -879,7 +879,7 @@ def implication_theorem26(task: Task, term_concept: Term, budget_tasklink: Budge
         Statement(
             Statement(S, Copula.Inheritance, P),
             Copula.Implication,
-            Statement(Compound(Connector.IntensionalImage, M, P), Copula.Inheritance,Compound(Connector.IntensionalImage, M, S))
+            Statement(Compound.build(Connector.IntensionalImage, M, P), Copula.Inheritance,Compound.build(Connector.IntensionalImage, M, S))
         ),
         Truth(1, 1, 0)
     )
@@ -921,7 +921,7 @@ def equivalence_theorem1(task: Task, term_concept: Term, budget_tasklink: Budget
         Statement(
             Statement(S, Copula.Similarity, P),
             Copula.Equivalence,
-            Compound(Connector.Conjunction, Statement(S, Copula.Inheritance, P), Statement(P, Copula.Inheritance, S))
+            Compound.build(Connector.Conjunction, Statement(S, Copula.Inheritance, P), Statement(P, Copula.Inheritance, S))
         ),
         Truth(1, 1, 0)
     )
@@ -934,7 +934,7 @@ def equivalence_theorem2(S: Term, P: Term):
         Statement(
             Statement(S, Copula.Equivalence, P),
             Copula.Equivalence,
-            Compound(Connector.Conjunction, Statement(S, Copula.Implication, P), Statement(P, Copula.Implication, S))
+            Compound.build(Connector.Conjunction, Statement(S, Copula.Implication, P), Statement(P, Copula.Implication, S))
         ),
         Truth(1, 1, 0)
     )
@@ -1088,9 +1088,9 @@ def equivalence_theorem7(S1: Term, S2: Term, P1: Term, P2: Term):
     '''
     return Judgement(
         Statement(
-            Statement(Compound(Connector.Product, S1, S2), Copula.Inheritance, Compound(Connector.Product, P1, P2)),
+            Statement(Compound.build(Connector.Product, S1, S2), Copula.Inheritance, Compound.build(Connector.Product, P1, P2)),
             Copula.Equivalence,
-            Compound(Connector.Conjunction, Statement(S1, Copula.Inheritance, P1), Statement(S2, Copula.Inheritance, P2))
+            Compound.build(Connector.Conjunction, Statement(S1, Copula.Inheritance, P1), Statement(S2, Copula.Inheritance, P2))
         ),
         Truth(1, 1, 0)
     )
@@ -1101,9 +1101,9 @@ def equivalence_theorem8(S1: Term, S2: Term, P1: Term, P2: Term):
     '''
     return Judgement(
         Statement(
-            Statement(Compound(Connector.Product, S1, S2), Copula.Similarity, Compound(Connector.Product, P1, P2)),
+            Statement(Compound.build(Connector.Product, S1, S2), Copula.Similarity, Compound.build(Connector.Product, P1, P2)),
             Copula.Equivalence,
-            Compound(Connector.Conjunction, Statement(S1, Copula.Similarity, P1), Statement(S2, Copula.Similarity, P2))
+            Compound.build(Connector.Conjunction, Statement(S1, Copula.Similarity, P1), Statement(S2, Copula.Similarity, P2))
         ),
         Truth(1, 1, 0)
     )
@@ -1178,7 +1178,7 @@ def equivalence_theorem17(S1: Term, S2: Term, S3: Term):
         Statement(
             Statement(S1, Copula.Implication, Statement(S2, Copula.Implication, S3)),
             Copula.Equivalence,
-            Statement(Compound(Connector.Conjunction, S1, S2), Copula.Implication, S3)
+            Statement(Compound.build(Connector.Conjunction, S1, S2), Copula.Implication, S3)
         ),
         Truth(1, 1, 0)
     )
@@ -1190,9 +1190,9 @@ def equivalence_theorem18(S1: Term, S2: Term):
     assert isinstance(S1, Statement) and isinstance(S2, Statement)
     return Judgement(
         Statement(
-            Compound(Connector.Negation, Compound(Connector.Conjunction, S1, S2)),
+            Compound.build(Connector.Negation, Compound.build(Connector.Conjunction, S1, S2)),
             Copula.Equivalence,
-            Compound(Connector.Disjunction, Compound(Connector.Negation, S1), Compound(Connector.Negation, S2))
+            Compound.build(Connector.Disjunction, Compound.build(Connector.Negation, S1), Compound.build(Connector.Negation, S2))
         ),
         Truth(1, 1, 0)
     )
@@ -1204,9 +1204,9 @@ def equivalence_theorem19(S1: Term, S2: Term):
     assert isinstance(S1, Statement) and isinstance(S2, Statement)
     return Judgement(
         Statement(
-            Compound(Connector.Negation, Compound(Connector.Disjunction, S1, S2)),
+            Compound.build(Connector.Negation, Compound.build(Connector.Disjunction, S1, S2)),
             Copula.Equivalence,
-            Compound(Connector.Conjunction, Compound(Connector.Negation, S1), Compound(Connector.Negation, S2))
+            Compound.build(Connector.Conjunction, Compound.build(Connector.Negation, S1), Compound.build(Connector.Negation, S2))
         ),
         Truth(1, 1, 0)
     )
@@ -1220,7 +1220,7 @@ def equivalence_theorem20(S1: Term, S2: Term):
         Statement(
             Statement(S1, Copula.Equivalence, S2),
             Copula.Equivalence,
-            Statement(Compound(Connector.Negation, S1), Copula.Equivalence, Compound(Connector.Negation, S2))
+            Statement(Compound.build(Connector.Negation, S1), Copula.Equivalence, Compound.build(Connector.Negation, S2))
         ),
         Truth(1, 1, 0)
     )
@@ -8,11 +8,14 @@ from pynars.NARS.InferenceEngine import TemporalEngine
 from pynars.Narsese._py.Budget import Budget
 from pynars.Narsese._py.Statement import Statement
 from pynars.Narsese._py.Task import Belief
-from ..DataStructures import Bag, Memory, NarseseChannel, Buffer, Task, Concept
+from ..DataStructures import Bag, Memory, NarseseChannel, Buffer, Task, Concept, DerivationFilter
 from ..InferenceEngine import GeneralEngine
 from pynars import Config
 from pynars.Config import Enable
-from typing import Callable, List, Tuple, Union
+from typing import Callable, Iterable, List, Tuple, Union
+from pathlib import Path
+from pynars.Narsese.Parser import parser
+from pynars.utils.Print import out_print, PrintType
 import pynars.NARS.Operation as Operation
 from pynars import Global
 
@@ -26,6 +29,13 @@ class Reasoner:
         self.inference = GeneralEngine()
         self.temporal_inference = TemporalEngine()  # for temporal causal reasoning
 
+        self.n_memory = n_memory
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        '''clear the memory, the buffers and the channels.'''
+        n_memory, capacity = self.n_memory, self.capacity
         self.memory = Memory(n_memory)
         self.overall_experience = Buffer(capacity)
         self.internal_experience = Buffer(capacity)
@@ -38,10 +48,8 @@ class Reasoner:
 
         self.sequence_buffer = Buffer(capacity)
         self.operations_buffer = Buffer(capacity)
-
-    def reset(self):
-        ''''''
-        # TODO
+        capacity_derivation_filter = Config.Config.capacity_derivation_filter
+        self.derivation_filter = DerivationFilter(capacity_derivation_filter, Config.Config.duration_derivation_filter) if capacity_derivation_filter > 0 else None
 
     def cycles(self, n_cycle: int):
         for _ in range(n_cycle):
@@ -52,6 +60,35 @@ class Reasoner:
         if go_cycle: self.cycle()
         return success, task, task_overflow
 
+    def ingest(self, source: Union[str, Path, Iterable[str]], workers: int = 1, batch_size: int = 1024, go_cycle: bool = True) -> int:
+        '''
+        input the Narsese from a file (which is read as gzip if it ends with `.gz`), or from an iterable of lines, in bulk, see `parser.read_lines` and `parser.parse_lines`.
+        The tasks are put into the Narsese channel in batches no larger than the channel, nor than the duration for which a task stays in it; if `go_cycle`, the reasoner runs a cycle for each task after each batch, just as a task is input by `input_narsese` with a cycle, and a cycle is run earlier whenever the channel is full, so that no task is dropped.
+        Returns the number of the tasks accepted by the channel. The lines failed to be parsed, and the number of the tasks dropped by the channel for overflowing it, are reported.
+        '''
+        channel = self.narsese_channel
+        n_task = n_dropped = 0
+        size = max(min(batch_size, channel.capacity, channel.max_duration), 1)
+        for lines, tasks in parser.parse_lines(parser.read_lines(source), workers, size):
+            n_cycle = 0
+            for line, task in zip(lines, tasks):
+                if task is None:
+                    out_print(PrintType.ERROR, f'Invalid input! Failed to parse: {line}')
+                    continue
+                if go_cycle and len(channel) >= channel.capacity:
+                    self.cycle()
+                    n_cycle -= 1
+                task_overflow = channel.put_task(task)
+                n_task += 1
+                n_cycle += 1
+                if task_overflow is not None:
+                    # either the task itself, or another one pushed out by it, is dropped.
+                    n_dropped += 1
+            if go_cycle: self.cycles(n_cycle)
+        if n_dropped > 0:
+            out_print(PrintType.INFO, f'{n_dropped} of the tasks input were dropped for overflowing the Narsese channel.')
+        return n_task - n_dropped
+
     def cycle(self):
         '''Everything to do by NARS in a single working cycle'''
 
@@ -63,10 +100,12 @@ class Reasoner:
 
         # step 2. Take out an Item from the `Internal Experience`, with putting it back afterwards, and then put it
         # into the `Overall Experience`
-        task: Task = self.internal_experience.take(remove=True)
+        # In the lazy forgetting mode, an item is forgotten when it is read, so there is no need to take it out and put it back.
+        task: Task = self.internal_experience.take(remove=not self.internal_experience.lazy_forget)
         if task is not None:
             self.overall_experience.put(task)
-            self.internal_experience.put_back(task)
+            if not self.internal_experience.lazy_forget:
+                self.internal_experience.put_back(task)
 
         # step 3. Process a task of global experience buffer
         task: Task = self.overall_experience.take()
@@ -97,16 +136,28 @@ class Reasoner:
             judgement_revised, goal_revised, answers_question, answers_quest = None, None, None, None
 
         # step 4. Apply general inference step   
-        concept: Concept = self.memory.take(remove=True)
+        lazy_forget = self.memory.concepts.lazy_forget
         tasks_derived: List[Task] = []
-        if concept is not None:
-            tasks_inference_derived = self.inference.step(concept)
-            tasks_derived.extend(tasks_inference_derived)
+        n_concepts_batched = Config.Config.n_concepts_batched
+        if n_concepts_batched > 0:
+            concepts: List[Concept] = []
+            for _ in range(min(n_concepts_batched, len(self.memory.concepts))):
+                concept = self.memory.take(remove=not lazy_forget)
+                if concept is None: break
+                if concept not in concepts: concepts.append(concept)
+            tasks_derived.extend(self.inference.step_batch(concepts))
+            if not lazy_forget:
+                for concept in concepts: self.memory.put_back(concept)
+        else:
+            concept: Concept = self.memory.take(remove=not lazy_forget)
+            if concept is not None:
+                tasks_inference_derived, _ = self.inference.step(concept)
+                tasks_derived.extend(tasks_inference_derived)
 
-            # TODO: relevant process
-            is_concept_valid = True
-            if is_concept_valid:
-                self.memory.put_back(concept)
+                # TODO: relevant process
+                is_concept_valid = True
+                if is_concept_valid and not lazy_forget:
+                    self.memory.put_back(concept)
 
         #   temporal induction in NAL-7
         if False and task is not None and task.is_judgement and task.is_external_event:
@@ -137,19 +188,28 @@ class Reasoner:
             op = stat.predicate
             if op in Operation.registered_operations and not task.is_mental_operation:
                 # to judge whether the goal is satisfied
-                task_operation_return, task_executed = Operation.execute(task, concept, self.memory)
-                concept_task = self.memory.take_by_key(task, remove=False)
+                concept_task: Concept = self.memory.take_by_key(task, remove=False)
+                task_operation_return, task_executed = Operation.execute(task, concept_task, self.memory)
                 if concept_task is not None:
                     belief: Belief = concept_task.match_belief(task.sentence)
-                if belief is not None:
-                    task.budget.reduce_by_achieving_level(belief.truth.e)
+                    if belief is not None:
+                        task.budget.reduce_by_achieving_level(belief.truth.e)
                 if task_operation_return is not None: tasks_derived.append(task_operation_return)
                 if task_executed is not None: tasks_derived.append(task_executed)
 
+        #   merge or drop the tasks derived again from the same evidence
+        if self.derivation_filter is not None:
+            tasks_derived = self.derivation_filter.filter(tasks_derived, self.internal_experience)
+
         #   put the tasks-derived into the internal-experience.
         for task_derived in tasks_derived:
             self.internal_experience.put(task_derived)
 
+        #   forget all the concepts by time, periodically
+        cycles_forget_all = Config.Config.cycles_forget_all_memory
+        if cycles_forget_all > 0 and Global.time % cycles_forget_all == 0:
+            self.memory.concepts.forget_all()
+
         # handle the sense of time
         Global.time += 1
 
@@ -2,7 +2,6 @@ import time
 from typing import List
 
 import numpy as np
-from matplotlib import pyplot as plt
 
 from pynars import Config, Global
 from pynars.GUI.Ui_Form import Ui_Form
@@ -88,6 +87,7 @@ class ReasonerMC(Ui_Form):
             for each in self.memory.concepts.levels:
                 for each_level in each:
                     memory_visualization.append(each_level.budget.priority)
+            from matplotlib import pyplot as plt
             plt.figure()
             plt.ylim((0, 1))
             plt.grid()
@@ -11,6 +11,7 @@ if True:
     from ._py.Memory import *
     from ._py.Link import *
     from ._py.Table import *
+    from ._py.DerivationFilter import *
     from ._py.Link import *
 else:
     # import from _pyx
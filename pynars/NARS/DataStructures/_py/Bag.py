@@ -3,13 +3,16 @@ import random
 import math
 from depq import DEPQ
 from pynars.Config import Config
+from pynars import Global
 from pynars.Narsese import Item, Task
 from pynars.NAL.Functions.BudgetFunctions import *
-from typing import Union
+from typing import Iterator, Union
+from .SumTree import SumTree
+from .BudgetStore import BudgetStore
+import numpy as np
 
 
 class Bag:
-    # TODO: Re-implement this DataStructure, in order to optimize the complexity.
     class LUT:
         def __init__(self, *args, **kwargs):
             self.lut = OrderedDict(*args, **kwargs)
@@ -32,20 +35,94 @@ class Bag:
         def __len__(self):
             return len(self.lut)
 
-    def __init__(self, capacity: int, n_buckets: int = None, take_in_order: bool = True) -> None:
+    class Level:
+        '''
+        A bucket of items with the same priority level, in the order they are put.
+        The items are stored in a list, and the slot of each item is indexed by its key, so that an item is removed in O(1) by leaving a hole in its slot; the list is compacted once there are more holes than items, so that the first, the last and a random item are still found in O(1) (expected).
+        '''
+        __slots__ = ('items', 'slots', 'head')
+
+        def __init__(self) -> None:
+            self.items = []
+            self.slots = {}
+            self.head = 0 # the slot of the first item
+
+        def append(self, item: Item):
+            self.slots[hash(item)] = len(self.items)
+            self.items.append(item)
+
+        def pop(self, idx: int = -1) -> Item:
+            item = self[idx]
+            self.remove(item)
+            return item
+
+        def remove(self, item: Item) -> Item:
+            items = self.items
+            items[self.slots.pop(hash(item))] = None
+            n_items = len(self.slots)
+            if n_items == 0:
+                items.clear()
+                self.head = 0
+                return item
+            while items[-1] is None: items.pop()
+            head = self.head
+            while items[head] is None: head += 1
+            self.head = head
+            if len(items) - n_items > n_items: self._compact()
+            return item
+
+        def sample(self, rnd: float) -> Item:
+            '''a random item, where `rnd` is in [0, 1), and another random number is drawn each time a hole is hit.'''
+            items, head = self.items, self.head
+            while True:
+                item = items[head + int(rnd * (len(items) - head))]
+                if item is not None: return item
+                rnd = random.random()
+
+        def _compact(self):
+            self.items = items = [item for item in self.items if item is not None]
+            self.slots = {hash(item): slot for slot, item in enumerate(items)}
+            self.head = 0
+
+        def __contains__(self, item: Item) -> bool:
+            return hash(item) in self.slots
+
+        def __getitem__(self, idx: int) -> Item:
+            if idx == 0: return self.items[self.head]
+            if idx == -1: return self.items[-1]
+            if len(self.items) - self.head == len(self.slots): return self.items[self.head:][idx]
+            return list(self)[idx]
+
+        def __iter__(self):
+            return (item for item in self.items[self.head:] if item is not None)
+
+        def __len__(self):
+            return len(self.slots)
+
+        def __repr__(self) -> str:
+            return f"<{self.__class__.__name__}: #items={len(self)}>"
+
+    def __init__(self, capacity: int, n_buckets: int = None, take_in_order: bool = True, sum_tree: bool = False, budget_store: bool = False, lazy_forget: bool = None) -> None:
         '''
         Args:
             capacity (int): the maximum number of items.
             n_buckets (int): the number of buckets.
             take_in_order (bool): if True, an item is taken out in order within a bucket, otherwise a random item is taken out.
+            sum_tree (bool): if True, `take` draws an item with the probability exactly proportional to its priority, by a sum-tree over the priorities of the items; otherwise, the levels are visited in turn and a level is left with the probability `1-level/n_levels`.
+            budget_store (bool): if True, the budgets of the items are stored as arrays in a `BudgetStore` while they are in the bag, so that `decay_all` and `forget_all` are done in a single vectorized pass.
+            lazy_forget (bool): if True, an item is forgotten by the cycles elapsed since it was last touched (see `forget`), whenever it is read or put, rather than decayed each time it is put back. If None, `Config.lazy_forget` is used.
         '''
         self.capacity = capacity
         self.pointer = 0  # Pointing to the Bag's current bucket number
         self.take_in_order = take_in_order
         self.item_lut = self.LUT()  # look up table
+        self.level_lut = {}  # the level where each item is, indexed by the hash value of the item
         self.n_levels = n_buckets if n_buckets is not None else Config.num_buckets
-        self.levels = tuple(list() for i in range(self.n_levels))  # initialize buckets between 0 and capacity
-        # self.buckets = self.Depq(maxlen=self.n_buckets)
+        self.levels = [_empty_level]*self.n_levels  # the buckets between 0 and capacity are allocated on demand
+        self.occupancy = 0  # a bitmap, where the i-th bit is set iff the i-th level is not empty
+        self.sum_tree = SumTree(min(capacity, 1024)) if sum_tree else None
+        self.budget_store = BudgetStore(min(capacity, 1024)) if budget_store else None
+        self.lazy_forget = lazy_forget if lazy_forget is not None else Config.lazy_forget
         n_digits = int(math.log10(self.n_levels)) + 3
 
         def map_priority(priority: float):
@@ -57,41 +134,48 @@ class Bag:
     def take(self, remove = True) -> Item:
         if len(self) == 0: return None
 
+        if self.sum_tree is not None:
+            item = self.sum_tree.sample(random.random())
+            if item is not None:
+                if remove: self.take_by_key(item, remove=True)
+                elif self.lazy_forget: self._forget_in_bag(item)
+                return item
+            # Now, all the items are with zero priority, and they are taken by levels.
+
         if self._is_current_level_empty():
             self._move_to_next_nonempty_level()
 
+        level = self.levels[self.pointer]
         if self.take_in_order:
             # take the first item from the current bucket
-            idx = 0
+            item = level[0]
         else:
             # take an item randomly from the current bucket
-            rnd = random.random()
-            cnt = len(self.levels[self.pointer])
-            idx = int(rnd * cnt)
+            item = level.sample(random.random())
 
         if remove:
-            bucket: list = self.levels[self.pointer]
-            item = bucket.pop(idx)
-            self.item_lut.pop(item)
-        else:
-            item = self.levels[self.pointer][idx]
+            self._pop_from_level(self.pointer, item)
 
         bucket_probability = self.pointer / self.n_levels
         rnd = random.random()  # [0.0, 1.0)
         if rnd > bucket_probability:
             self._move_to_next_nonempty_level()
 
+        if self.lazy_forget:
+            if remove: Bag.forget(item)
+            else: self._forget_in_bag(item)
         return item
 
     def take_by_key(self, key, remove = True) -> Union[Item, None]:
         if remove:
             item: Item = self.item_lut.pop(key)
             if item is not None:
-                bucket = self.levels[self.map_priority(item.budget.priority)]
-                if item in bucket:
-                    bucket.remove(item)
+                self._remove_from_level(item, self.level_lut.pop(hash(item)))
+                if self.budget_store is not None: self.budget_store.remove(item)
+                if self.lazy_forget: Bag.forget(item)
         else:
             item = self.item_lut.get(key, None)
+            if item is not None and self.lazy_forget: self._forget_in_bag(item)
         return item
 
     def take_min(self, remove = True) -> Item:
@@ -102,8 +186,10 @@ class Bag:
         if not remove:
             item = self.levels[pointer][0]
         else:
-            item = self.levels[pointer].pop(0)
-            self.item_lut.pop(item)
+            item = self._pop_from_level(pointer, self.levels[pointer][0])
+        if self.lazy_forget:
+            if remove: Bag.forget(item)
+            else: self._forget_in_bag(item)
         return item
 
     def take_max(self, remove = True) -> Item:
@@ -111,43 +197,60 @@ class Bag:
         if len(self) == 0:
             return None
         pointer = self._get_max_nonempty_level()
-        item = self.levels[pointer][-1]
         if not remove:
             item = self.levels[pointer][-1]
         else:
-            item = self.levels[pointer].pop()
-            self.item_lut.pop(item)
+            item = self._pop_from_level(pointer, self.levels[pointer][-1])
+        if self.lazy_forget:
+            if remove: Bag.forget(item)
+            else: self._forget_in_bag(item)
         return item
 
+    def peek(self) -> Iterator[Item]:
+        '''iterate over the items from the highest priority level to the lowest, without taking them out of the bag. The bag should not be modified during the iteration.'''
+        occupancy = self.occupancy
+        while occupancy:
+            pointer = occupancy.bit_length() - 1
+            yield from self.levels[pointer]
+            occupancy &= ~(1 << pointer)
+
+    def touch(self, item: Item):
+        '''update an item which has been used without being taken out, as if it were taken out and put back, i.e., it is decayed (or forgotten, in the lazy forgetting mode) and moved to the level of its current priority.'''
+        if self.lazy_forget: Bag.forget(item)
+        else: Bag.decay(item)
+        self._update_level(item)
+
     def put(self, item: Item):
         item_popped = None
-        old_item: Item = self.take_by_key(item, remove=False)
+        old_item: Item = self.item_lut.get(item, None)
+        if self.lazy_forget:
+            Bag.forget(item)
+            if old_item is not None and old_item is not item: Bag.forget(old_item)
         if old_item is not None:
             Budget_merge(old_item.budget, item.budget)
+            self._update_level(old_item)
             return item_popped
         pointer_new = self.map_priority(item.budget.priority)
         if len(self.item_lut) >= self.capacity:
             pointer = self._get_min_nonempty_level()
             if pointer_new >= pointer:
-                bucket = self.levels[self.pointer]
-                if len(bucket) > 0:
-                    item_lowest = bucket.pop(0)
-                    self.item_lut.pop(item_lowest)
-                    item_popped = item_lowest
+                item_popped = self._pop_from_level(pointer, self.levels[pointer][0])
             else:
                 item_popped = item
                 return item_popped
 
         self.item_lut[item] = item
-        level: list = self.levels[pointer_new]
-        level.append(item)
+        if self.budget_store is not None: self.budget_store.add(item)
+        self._add_to_level(item, pointer_new)
 
         return item_popped
 
     def put_back(self, item: Item):
         ''''''
         # return putIn(oldItem);
-        Bag.decay(item)
+        if not self.lazy_forget:
+            Bag.decay(item)
+        # otherwise, the item has been forgotten when it was read, and will be forgotten again when it is put.
         self.put(item)
 
     @classmethod
@@ -156,6 +259,45 @@ class Bag:
         # item.budget.decay()
         Budget_decay(item.budget)
 
+    @classmethod
+    def forget(cls, item: Item):
+        '''Forget the item by the cycles elapsed since it was last touched, which is used in the lazy forgetting mode.'''
+        n_cycles = Global.time - item.t_touched
+        if n_cycles > 0:
+            Budget_forget(item.budget, n_cycles)
+        item.t_touched = Global.time
+
+    def decay_all(self):
+        '''Decay all the items in the bag, as `put_back` does for a single item.'''
+        if self.budget_store is None:
+            for item in list(self):
+                Bag.decay(item)
+                self._update_level(item)
+            return
+        slots, priority_old = self.budget_store.decay()
+        self._update_levels(slots, priority_old)
+
+    def forget_all(self):
+        '''
+        Forget all the items in the bag by the cycles elapsed since each of them was last touched, as `forget` does for a single item, and move them to the levels of their new priorities.
+        In the lazy forgetting mode, this only brings forward the forgetting done when the items are read, so that the items not read for long sink to the lower levels; otherwise, the items are forgotten by time on top of the decay when they are put back.
+        With a `BudgetStore`, the budgets are forgotten in a single vectorized pass.
+        '''
+        t_now = Global.time
+        if self.budget_store is None:
+            for item in list(self):
+                if item.t_touched == t_now: continue
+                Bag.forget(item)
+                self._update_level(item)
+            return
+        items = self.budget_store.items
+        slots = np.flatnonzero(self.budget_store.used)
+        slots_list = slots.tolist()
+        t_touched = np.fromiter((items[slot].t_touched for slot in slots_list), dtype=float, count=len(slots_list))
+        priority_old = self.budget_store.forget(slots, t_now - t_touched)
+        for slot in slots_list: items[slot].t_touched = t_now
+        self._update_levels(slots, priority_old)
+
     @classmethod
     def merge(cls, item_base: Item, item_merged: Item):
         Budget_merge(item_base.budget, item_merged.budget)
@@ -172,44 +314,107 @@ class Bag:
     def __len__(self):
         return len(self.item_lut)
 
+    def _add_to_level(self, item: Item, pointer: int):
+        level = self.levels[pointer]
+        if level is _empty_level:
+            level = self.levels[pointer] = self.Level()
+        level.append(item)
+        self.level_lut[hash(item)] = pointer
+        self.occupancy |= (1 << pointer)
+        if self.sum_tree is not None: self.sum_tree.add(item, item.budget.priority)
+
+    def _remove_from_level(self, item: Item, pointer: int):
+        level = self.levels[pointer]
+        level.remove(item)
+        if len(level) == 0:
+            self.occupancy &= ~(1 << pointer)
+        if self.sum_tree is not None: self.sum_tree.remove(item)
+
+    def _pop_from_level(self, pointer: int, item: Item) -> Item:
+        '''Remove the item, which is at the level `pointer`, from the bag.'''
+        level = self.levels[pointer]
+        level.remove(item)
+        if len(level) == 0:
+            self.occupancy &= ~(1 << pointer)
+        if self.sum_tree is not None: self.sum_tree.remove(item)
+        self.item_lut.pop(item)
+        self.level_lut.pop(hash(item))
+        if self.budget_store is not None: self.budget_store.remove(item)
+        return item
+
+    def _update_level(self, item: Item):
+        '''Move the item to the level corresponding to its current priority, in case that its budget has been changed in the bag.'''
+        pointer_old = self.level_lut[hash(item)]
+        pointer_new = self.map_priority(item.budget.priority)
+        if pointer_new != pointer_old:
+            self._remove_from_level(item, pointer_old)
+            self._add_to_level(item, pointer_new)
+        elif self.sum_tree is not None:
+            self.sum_tree.update(item, item.budget.priority)
+
+    def _update_levels(self, slots: np.ndarray, priority_old: np.ndarray):
+        '''The vectorized version of `_update_level`, for the items at the slots of the `BudgetStore`, whose priorities were `priority_old`.'''
+        priority_new = self.budget_store.priority[slots]
+        pointers_new = self._map_priorities(priority_new)
+        # only the items whose levels are changed are moved.
+        moved = self._map_priorities(priority_old) != pointers_new
+        items = self.budget_store.items
+        level_lut = self.level_lut
+        for slot, pointer_new in zip(slots[moved].tolist(), pointers_new[moved].tolist()):
+            item = items[slot]
+            pointer_old = level_lut[hash(item)]
+            if pointer_new != pointer_old:
+                self._remove_from_level(item, pointer_old)
+                self._add_to_level(item, pointer_new)
+        if self.sum_tree is not None:
+            for slot, priority in zip(slots.tolist(), priority_new.tolist()):
+                self.sum_tree.update(items[slot], priority)
+
+    def _forget_in_bag(self, item: Item):
+        '''Forget an item which stays in the bag, and move it to the level of its new priority.'''
+        if item.t_touched == Global.time: return
+        Bag.forget(item)
+        self._update_level(item)
+
+    def _map_priorities(self, priorities: np.ndarray):
+        '''The vectorized version of `map_priority`.'''
+        n_digits = int(math.log10(self.n_levels)) + 3
+        idxs = np.round(priorities * self.n_levels, n_digits).astype(int)
+        return np.minimum(idxs, self.n_levels - 1)
+
     def _is_current_level_empty(self):
-        return len(self.levels[self.pointer]) == 0
+        return not (self.occupancy >> self.pointer) & 1
 
     def _move_to_next_nonempty_level(self):
+        '''Move the pointer upward to the next non-empty level; if there is none above, wrap around to the lowest one.'''
         if len(self) == 0: return
-        self._move_upward_to_next_level()
-        while len(self.levels[self.pointer]) == 0:
-            self._move_upward_to_next_level()
+        occupancy_upper = self.occupancy >> (self.pointer + 1)
+        if occupancy_upper:
+            self.pointer += 1 + _lowest_bit(occupancy_upper)
+        else:
+            self.pointer = _lowest_bit(self.occupancy)
 
     def _move_to_max_nonempty_level(self):
         if len(self) == 0: return
-        self.pointer = self.n_levels - 1
-        while len(self.levels[self.pointer]) == 0:
-            self._move_down_to_next_level()
+        self.pointer = self._get_max_nonempty_level()
+
+    def _move_to_min_nonempty_level(self):
+        if len(self) == 0: return
+        self.pointer = self._get_min_nonempty_level()
 
     def _get_min_nonempty_level(self):
-        pointer_cache = self.pointer
-        self._move_to_min_nonempty_level()
-        pointer = self.pointer
-        self.pointer = pointer_cache
-        return pointer
+        return _lowest_bit(self.occupancy)
 
     def _get_max_nonempty_level(self):
-        pointer_cache = self.pointer
-        self._move_to_max_nonempty_level()
-        pointer = self.pointer
-        self.pointer = pointer_cache
-        return pointer
+        return self.occupancy.bit_length() - 1
 
-    def _move_to_min_nonempty_level(self):
-        self.pointer = 0
-        self._move_to_next_nonempty_level()
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: #items={len(self)}, #levels={len(self.levels)}, capacity={self.capacity}>"
 
-    def _move_down_to_next_level(self):
-        self.pointer = (self.pointer - 1) % self.n_levels
 
-    def _move_upward_to_next_level(self):
-        self.pointer = (self.pointer + 1) % self.n_levels
+_empty_level = Bag.Level()  # shared by all the levels which have never been used, and never modified
 
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}: #items={len(self)}, #levels={len(self.levels)}, capacity={self.capacity}>"
+
+def _lowest_bit(bitmap: int):
+    '''The index of the lowest set bit of a non-zero bitmap.'''
+    return (bitmap & -bitmap).bit_length() - 1
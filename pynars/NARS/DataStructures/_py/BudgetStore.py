@@ -0,0 +1,135 @@
+import numpy as np
+from pynars.Narsese import Item, Budget
+from pynars.NAL.Functions.BudgetFunctions import Budget_decay_array, Budget_forget_array
+
+
+class BudgetView(Budget):
+    '''
+    A budget whose values are held by a `BudgetStore`, at the slot assigned to the item owning the budget.
+    When the item leaves the store, the view turns back into an ordinary `Budget` in place, so that the references to it remain valid.
+    '''
+    __slots__ = ()
+
+    # the store and the slot are kept in the storage of the priority and the durability of the base class, which the view does not use, so that an ordinary budget need not have room for them.
+    _store = property(Budget.priority.__get__, Budget.priority.__set__)
+    _slot = property(Budget.durability.__get__, Budget.durability.__set__)
+
+    def __init__(self, store: 'BudgetStore', slot: int):
+        self._store = store
+        self._slot = slot
+
+    @property
+    def priority(self) -> float:
+        return self._store.priority[self._slot]
+
+    @priority.setter
+    def priority(self, value: float):
+        self._store.priority[self._slot] = value
+
+    @property
+    def durability(self) -> float:
+        return self._store.durability[self._slot]
+
+    @durability.setter
+    def durability(self, value: float):
+        self._store.durability[self._slot] = value
+
+    @property
+    def quality(self) -> float:
+        return self._store.quality[self._slot]
+
+    @quality.setter
+    def quality(self, value: float):
+        self._store.quality[self._slot] = value
+
+    def __reduce__(self):
+        # a copy of the view is an ordinary budget, rather than a copy of the whole store.
+        return (Budget, (float(self.priority), float(self.durability), float(self.quality)))
+
+
+class BudgetStore:
+    '''
+    The budgets of the items in a bag, stored as a struct of arrays (priorities, durabilities and qualities), each item being assigned a slot.
+    While an item is in the store, its budget is a `BudgetView` of its slot, so that the budgets of all the items can be processed in a single vectorized pass.
+    '''
+
+    def __init__(self, n_slots: int = 16) -> None:
+        self.n_slots = max(n_slots, 1)
+        self.priority = np.zeros(self.n_slots)
+        self.durability = np.zeros(self.n_slots)
+        self.quality = np.zeros(self.n_slots)
+        self.used = np.zeros(self.n_slots, dtype=bool)
+        self.items = [None]*self.n_slots
+        self.slots_free = list(range(self.n_slots-1, -1, -1))
+
+    def add(self, item: Item):
+        '''Assign a slot to the item, and replace its budget by a view of the slot.'''
+        if len(self.slots_free) == 0: self._grow()
+        slot = self.slots_free.pop()
+        budget = item.budget
+        self.priority[slot] = budget.priority
+        self.durability[slot] = budget.durability
+        self.quality[slot] = budget.quality
+        self.used[slot] = True
+        self.items[slot] = item
+        if isinstance(budget, BudgetView):
+            # the budget is held by another store, so the item gets a budget of its own.
+            budget = Budget(budget.priority, budget.durability, budget.quality)
+            item.set_budget(budget)
+        budget.__class__ = BudgetView
+        BudgetView.__init__(budget, self, slot)
+
+    def remove(self, item: Item):
+        '''Free the slot of the item, and turn its budget back into an ordinary one.'''
+        budget: BudgetView = item.budget
+        slot = budget._slot
+        priority = float(self.priority[slot])
+        durability = float(self.durability[slot])
+        quality = float(self.quality[slot])
+        budget.__class__ = Budget
+        Budget.__init__(budget, priority, durability, quality)
+        self.priority[slot] = 0.0
+        self.used[slot] = False
+        self.items[slot] = None
+        self.slots_free.append(slot)
+
+    def decay(self):
+        '''
+        Decay the budgets of all the items in the store, by `Budget_decay_array`.
+
+        Returns:
+            slots (np.ndarray): the slots of the items.
+            priority_old (np.ndarray): the priorities of the items before decaying.
+        '''
+        slots = np.flatnonzero(self.used)
+        priority_old = self.priority[slots]
+        self.priority[slots] = Budget_decay_array(priority_old, self.durability[slots], self.quality[slots])
+        return slots, priority_old
+
+    def forget(self, slots: np.ndarray, n_cycles: np.ndarray):
+        '''
+        Forget the budgets of the items at the slots by the cycles elapsed, by `Budget_forget_array`.
+
+        Returns:
+            priority_old (np.ndarray): the priorities of the items before forgetting.
+        '''
+        priority_old = self.priority[slots]
+        self.priority[slots] = Budget_forget_array(priority_old, self.durability[slots], self.quality[slots], n_cycles)
+        return priority_old
+
+    def _grow(self):
+        '''Double the number of slots.'''
+        n_slots_old = self.n_slots
+        self.n_slots = n_slots = 2*n_slots_old
+        self.priority = np.concatenate((self.priority, np.zeros(n_slots_old)))
+        self.durability = np.concatenate((self.durability, np.zeros(n_slots_old)))
+        self.quality = np.concatenate((self.quality, np.zeros(n_slots_old)))
+        self.used = np.concatenate((self.used, np.zeros(n_slots_old, dtype=bool)))
+        self.items.extend([None]*n_slots_old)
+        self.slots_free.extend(range(n_slots-1, n_slots_old-1, -1))
+
+    def __len__(self):
+        return self.n_slots - len(self.slots_free)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: #items={len(self)}, #slots={self.n_slots}>"
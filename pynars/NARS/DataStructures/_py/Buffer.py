@@ -1,6 +1,9 @@
 from .Bag import Bag
+from .TimingWheel import TimingWheel
 from pynars.Config import Config
-from pynars.Narsese import Item
+from pynars.Narsese import Item, Task
+from pynars import Global
+from typing import Union
 
 class Buffer(Bag):
     '''
@@ -20,10 +23,61 @@ class Buffer(Bag):
         existing concepts in the memory or tasks in the buffer.
     '''
 
-    def __init__(self, capacity: int, n_buckets: int=None, take_in_order: bool=False, max_duration: int=None) -> None:
-        Bag.__init__(self, capacity, n_buckets=n_buckets, take_in_order=take_in_order)
+    def __init__(self, capacity: int, n_buckets: int=None, take_in_order: bool=False, max_duration: int=None, sum_tree: bool=None) -> None:
+        sum_tree = sum_tree if sum_tree is not None else Config.sum_tree_buffer
+        Bag.__init__(self, capacity, n_buckets=n_buckets, take_in_order=take_in_order, sum_tree=sum_tree)
         self.max_duration = max_duration if max_duration is not None else Config.max_duration
+        self.timing_wheel = TimingWheel(Global.time)
+        self.expiry_lut = {}  # the cycle when each task expires, and the task, indexed by the hash value of the task
 
+    def put(self, task: Task):
+        self.expire()
+        is_new = task not in self
+        task_popped = Bag.put(self, task)
+        if is_new and task_popped is not task:
+            # The time when a task is put is recorded by the buffer itself rather than in the stamp, which may be shared with other tasks, or copied from a premise put long ago.
+            key = hash(task)
+            entry = self.expiry_lut.get(key)
+            if entry is None or entry[1] is not task: # otherwise, the task has been scheduled when it was put before, and is not renewed.
+                t_expiry = Global.time + self.max_duration + 1
+                self.expiry_lut[key] = (t_expiry, task)
+                self.timing_wheel.add(t_expiry, task)
+        return task_popped
+
+    def put_time(self, task: Task) -> Union[int, None]:
+        '''the time when the task was put into the buffer, or `None` if it is not scheduled to expire in the buffer.'''
+        entry = self.expiry_lut.get(hash(task))
+        if entry is None or entry[1] is not task: return None
+        return entry[0] - self.max_duration - 1
+
+    def take(self, remove = True) -> Union[Task, None]:
+        self.expire()
+        return Bag.take(self, remove)
+
+    def take_by_key(self, key, remove = True) -> Union[Task, None]:
+        self.expire()
+        return Bag.take_by_key(self, key, remove)
+
+    def take_min(self, remove = True) -> Union[Task, None]:
+        self.expire()
+        return Bag.take_min(self, remove)
+
+    def take_max(self, remove = True) -> Union[Task, None]:
+        self.expire()
+        return Bag.take_max(self, remove)
+
+    def expire(self):
+        '''
+        Remove the tasks which are expired, i.e., which were put into a buffer more than `max_duration` cycles ago (see `is_expired`), so that they are never taken out.
+        The tasks are scheduled by a timing wheel, so that no scan over the buffer is needed.
+        '''
+        for t_expiry, task in self.timing_wheel.advance(Global.time):
+            key = hash(task)
+            entry = self.expiry_lut.get(key)
+            if entry is None or entry[0] != t_expiry or entry[1] is not task: continue # another task of the same key has been scheduled with another expiry time.
+            del self.expiry_lut[key]
+            if self.item_lut.get(task) is task:
+                Bag.take_by_key(self, task, remove=True)
 
     def is_expired(self, put_time, current_time):
         return (current_time - put_time) > self.max_duration
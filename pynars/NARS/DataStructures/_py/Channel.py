@@ -25,6 +25,10 @@ class NarseseChannel(Channel):
         
         task_overflow = Buffer.put(self, task)
         return True, task, task_overflow
+
+    def put_task(self, task: Task):
+        '''put a task which has been parsed, e.g., by `Reasoner.ingest`.'''
+        return Buffer.put(self, task)
             
             
     
\ No newline at end of file
@@ -33,6 +33,7 @@ class Concept(Item):
 
 
     def __init__(self, term: Term, budget: Budget, capacity_table: int=None) -> None:
+        term = term.intern()
         super().__init__(hash(term), budget)
         self._term = term
 
@@ -47,15 +48,12 @@ class Concept(Item):
         self.desire_table = Table(capacity_table) 
         self.question_table = Table(capacity_table)
         self.quest_table = Table(capacity_table)
-        self.term_links = Bag(capacity_term_link_bag, nlevels_term_link_bag)
-        self.task_links = Bag(capacity_task_link_bag, nlevels_task_link_bag)
+        self.term_links = Bag(capacity_term_link_bag, nlevels_term_link_bag, sum_tree=Config.sum_tree_term_link)
+        self.task_links = Bag(capacity_task_link_bag, nlevels_task_link_bag, sum_tree=Config.sum_tree_task_link)
 
         self.executable_preconditions = Table(capacity_table)
         self.general_executable_preconditions = Table(capacity_table)
 
-        self.task_links = Bag(Config.capacity_task_link, Config.nlevels_task_link)
-        self.term_links = Bag(Config.capacity_term_link, Config.nlevels_term_link)
-
         # self._cache_subterms()
         # self.accept(task)
 
@@ -91,21 +89,13 @@ class Concept(Item):
         '''
         Select a belief with highest quality, within the belief_table, according to the task
         '''
-        belief_table: List[Task] = self.belief_table
-        if len(belief_table) == 0: return None
-        qualities = [(calculate_solution_quality(sentence, task.sentence), task) for task in belief_table]
-        _, item_max = max(qualities, key=lambda quality: quality[0])
-        return item_max
+        return self.belief_table.best_match(sentence)
         
     def match_desire(self, goal: Goal) -> Task:
         '''
         Select a desire with highest quality, within the desire_table, according to the task
         '''
-        desire_table: List[Tuple[Task, float]] = self.desire_table
-        if len(desire_table) == 0: return None
-        qualities = [(calculate_solution_quality(goal, task.sentence), task) for task in desire_table]
-        _, item_max = max(qualities, key=lambda quality: quality[0])
-        return item_max
+        return self.desire_table.best_match(goal)
         
     def add_belief(self, task: Task) -> Union[Judgement, None]:
         ''''''
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from typing import Hashable, Iterable, List
+
+from pynars import Global
+from pynars.Config import Config
+from pynars.Narsese import Task
+from .Buffer import Buffer
+
+
+class DerivationFilter:
+    '''
+    A bounded record of the tasks derived recently, by which a task derived again is recognized as a duplicate before it is put into the internal experience.
+    A task is keyed by the ID of its term (see `TermTable`), the punctuation, the truth-value quantized by `Config.truth_epsilon`, the occurrence time and the hash of the evidential base, so that a duplicate carries the same conclusion from the same evidence as the task seen.
+    If the task seen is still in the buffer, the duplicate is merged into it, i.e., its budget is merged into that of the task seen (see `Budget_merge`), just as it would be by putting the duplicate into the buffer; otherwise, the task seen has been taken out of the buffer, and accepted by the memory, so the duplicate is dropped.
+    A key is forgotten after `duration` cycles, so that a conclusion derived again later is let through, and the earliest keys are forgotten first when there are more than `capacity` of them.
+    '''
+    def __init__(self, capacity: int, duration: int) -> None:
+        self.capacity = capacity
+        self.duration = duration
+        self._seen: OrderedDict = OrderedDict() # key -> (the time when the key is seen, the task seen); the keys are in the order of the time.
+        self.n_passed = 0
+        self.n_merged = 0
+        self.n_dropped = 0
+
+    @staticmethod
+    def key(task: Task) -> Hashable:
+        truth = task.truth
+        stamp = task.stamp
+        return (
+            hash(task.term), task.sentence.punct,
+            (round(truth.f/Config.truth_epsilon), round(truth.c/Config.truth_epsilon)) if truth is not None else None,
+            stamp.t_occurrence, hash(stamp.evidential_base)
+        )
+
+    def filter(self, tasks: Iterable[Task], buffer: Buffer = None) -> List[Task]:
+        '''
+        the tasks which are not duplicates of those seen in the last `duration` cycles, nor of each other.
+        The duplicates whose tasks seen are still in `buffer` are merged into them.
+        '''
+        t_now = Global.time
+        seen = self._seen
+        # forget the keys seen too long ago
+        t_expired = t_now - self.duration
+        while len(seen) > 0 and next(iter(seen.values()))[0] <= t_expired:
+            seen.popitem(last=False)
+
+        tasks_passed = []
+        for task in tasks:
+            key = self.key(task)
+            entry = seen.get(key, None)
+            if entry is not None:
+                task_seen = entry[1]
+                if buffer is not None and buffer.item_lut.get(task_seen, None) is task_seen:
+                    buffer.put(task)
+                    self.n_merged += 1
+                else:
+                    self.n_dropped += 1
+                continue
+            seen[key] = (t_now, task)
+            if len(seen) > self.capacity: seen.popitem(last=False)
+            tasks_passed.append(task)
+        self.n_passed += len(tasks_passed)
+        return tasks_passed
+
+    def clear(self):
+        self._seen.clear()
+        self.n_passed = self.n_merged = self.n_dropped = 0
+
+    def info(self):
+        return dict(passed=self.n_passed, merged=self.n_merged, dropped=self.n_dropped, size=len(self._seen), capacity=self.capacity, duration=self.duration)
+
+    def __contains__(self, task: Task) -> bool:
+        return self.key(task) in self._seen
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __repr__(self) -> str:
+        return f'<DerivationFilter: passed={self.n_passed}, merged={self.n_merged}, dropped={self.n_dropped}, size={len(self)}/{self.capacity}>'
@@ -31,16 +31,18 @@ class LinkType(Enum):
 
 
 class Link(Item):
-    link_id = 0
-    type: LinkType = None
+    __slots__ = ('link_id', 'component_index', 'source', 'target', 'source_is_component', 'type')
+
+    n_links = 0 # the number of links having been built, which gives the `link_id` of a new link.
+    type: LinkType
     component_index: List[List[int]] # TODO: refer to OpenNARS 3.0.4, TermLink.java line 75 and TaskLink.java line 85. But why use it?
     def __init__(self, source: Type['Concept'], target: Task, budget: Budget, source_is_component: bool=None, copy_budget=True, index: list=None) -> None:
-        self.link_id = Link.link_id
+        self.link_id = Link.n_links
         self.component_index = tuple(index)
 
         hash_value = hash((source, target, self.component_index))
         super().__init__(hash_value, budget=budget,copy_budget=copy_budget)
-        Link.link_id += 1
+        Link.n_links += 1
         
         self.source: Type['Concept'] = source
         self.target: Task = target
@@ -150,39 +152,15 @@ class Link(Item):
     #     return _get_index(term_component, term_compound, [])
 
 
-    # This is another implementation of `get_index` (,it may be a better one).
     @classmethod
-    def get_index(cls, main_term: Union[Term, Statement, Compound], sub_term: Union[Term, Statement, Compound], index=None, indices=None):
-        '''This function is temporary. The index of a term within another term should be obtained when constructing the latter one.'''
-
-        if sub_term not in main_term: return None
-
-        indices = [] if indices is None else indices
-        index = [] if index is None else index
-
-        if main_term == sub_term: 
-            return indices.append(index)
-        
-        
-        # if main_term.is_statement:
-        #     if sub_term in main_term[0]: idx = 0
-        #     elif sub_term in main_term[1]: idx = 1
-        #     else: raise "Invalid case."
-        #     index.append(idx)
-        #     cls.get_index(main_term.terms[idx], sub_term, index, indices)
-        if main_term.is_compound or main_term.is_statement:
-            if sub_term in main_term:
-                for idx, term in enumerate(main_term.terms):
-                    # idx = main_term.terms.index(sub_term)
-                    if sub_term in term:
-                        index_copy = copy(index)
-                        index_copy.append(idx)
-                        cls.get_index(term, sub_term, index_copy, indices)
-        # elif main_term.is_atom:
-        #     pass
-        else: raise "Invalid case."
-
-        return indices
+    def get_index(cls, main_term: Union[Term, Statement, Compound], sub_term: Union[Term, Statement, Compound]):
+        '''
+        Get the indices of `sub_term` within `main_term`, which have been obtained when constructing `main_term`, see `Term.get_positions`.
+        The indices are `[[]]` if `sub_term` is `main_term` itself (see `test_get_index_5`), and `None` if `sub_term` is not within `main_term`. The callers building links (see `Concept`) only pass the components of `main_term`, so they never get either.
+        '''
+        positions = main_term.get_positions(sub_term)
+        if positions is None: return None
+        return [list(position) for position in positions]
 
     @classmethod
     def update_budget(cls, budget: Budget, q: float, p_belief: float):
@@ -201,6 +179,8 @@ class Link(Item):
 
 
 class TermLink(Link):
+    __slots__ = ()
+
     def __init__(self, source: Type['Concept'], target: Task, budget: Budget, source_is_component: bool=None, copy_budget=True, index: list=None) -> None:
         super().__init__(source, target, budget, source_is_component, copy_budget=copy_budget, index=index)
 
@@ -224,6 +204,8 @@ class TermLink(Link):
         return f'{self.budget} {self.source.term} --- {self.target.term}, {"+" if self.source_is_component else "-"}{self.component_index}'
 
 class TaskLink(Link):
+    __slots__ = ()
+
     def __init__(self, source: Type['Concept'], target: Type['Concept'], budget: Budget, copy_budget=True, index: list=None) -> None:
         super().__init__(source, target, budget, True, copy_budget=copy_budget, index=index)
 
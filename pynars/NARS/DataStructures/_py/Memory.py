@@ -1,4 +1,4 @@
-from pynars.Config import Enable
+from pynars.Config import Config, Enable
 from pynars.NAL.Functions.Tools import revisible
 from pynars.NAL.Inference import local__revision
 from pynars.NAL.Inference.LocalRules import solution_query, solution_question
@@ -14,8 +14,10 @@ from .Concept import Concept
 # from pynars.NARS import Operation
 
 class Memory:
-    def __init__(self, capacity: int, n_buckets: int = None, take_in_order: bool = False, output_buffer = None) -> None:
-        self.concepts = Bag(capacity, n_buckets=n_buckets, take_in_order=take_in_order)
+    def __init__(self, capacity: int, n_buckets: int = None, take_in_order: bool = False, output_buffer = None, sum_tree: bool = None, budget_store: bool = None) -> None:
+        sum_tree = sum_tree if sum_tree is not None else Config.sum_tree_memory
+        budget_store = budget_store if budget_store is not None else Config.budget_store_memory
+        self.concepts = Bag(capacity, n_buckets=n_buckets, take_in_order=take_in_order, sum_tree=sum_tree, budget_store=budget_store)
         self.output_buffer = output_buffer
 
     def accept(self, task: Task):
@@ -0,0 +1,84 @@
+from pynars.Narsese import Item
+from typing import Union
+
+
+class SumTree:
+    '''
+    A binary tree over the priorities of items, where each inner node holds the sum of its children.
+    Each item is assigned a leaf (slot). Adding, removing and updating an item, as well as drawing an item with the probability proportional to its priority, cost O(log n).
+
+    The tree is stored in a flat list: the root is at index 1, the children of node `i` are at `2i` and `2i+1`, and the leaves are at `[n_slots, 2*n_slots)`.
+    '''
+
+    def __init__(self, n_slots: int = 16) -> None:
+        self.n_slots = 1
+        while self.n_slots < n_slots: self.n_slots <<= 1
+        self.tree = [0.0]*(2*self.n_slots)
+        self.items = [None]*self.n_slots
+        self.slot_lut = {}  # the slot of each item, indexed by the hash value of the item
+        self.slots_free = list(range(self.n_slots-1, -1, -1))
+
+    @property
+    def total(self) -> float:
+        return self.tree[1]
+
+    def add(self, item: Item, priority: float):
+        if len(self.slots_free) == 0: self._grow()
+        slot = self.slots_free.pop()
+        self.items[slot] = item
+        self.slot_lut[hash(item)] = slot
+        self._set(slot, priority)
+
+    def remove(self, item: Item):
+        slot = self.slot_lut.pop(hash(item))
+        self.items[slot] = None
+        self._set(slot, 0.0)
+        self.slots_free.append(slot)
+
+    def update(self, item: Item, priority: float):
+        self._set(self.slot_lut[hash(item)], priority)
+
+    def sample(self, rnd: float) -> Union[Item, None]:
+        '''
+        Draw an item with the probability proportional to its priority.
+
+        Args:
+            rnd (float): a random number in [0.0, 1.0).
+        '''
+        tree = self.tree
+        if tree[1] <= 0.0: return None
+        value = rnd*tree[1]
+        idx = 1
+        while idx < self.n_slots:
+            idx <<= 1
+            if value >= tree[idx] and tree[idx+1] > 0.0:
+                value -= tree[idx]
+                idx += 1
+        return self.items[idx - self.n_slots]
+
+    def _set(self, slot: int, priority: float):
+        tree = self.tree
+        idx = slot + self.n_slots
+        tree[idx] = priority
+        idx >>= 1
+        while idx > 0:
+            tree[idx] = tree[2*idx] + tree[2*idx+1]
+            idx >>= 1
+
+    def _grow(self):
+        '''Double the number of slots, and rebuild the inner nodes.'''
+        n_slots_old = self.n_slots
+        self.n_slots = n_slots = 2*n_slots_old
+        tree = [0.0]*(2*n_slots)
+        tree[n_slots:n_slots+n_slots_old] = self.tree[n_slots_old:]
+        for idx in range(n_slots-1, 0, -1):
+            tree[idx] = tree[2*idx] + tree[2*idx+1]
+        self.tree = tree
+        self.items.extend([None]*n_slots_old)
+        self.slots_free.extend(range(n_slots-1, n_slots_old-1, -1))
+
+    def __len__(self):
+        return len(self.slot_lut)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: #items={len(self)}, total={self.total:.3f}>"
@@ -1,53 +1,145 @@
 from typing import Union
-from depq import DEPQ
-from pynars.Narsese import Task, Belief
+from bisect import bisect_left, bisect_right
+import numpy as np
+from pynars import Global
+from pynars.Config import Config
+from pynars.Narsese import Task, Belief, Sentence
 
 class Table:
     '''
     Utilized for belief table, desire table, etc. in the `Concept`.
+
+    The tasks are kept in descending order of their priorities (e.g., the confidence of a belief), with the earlier one ahead among those with the same priority. When the table is full, the last task is dropped.
+    A task is indexed by its hash value, so that a duplicate one is found in O(1). The truth-values and the occurrence times of the tasks are stored in a compact array in the same order, so that `best_match` scores all the tasks in a single vectorized pass.
     '''
+    # the columns of `self._data`
+    _F, _C, _K, _T, _ETERNAL, _QVAR, _PUNCT, _COMPLEXITY = range(8)
+
     def __init__(self, capacity):
-        self._table = DEPQ(maxlen=capacity)
+        self.capacity = capacity
+        self._tasks = []
+        self._priorities_neg = []  # the negated priorities of the tasks, in ascending order
+        self._index = {}  # the priority of each task, indexed by the hash value of the task
+        self._data = np.zeros((capacity + 1, 8))
 
     def add(self, task: Task, p: float):
         if task in self:
-            self._table.remove(task)
-        self._table.insert(task, p)
+            self._remove(task)
+
+        idx = bisect_right(self._priorities_neg, -p)
+        n = len(self._tasks)
+        self._tasks.insert(idx, task)
+        self._priorities_neg.insert(idx, -p)
+        self._index[hash(task)] = p
+        data = self._data
+        data[idx+1:n+1] = data[idx:n]
+        data[idx] = self._row(task.sentence)
+
+        if n + 1 > self.capacity:
+            task_popped = self._tasks.pop()
+            self._priorities_neg.pop()
+            del self._index[hash(task_popped)]
 
+    def _remove(self, task: Task):
+        p = self._index.pop(hash(task))
+        idx = bisect_left(self._priorities_neg, -p)
+        while hash(self._tasks[idx]) != hash(task): idx += 1
+        n = len(self._tasks)
+        del self._tasks[idx]
+        del self._priorities_neg[idx]
+        data = self._data
+        data[idx:n-1] = data[idx+1:n]
+
+    def update(self, task: Task, p: float=None):
+        '''
+        refresh the task after its truth-value is changed in place (e.g., by the mental operation `doubt`), with its priority changed to `p` if `p` is not None, so that the order and the compact array are up to date.
+        '''
+        self.add(task, p if p is not None else self._index[hash(task)])
 
     # def remove(self, task: Task):
     #     self._table.elim(task)
 
+    @classmethod
+    def _row(cls, sentence: Sentence):
+        row = [0.0]*8
+        truth = sentence.truth
+        if truth is not None:
+            row[cls._F], row[cls._C], row[cls._K] = truth.f, truth.c, truth.k
+        t_occurrence = sentence.stamp.t_occurrence
+        row[cls._ETERNAL] = t_occurrence is None
+        row[cls._T] = t_occurrence if t_occurrence is not None else 0
+        row[cls._QVAR] = sentence.term.has_qvar
+        row[cls._PUNCT] = ord(sentence.punct.value)
+        row[cls._COMPLEXITY] = sentence.term.complexity
+        return row
+
+    def best_match(self, sentence: Sentence, rate_by_confidence: bool=True) -> Union[Task, None]:
+        '''
+        Select the task with the highest quality as a solution to the sentence, which is the same as taking the maximum of `calculate_solution_quality(sentence, task.sentence, rate_by_confidence)` over the tasks, but computed over all the tasks at once.
+        '''
+        n = len(self._tasks)
+        if n == 0: return None
+        data = self._data[:n]
+        c = data[:, self._C]
+
+        # project the truth-values of the events, whose occurrence times are different from that of the sentence, see `project_truth`.
+        t_occurrence = sentence.stamp.t_occurrence
+        projected = data[:, self._ETERNAL] == 0
+        if t_occurrence is not None:
+            projected &= data[:, self._T] != t_occurrence
+        if projected.any():
+            c = c.copy()
+            c_projected = c[projected]
+            if t_occurrence is not None:
+                t_source = data[projected, self._T]
+                k_c = np.abs(t_source - t_occurrence) / ((np.abs(t_source - Global.time) + abs(t_occurrence - Global.time)) + 1e-3)
+                c_projected = (1 - k_c) * c_projected
+            c[projected] = c_projected / (c_projected + data[projected, self._K])
+
+        if rate_by_confidence:
+            qualities = c
+        else:
+            e = c * (data[:, self._F] - 0.5) + 0.5
+            qualities = e / np.sqrt(np.sqrt(np.sqrt(data[:, self._COMPLEXITY] * Config.complexity_unit)))
+
+        invalid = (data[:, self._QVAR] != 0) & (data[:, self._PUNCT] != ord(sentence.punct.value))
+        if invalid.any():
+            qualities = np.where(invalid, 0.0, qualities)
+        return self._tasks[int(np.argmax(qualities))]
+
     @property
     def empty(self):
-        return self._table.is_empty()
-    
+        return len(self._tasks) == 0
+
     def first(self):
-        return self._table.first() if len(self._table) > 0 else None
-    
+        return self._tasks[0] if len(self._tasks) > 0 else None
+
     def last(self):
-        return self._table.last() if len(self._table) > 0 else None
+        return self._tasks[-1] if len(self._tasks) > 0 else None
+
+    def __contains__(self, task: Task):
+        return hash(task) in self._index
 
     def __iter__(self):
-        return (value for value, _ in self._table)
-    
+        return iter(self._tasks)
+
     def values(self):
         return tuple(iter(self))
-    
+
     def items(self):
-        return tuple(iter(self._table))
+        return tuple((task, -p) for task, p in zip(self._tasks, self._priorities_neg))
 
     def keys(self):
-        return tuple(key for _, key in self._table)
+        return tuple(-p for p in self._priorities_neg)
 
     def __getitem__(self, idx: int) -> Union[Task, Belief]:
-        return self._table[idx][0]
+        return self._tasks[idx]
 
     def __len__(self):
-        return len(self._table)
+        return len(self._tasks)
 
     def __str__(self):
-        return f'<Table: #items={len(self._table)}, capacity={self._table.maxlen}>'
+        return f'<Table: #items={len(self._tasks)}, capacity={self.capacity}>'
 
     def __repr__(self):
-        return str(self)
\ No newline at end of file
+        return str(self)
@@ -0,0 +1,90 @@
+from typing import Any, List, Tuple
+
+
+class TimingWheel:
+    '''
+    A hierarchical timing wheel, which schedules items by their deadlines (in cycles), and gives the items whose deadlines have come, in O(1) amortized time per cycle.
+
+    There are `n_wheels` wheels with `2**n_bits` slots each. A slot of the `l`-th wheel covers `2**(n_bits*l)` cycles. An item is placed in the lowest wheel where its deadline shares all the higher bits with the current time; when the time reaches the start of a slot of a higher wheel, the items in that slot are cascaded down into the lower wheels. The items beyond the range of all the wheels are kept in an overflow list.
+    '''
+
+    def __init__(self, time: int = 0, n_bits: int = 6, n_wheels: int = 4) -> None:
+        self.time = time
+        self.n_bits = n_bits
+        self.mask = (1 << n_bits) - 1
+        self.wheels = [[[] for _ in range(1 << n_bits)] for _ in range(n_wheels)]
+        self.overflow = []
+        self.count = 0
+
+    def add(self, deadline: int, item: Any):
+        '''Schedule the item, which is given by `advance` once the time reaches `deadline`.'''
+        self._place(deadline, item)
+        self.count += 1
+
+    def advance(self, time: int) -> List[Tuple[int, Any]]:
+        '''
+        Move the time forward to `time`.
+
+        Returns:
+            the (deadline, item) pairs whose deadlines are no later than `time`.
+        '''
+        expired = []
+        if time < self.time:
+            self._rebuild(time)
+        while self.time < time:
+            if self.count == 0:
+                self.time = time
+                break
+            t = self.time + 1
+            self.time = t
+            # cascade the slots of the higher wheels down, from the highest one
+            if t & ((1 << (self.n_bits*len(self.wheels))) - 1) == 0:
+                entries, self.overflow = self.overflow, []
+                self._cascade(entries, expired)
+            for level in range(len(self.wheels)-1, 0, -1):
+                if t & ((1 << (self.n_bits*level)) - 1) == 0:
+                    slot = self.wheels[level]
+                    idx = (t >> (self.n_bits*level)) & self.mask
+                    entries, slot[idx] = slot[idx], []
+                    self._cascade(entries, expired)
+            slot = self.wheels[0]
+            idx = t & self.mask
+            if len(slot[idx]) > 0:
+                expired.extend(slot[idx])
+                self.count -= len(slot[idx])
+                slot[idx] = []
+        return expired
+
+    def _place(self, deadline: int, item: Any):
+        # an item whose deadline has passed is given at the next cycle
+        t = deadline if deadline > self.time else self.time + 1
+        level = ((t ^ self.time).bit_length() - 1) // self.n_bits
+        if level < len(self.wheels):
+            self.wheels[level][(t >> (self.n_bits*level)) & self.mask].append((deadline, item))
+        else:
+            self.overflow.append((deadline, item))
+
+    def _cascade(self, entries: List[Tuple[int, Any]], expired: List[Tuple[int, Any]]):
+        for deadline, item in entries:
+            if deadline <= self.time:
+                expired.append((deadline, item))
+                self.count -= 1
+            else:
+                self._place(deadline, item)
+
+    def _rebuild(self, time: int):
+        '''Reschedule all the items, in case that the time goes backward (e.g., the time is reset).'''
+        entries = self.overflow
+        for wheel in self.wheels:
+            for slot in wheel:
+                entries.extend(slot)
+                slot.clear()
+        self.overflow = []
+        self.time = time
+        for deadline, item in entries: self._place(deadline, item)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: #items={len(self)}, time={self.time}>"
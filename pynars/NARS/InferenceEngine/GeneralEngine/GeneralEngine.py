@@ -1,14 +1,21 @@
 from pynars.NAL.Functions.Tools import project_truth, revisible
 from .Rules import *
 from .extract_feature import extract_feature
+from .vectorized_rules import survive
 from ..Engine import Engine
 from ...DataStructures import Task, Belief, Concept, TaskLink, TermLink
-from ...RuleMap import RuleCallable, RuleMap
+from ...RuleMap import RuleCallable, RuleMap, RuleCache, RuleProfiler
+from pynars.Config import Config
 from ...RuleMap.add_rule import _compound_has_common, _compound_at
 
 
+_missing = object()
+
+
 class GeneralEngine(Engine):
     rule_map = RuleMap(name='LUT', root_rules=Path(__file__).parent / 'Rules')
+    rule_cache = RuleCache(1<<16)
+    rule_profiler: RuleProfiler = None # see `Config.rule_profiling`
 
     def __init__(self, build = True, add_rules = {1, 2, 3, 4, 5, 6, 7, 8, 9}):
         ''''''
@@ -67,19 +74,22 @@ class GeneralEngine(Engine):
 
         )
 
-        map = self.rule_map.map
-        structure = self.rule_map.structure
-        add_rules__NAL1(map, structure) if 1 in add_rules else None
-        add_rules__NAL2(map, structure) if 2 in add_rules else None
-        add_rules__NAL3(map, structure) if 3 in add_rules else None
-        add_rules__NAL4(map, structure) if 4 in add_rules else None
-        add_rules__NAL5(map, structure) if 5 in add_rules else None
-        add_rules__NAL6(map, structure) if 6 in add_rules else None
-        add_rules__NAL7(map, structure) if 7 in add_rules else None
-        add_rules__NAL8(map, structure) if 8 in add_rules else None
-        add_rules__NAL9(map, structure) if 9 in add_rules else None
+        if not self.rule_map.open(*sorted(add_rules)):
+            map = self.rule_map.map
+            structure = self.rule_map.structure
+            add_rules__NAL1(map, structure) if 1 in add_rules else None
+            add_rules__NAL2(map, structure) if 2 in add_rules else None
+            add_rules__NAL3(map, structure) if 3 in add_rules else None
+            add_rules__NAL4(map, structure) if 4 in add_rules else None
+            add_rules__NAL5(map, structure) if 5 in add_rules else None
+            add_rules__NAL6(map, structure) if 6 in add_rules else None
+            add_rules__NAL7(map, structure) if 7 in add_rules else None
+            add_rules__NAL8(map, structure) if 8 in add_rules else None
+            add_rules__NAL9(map, structure) if 9 in add_rules else None
 
         if build: self.build()
+        self.rule_cache.clear()
+        GeneralEngine.rule_profiler = RuleProfiler(Config.rule_profiling) if Config.rule_profiling > 0 else None
 
         pass
 
@@ -123,8 +133,28 @@ class GeneralEngine(Engine):
                    task_link: TaskLink, term_link: TermLink):
         '''
         Given a task and a belief, find the matched rules for one step inference.
+        The rules depend only on the structures of the terms, the types of the links and the type of the task, so they are looked up in `cls.rule_cache` by these first.
         '''
         link1 = task_link.type
+        key = (
+            hash(task.term),
+            hash(belief.term) if belief is not None else None,
+            hash(belief_term) if belief_term is not None else None,
+            task.sentence.punct,
+            link1,
+            term_link.type if term_link is not None else None,
+            tuple(task_link.component_index) if link1 is LinkType.TRANSFORM and belief_term is None else None
+        )
+        rules = cls.rule_cache.get(key, _missing)
+        if rules is _missing:
+            rules = cls._match_rule(task, belief, belief_term, task_link, term_link)
+            cls.rule_cache.put(key, rules)
+        return rules
+
+    @classmethod
+    def _match_rule(cls, task: Task, belief: Union[Belief, None], belief_term: Union[Term, Compound, Statement, None],
+                   task_link: TaskLink, term_link: TermLink):
+        link1 = task_link.type
         link2 = term_link.type if term_link is not None else None  # `term_link` may be `None` in case of single premise inference.
 
         the_other_compound_has_common = the_other_compound_p1_at_p2 = the_other_compound_p2_at_p1 = False
@@ -320,60 +350,128 @@ class GeneralEngine(Engine):
     def step(self, concept: Concept):
         """
         One-step inference.
+        Up to `Config.n_task_links_fired` task-links are taken from the concept, and for each of them, the term-links are tried in descending order of their priorities, until `Config.n_term_links_fired` of them are valid to interact with the task. The term-links are peeked without being taken out of the bag, and only those fired are updated.
         """
         tasks_derived = []
 
-        # Based on the selected concept, take out a task and a belief for further inference.
-        task_link_valid: TaskLink = concept.task_links.take(remove=True)
-        if task_link_valid is None:
+        task_links = self._take_task_links(concept)
+        if len(task_links) == 0:
             return tasks_derived, False
-        concept.task_links.put_back(task_link_valid)
 
-        task: Task = task_link_valid.target
+        for task_link_valid in task_links:
+            task, firing_immediate, tasks_revised, firings = self._select(concept, task_link_valid)
+            # inference for single-premise rules
+            if firing_immediate is not None:
+                tasks_derived.extend(self.inference(*firing_immediate))
+            tasks_derived.extend(tasks_revised)
+            # inference for two-premises rules
+            for firing in firings:
+                tasks = self.inference(*firing)
+                self._update_term_link(concept, firing, [task.budget.quality for task in tasks if task is not None])
+                tasks_derived.extend(tasks)
 
-        # inference for single-premise rules
-        is_valid, _, rules_immediate = GeneralEngine.match(task, None, None, task_link_valid, None)
-        if is_valid:
-            tasks = self.inference(task, None, None, task_link_valid, None, rules_immediate)
+        self._put_back_task_links(concept, task_links)
+
+        return tasks_derived, True if task.is_judgement else False  # TODO, this is a temporary treatment
+        # but obviously there must be some treatments like this for these global status evaluations
+
+    def step_batch(self, concepts: List[Concept]) -> List[Task]:
+        """
+        One-step inference on several concepts at once.
+        The premises are selected from each concept as in `step`, and then they are grouped by the rules matched, so that the budgets of the tasks derived by a rule are evaluated as arrays for the whole group, and only the tasks whose budgets are above the threshold are derived (see `inference_batch`).
+        The term-links fired are updated as in `step`, including by the tasks which are not derived, or not returned, for being below the threshold. Unlike `step`, the tasks below the threshold are not returned, since they would be dropped by the memory anyway.
+        """
+        tasks_derived = []
+        firings = []
+        task_links_taken = []
+        for concept in concepts:
+            task_links = self._take_task_links(concept)
+            task_links_taken.append((concept, task_links))
+            for task_link_valid in task_links:
+                _, firing_immediate, tasks_revised, firings_concept = self._select(concept, task_link_valid)
+                if firing_immediate is not None: firings.append((concept, firing_immediate))
+                tasks_derived.extend(tasks_revised)
+                firings.extend((concept, firing) for firing in firings_concept)
+
+        tasks_each, qualities_each = self.inference_batch([firing for _, firing in firings])
+        for (concept, firing), tasks, qualities in zip(firings, tasks_each, qualities_each):
+            self._update_term_link(concept, firing, qualities)
             tasks_derived.extend(tasks)
 
-        # inference for two-premises rules
-        term_links = []
-        term_link_valid = None
-        is_valid = False
-        for _ in range(len(concept.term_links)):
-            # To find a belief, which is valid to interact with the task, by iterating over the term-links.
-            term_link: TaskLink = concept.term_links.take(remove=True)
-            term_links.append(term_link)
+        for concept, task_links in task_links_taken:
+            self._put_back_task_links(concept, task_links)
+        return tasks_derived
+
+    @staticmethod
+    def _take_task_links(concept: Concept) -> List[TaskLink]:
+        '''take up to `Config.n_task_links_fired` task-links from the concept.'''
+        # In the lazy forgetting mode, the task-link is forgotten when it is read, so there is no need to take it out and put it back.
+        lazy_forget = concept.task_links.lazy_forget
+        task_links = []
+        for _ in range(min(Config.n_task_links_fired, len(concept.task_links))):
+            task_link: TaskLink = concept.task_links.take(remove=not lazy_forget)
+            if task_link is None: break
+            if task_link not in task_links: task_links.append(task_link)
+        return task_links
+
+    @staticmethod
+    def _put_back_task_links(concept: Concept, task_links: List[TaskLink]):
+        if not concept.task_links.lazy_forget:
+            for task_link in task_links:
+                concept.task_links.put_back(task_link)
+
+    @staticmethod
+    def _select(concept: Concept, task_link_valid: TaskLink):
+        '''
+        select the premises to fire with a task-link, i.e., the task alone, and the task with each of the term-links valid to interact with it.
+        Return the task, the firing of the single-premise rules (or None), the tasks revised, and the firings of the two-premises rules, where a firing is the arguments of `inference`.
+        '''
+        task: Task = task_link_valid.target
+
+        is_valid, _, rules_immediate = GeneralEngine.match(task, None, None, task_link_valid, None)
+        firing_immediate = (task, None, None, task_link_valid, None, rules_immediate) if is_valid else None
 
+        # the term-links are peeked in the order of their priorities, so those which are not valid to interact with the task are left intact.
+        tasks_revised = []
+        firings = []
+        for term_link in concept.term_links.peek():
             concept_target: Concept = term_link.target
             belief = concept_target.get_belief()  # TODO: consider all beliefs.
             term_belief = concept_target.term
             # if belief is None: continue
             # to verify the validity of the interaction, and find a pair which is valid for inference.
             is_valid, is_revision, rules = GeneralEngine.match(task, belief, term_belief, task_link_valid, term_link)
-            if is_revision: tasks_derived.append(
+            if is_revision: tasks_revised.append(
                 local__revision(task, belief, task_link_valid.budget, term_link.budget))
             if is_valid:
-                term_link_valid = term_link
-                break
-
-        if is_valid:
-            tasks = self.inference(task, belief, term_belief, task_link_valid, term_link_valid, rules)
-            if term_link_valid is not None:
-                # TODO: Check here whether the budget updating is the same as OpenNARS 3.0.4.
-                for task in tasks:
-                    TermLink.update_budget(term_link_valid.budget,
-                                           task.budget.quality,
-                                           belief.budget.priority if belief is not None else concept_target.budget.priority)
+                firings.append((task, belief, term_belief, task_link_valid, term_link, rules))
+                if len(firings) >= Config.n_term_links_fired: break
+        return task, firing_immediate, tasks_revised, firings
 
-            tasks_derived.extend(tasks)
+    @staticmethod
+    def _update_term_link(concept: Concept, firing: tuple, qualities: List[float]):
+        '''update the term-link fired by the qualities of the budgets of the tasks derived, where the term-link stays in the bag of the concept.'''
+        _, belief, _, _, term_link, _ = firing
+        if term_link is None: return
+        # TODO: Check here whether the budget updating is the same as OpenNARS 3.0.4.
+        for quality in qualities:
+            TermLink.update_budget(term_link.budget,
+                                   quality,
+                                   belief.budget.priority if belief is not None else term_link.target.budget.priority)
+        concept.term_links.touch(term_link)
 
-        for term_link in term_links:
-            concept.term_links.put_back(term_link)
+    @staticmethod
+    def _premise_belief(task: Task, belief: Belief, term_belief: Term) -> Union[Belief, Term]:
+        '''the belief projected to the time of the task, or the term of the belief if there is no belief.'''
+        # Temporal Projection and Eternalization
+        if belief is not None:
+            # TODO: Hanlde the backward inference.
+            if not belief.is_eternal and (belief.is_judgement or belief.is_goal):
+                truth_belief = project_truth(task.sentence, belief.sentence)
+                belief = belief.eternalize(truth_belief)
+                # beleif_eternalized = belief # TODO: should it be added into the `tasks_derived`?
 
-        return tasks_derived, True if task.is_judgement else False  # TODO, this is a temporary treatment
-        # but obviously there must be some treatments like this for these global status evaluations
+        return belief if belief is not None else term_belief
 
     @staticmethod
     def inference(task: Task, belief: Belief, term_belief: Term, task_link: TaskLink, term_link: TermLink,
@@ -384,15 +482,38 @@ class GeneralEngine(Engine):
             2. the task is the target node of the task-link, and the concept correspoding to the belief is the target node of the term-link.
             3. there is a function, indexed by the task_link and the term_link, in the RuleMap.
         '''
-        # Temporal Projection and Eternalization
-        if belief is not None:
-            # TODO: Hanlde the backward inference.
-            if not belief.is_eternal and (belief.is_judgement or belief.is_goal):
-                truth_belief = project_truth(task.sentence, belief.sentence)
-                belief = belief.eternalize(truth_belief)
-                # beleif_eternalized = belief # TODO: should it be added into the `tasks_derived`?
-
-        belief = belief if belief is not None else term_belief
+        belief = GeneralEngine._premise_belief(task, belief, term_belief)
+        if GeneralEngine.rule_profiler is not None: return GeneralEngine.rule_profiler.run(rules, task, belief, task_link, term_link)
         tasks_derived = [rule(task, belief, task_link, term_link) for rule in rules]
 
         return tasks_derived
+
+    @staticmethod
+    def inference_batch(firings: List[Tuple[Task, Belief, Term, TaskLink, TermLink, List[RuleCallable]]]) -> Tuple[List[List[Task]], List[List[float]]]:
+        '''
+        The batched version of `inference`, where each firing is the arguments of `inference`. The premises are grouped by the rules matched, and for each rule, whether the task derived from each pair of premises survives the budget threshold is evaluated as arrays over the group (see `vectorized_rules.survive`), so that only the survivors are derived.
+        The derivation of a task, i.e., building its term and merging the stamps of the premises, costs much more than evaluating its truth-value and budget, so the batch pays off by the share of the tasks below the threshold.
+        Return the tasks derived from each firing which are above the threshold, and the qualities of the budgets of all the tasks from each firing, including those which are not derived or not returned, by which the term-link is updated.
+        '''
+        premises = []
+        groups: Dict[RuleCallable, List[int]] = {}
+        for i, (task, belief, term_belief, task_link, term_link, rules) in enumerate(firings):
+            premises.append((task, GeneralEngine._premise_belief(task, belief, term_belief), task_link, term_link))
+            for rule in rules: groups.setdefault(rule, []).append(i)
+
+        tasks_derived = [[] for _ in firings]
+        qualities = [[] for _ in firings]
+        rule_profiler = GeneralEngine.rule_profiler
+        for rule, indices in groups.items():
+            premises_rule = [premises[i] for i in indices]
+            survived, qualities_rule = survive(rule, premises_rule)
+            if rule_profiler is not None: tasks_rule = rule_profiler.run_batch(rule, premises_rule, survived)
+            else: tasks_rule = [rule(*premise) if is_survived else None for premise, is_survived in zip(premises_rule, survived)]
+            for i, task_derived, quality in zip(indices, tasks_rule, qualities_rule):
+                if task_derived is None:
+                    if quality is not None: qualities[i].append(quality)
+                    continue
+                qualities[i].append(task_derived.budget.quality)
+                # a task evaluated as arrays is known to be above the threshold if it is derived.
+                if quality is not None or task_derived.budget.is_above_thresh: tasks_derived[i].append(task_derived)
+        return tasks_derived, qualities
@@ -1,10 +1,9 @@
 from collections import OrderedDict
 from pynars.NARS.DataStructures import LinkType, TaskLink, TermLink
-from sparse_lut import SparseLUT
 from pynars import Global
 from ....RuleMap.add_rule import *
 
-def add_rules__NAL3(sparse_lut: SparseLUT, structure: OrderedDict):
+def add_rules__NAL3(sparse_lut: 'SparseLUT', structure: OrderedDict):
     ''''''
     '''
     Compositinal Rules
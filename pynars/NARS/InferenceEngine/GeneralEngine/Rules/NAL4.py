@@ -1,11 +1,10 @@
 from collections import OrderedDict
 from pynars.NARS.DataStructures import LinkType, TaskLink, TermLink
-from sparse_lut import SparseLUT
 from pynars import Global
 from ....RuleMap.add_rule import *
 
 
-def add_rules__NAL4(sparse_lut: SparseLUT, structure: OrderedDict):
+def add_rules__NAL4(sparse_lut: 'SparseLUT', structure: OrderedDict):
     ''''''
     '''transform'''
     add_rule(sparse_lut, structure,
@@ -0,0 +1,59 @@
+from typing import Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+from pynars.Config import Config
+from pynars.NAL.Functions.BudgetFunctions import Budget_forward_array, Budget_summary_array
+from pynars.NAL.Functions.TruthValueFunctions import Truth_deduction_array, Truth_abduction_array, Truth_induction_array, Truth_exemplification_array, Truth_comparison_array
+from pynars.Narsese import Task, Belief
+from ...DataStructures import TaskLink, TermLink
+from ...RuleMap import RuleCallable
+from ...RuleMap.Interface import Interface_SyllogisticRules as Syllogistic
+
+# the rules whose tasks derived from two judgements are evaluated by a truth function of the two premises and `Budget_forward`, where the premises are (task, belief), or (belief, task) if inversed.
+rules_vectorized: Dict[RuleCallable, Tuple[Callable, bool]] = {
+    Syllogistic._syllogistic__deduction__0_1: (Truth_deduction_array, False),
+    Syllogistic._syllogistic__deduction__1_0: (Truth_deduction_array, True),
+    Syllogistic._syllogistic__exemplification__0_1: (Truth_exemplification_array, True),
+    Syllogistic._syllogistic__exemplification__1_0: (Truth_exemplification_array, False),
+    Syllogistic._syllogistic__induction__0_0: (Truth_induction_array, False),
+    Syllogistic._syllogistic__induction__0_0_prime: (Truth_induction_array, True),
+    Syllogistic._syllogistic__abduction__1_1: (Truth_abduction_array, False),
+    Syllogistic._syllogistic__abduction__1_1_prime: (Truth_abduction_array, True),
+    Syllogistic._syllogistic__comparison__0_0: (Truth_comparison_array, False),
+    Syllogistic._syllogistic__comparison__0_0_prime: (Truth_comparison_array, True),
+    Syllogistic._syllogistic__comparison__1_1: (Truth_comparison_array, True),
+    Syllogistic._syllogistic__comparison__1_1_prime: (Truth_comparison_array, False),
+}
+
+
+def survive(rule: RuleCallable, premises: List[Tuple[Task, Belief, TaskLink, TermLink]]) -> Tuple[List[bool], List[Union[float, None]]]:
+    '''
+    whether the task derived by the rule from each pair of premises would have a budget above the threshold (see `Budget.is_above_thresh`), evaluated as arrays over all the pairs, without deriving the tasks. A pair of premises is assumed to survive if it cannot be evaluated so, e.g., the rule is not in `rules_vectorized`, or the task is not a judgement.
+    Return also the quality of the budget of each task evaluated, or `None` for the pairs not evaluated, so that a term-link can be updated by a task which is not derived (see `GeneralEngine._update_term_link`).
+    '''
+    survived = [True]*len(premises)
+    qualities = [None]*len(premises)
+    vectorized = rules_vectorized.get(rule, None)
+    if vectorized is None: return survived, qualities
+    truth_function, inverse_premise = vectorized
+
+    # only the pairs of judgements with term-links are evaluated
+    indices = [i for i, (task, belief, task_link, term_link) in enumerate(premises) if task.is_judgement and term_link is not None and isinstance(belief, Task) and belief.is_judgement]
+    if len(indices) == 0: return survived, qualities
+
+    values = np.array([
+        (task.truth.f, task.truth.c, belief.truth.f, belief.truth.c, task_link.budget.priority, task_link.budget.durability, term_link.budget.priority, term_link.budget.durability)
+        for task, belief, task_link, term_link in (premises[i] for i in indices)
+    ]).T
+    f_task, c_task, f_belief, c_belief, p_tasklink, d_tasklink, p_termlink, d_termlink = values
+    ks = [(premises[i][1] if inverse_premise else premises[i][0]).truth.k for i in indices]
+    k = ks[0] if all(k == ks[0] for k in ks) else np.array(ks, dtype=float)
+    if not inverse_premise: f, c = truth_function(f_task, c_task, f_belief, c_belief, k)
+    else: f, c = truth_function(f_belief, c_belief, f_task, c_task, k)
+    budgets = Budget_forward_array(f, c, p_tasklink, d_tasklink, p_termlink, d_termlink)
+    summary = Budget_summary_array(*budgets)
+    for i, is_above_thresh, quality in zip(indices, (summary > Config.budget_thresh).tolist(), budgets[2].tolist()):
+        survived[i] = is_above_thresh
+        qualities[i] = quality
+    return survived, qualities
@@ -50,9 +50,10 @@ class TemporalEngine(Engine):
 
         )
         
-        map = self.rule_map.map
-        structure = self.rule_map.structure
-        add_rules__NAL7(map, structure) if 7 in add_rules else None
+        if not self.rule_map.open(*sorted(add_rules)):
+            map = self.rule_map.map
+            structure = self.rule_map.structure
+            add_rules__NAL7(map, structure) if 7 in add_rules else None
 
         if build: self.build()
 
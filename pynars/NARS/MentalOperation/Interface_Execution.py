@@ -16,7 +16,7 @@ def execute__doubt(arguments: Iterable[Term], task: Task=None, memory: Memory=No
     ''''''
     term = arguments[1]
     concept = Concept._conceptualize(memory.concepts, term, task.budget)
-    return _execute.doubt(list(concept.belief_table))
+    return _execute.doubt(list(concept.belief_table), concept.belief_table)
 
 
 def execute__evaluate(arguments: Iterable[Term], task: Task=None, memory: Memory=None):
@@ -35,7 +35,7 @@ def execute__hesitate(arguments: Iterable[Term], task: Task=None, memory: Memory
     ''''''
     term = arguments[1]
     concept = Concept._conceptualize(memory.concepts, term, task.budget)
-    return _execute.hesitate(list(concept.desire_table))
+    return _execute.hesitate(list(concept.desire_table), concept.desire_table)
     
 
 def execute__want(arguments: Iterable[Term], task: Task=None, memory: Memory=None):
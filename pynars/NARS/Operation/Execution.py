@@ -29,8 +29,9 @@ def executed_task(task: Task):
 def execute(task: Task, concept: Concept, memory: Memory):
     '''
     it should be ensured that the task is executable, i.e., `task.is_executable == True`.
+    The concept is the one of the task, and it is looked up in the memory if it is not given.
     '''
-    if task.term != concept.term:
+    if concept is None or task.term != concept.term:
         concept = memory.take_by_key(task.term, remove=False)
     stat: Statement = task.term
     operation: Operation = stat.predicate
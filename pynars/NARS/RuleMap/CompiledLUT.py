@@ -0,0 +1,161 @@
+import importlib
+import mmap
+import os
+from bisect import bisect_left
+from pathlib import Path
+from struct import Struct
+from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING
+
+from ordered_set import OrderedSet
+
+if TYPE_CHECKING: from sparse_lut import SparseLUT
+
+# magic, version, number of levels, root, numbers of nodes, edges, rule-sets, references to the rules, rules and the bytes of the rule names, and the number of the rules added
+_header = Struct('<8s10I')
+_MAGIC = b'RULEMAP\x00'
+VERSION = 1
+
+_NONE = -1 # the key of an edge for `None`, i.e., any value
+
+
+def _import(module: str, qualname: str):
+    try:
+        function = importlib.import_module(module)
+        for name in qualname.split('.'): function = getattr(function, name)
+        return function
+    except (ImportError, AttributeError):
+        return None
+
+
+class CompiledLUT:
+    '''
+    A read-only copy of a `SparseLUT`, stored in a file as flat arrays of 32-bit integers, which are read through a `mmap` without being deserialized.
+
+    The trie of a `SparseLUT` is a DAG of nested dicts, with one level per slot, and the sets of rules at the last level. The equal sub-tries are merged when compiled, and each node is stored as a range of edges sorted by the keys (where `None` is `-1`), so that a key is looked up by bisection:
+        node_edges[n_nodes+1]     the range of the edges of each node
+        edge_keys[n_edges]        the key of each edge
+        edge_targets[n_edges]     the child of each edge, or the rule-set at the last level
+        ruleset_rules[n_rulesets+1] the range of the rules of each rule-set
+        rules[n_references]       the index of each rule in the table of the rules
+    and the table of the rules follows, as the lines of `module:qualname`, which are imported on the first use.
+    '''
+
+    def __init__(self, file_path: Union[str, Path]) -> None:
+        self.file_path = Path(file_path)
+        with open(self.file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        magic, version, self.n_levels, self.root, n_nodes, n_edges, n_rulesets, n_references, n_rules, n_bytes, self.n_added = _header.unpack_from(buffer)
+        if magic != _MAGIC or version != VERSION: raise ValueError(f"Invalid rule-map file `{self.file_path}`.")
+
+        offset = _header.size
+        def array(n: int):
+            nonlocal offset
+            a = buffer[offset:offset+4*n].cast('i')
+            offset += 4*n
+            return a
+        self._node_edges = array(n_nodes+1)
+        self._edge_keys = array(n_edges)
+        self._edge_targets = array(n_edges)
+        self._ruleset_rules = array(n_rulesets+1)
+        self._rules = array(n_references)
+        self._names = str(buffer[offset:offset+n_bytes], 'utf-8').split('\n') if n_rules > 0 else []
+
+        self._functions: List[Union[Callable, None]] = [None]*n_rules
+        self._rulesets: Dict[int, OrderedSet] = {}
+
+    @staticmethod
+    def compile(lut: 'SparseLUT', file_path: Union[str, Path]):
+        '''compile the built `lut` into the file, which is written to a temporary file and then renamed, so that a partially written file is never read.'''
+        n_levels = len(lut.shape)
+        nodes: Dict[tuple, int] = {}
+        node_edges = [0]
+        edge_keys: List[int] = []
+        edge_targets: List[int] = []
+        rulesets: Dict[tuple, int] = {}
+        ruleset_rules = [0]
+        rules: List[int] = []
+        functions: Dict[Callable, int] = {}
+        compiled: Dict[int, int] = {} # id(dict) -> node, for the sub-tries shared in the `lut`
+
+        def add_ruleset(ruleset) -> int:
+            ruleset = tuple(functions.setdefault(function, len(functions)) for function in ruleset)
+            index = rulesets.get(ruleset, None)
+            if index is None:
+                index = rulesets[ruleset] = len(rulesets)
+                rules.extend(ruleset)
+                ruleset_rules.append(len(rules))
+            return index
+
+        def add_node(lut: dict, level: int) -> int:
+            index = compiled.get(id(lut), None)
+            if index is not None: return index
+            if level == n_levels-1: edges = tuple((_NONE if key is None else key, add_ruleset(value)) for key, value in lut.items())
+            else: edges = tuple((_NONE if key is None else key, add_node(value, level+1)) for key, value in lut.items())
+            edges = tuple(sorted(edges))
+            index = nodes.get(edges, None)
+            if index is None:
+                index = nodes[edges] = len(nodes)
+                for key, target in edges:
+                    edge_keys.append(key)
+                    edge_targets.append(target)
+                node_edges.append(len(edge_keys))
+            compiled[id(lut)] = index
+            return index
+
+        root = add_node(lut.lut, 0)
+        for function in functions:
+            if _import(function.__module__, function.__qualname__) is not function: raise ValueError(f"The rule `{function.__qualname__}` cannot be imported by its name.")
+        names = '\n'.join(f'{function.__module__}:{function.__qualname__}' for function in functions).encode()
+
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path_temp = file_path.with_name(f'{file_path.name}.{os.getpid()}.tmp')
+        try:
+            with open(file_path_temp, 'wb') as f:
+                f.write(_header.pack(_MAGIC, VERSION, n_levels, root, len(nodes), len(edge_keys), len(rulesets), len(rules), len(functions), len(names), len(lut)))
+                for array in (node_edges, edge_keys, edge_targets, ruleset_rules, rules):
+                    f.write(Struct(f'<{len(array)}i').pack(*array))
+                f.write(names)
+            os.replace(file_path_temp, file_path)
+        finally:
+            if file_path_temp.exists(): file_path_temp.unlink()
+
+    def _function(self, index: int) -> Callable:
+        function = self._functions[index]
+        if function is None:
+            function = self._functions[index] = _import(*self._names[index].split(':'))
+        return function
+
+    def _ruleset(self, index: int) -> OrderedSet:
+        '''the rule-set is built on the first use, and then the same object is returned each time, as by `SparseLUT`.'''
+        ruleset = self._rulesets.get(index, None)
+        if ruleset is None:
+            ruleset = self._rulesets[index] = OrderedSet(self._function(rule) for rule in self._rules[self._ruleset_rules[index]:self._ruleset_rules[index+1]])
+        return ruleset
+
+    def get(self, indices: tuple) -> Union[OrderedSet, int, None]:
+        '''
+        each item in indices should be int, Any/None. The rule-set is returned for the full indices, and the index of the node (which is never `None`) for a prefix of them; `None` is returned if there is no such key.
+        '''
+        keys, targets, node_edges = self._edge_keys, self._edge_targets, self._node_edges
+        node = self.root
+        for index in indices:
+            key = _NONE if index is None or index is Any else index
+            lo, hi = node_edges[node], node_edges[node+1]
+            i = bisect_left(keys, key, lo, hi)
+            if i == hi or keys[i] != key: return None
+            node = targets[i]
+        return self._ruleset(node) if len(indices) == self.n_levels else node
+
+    def __getitem__(self, indices: tuple):
+        if isinstance(indices, int): indices = (indices,)
+        return self.get(indices)
+
+    def __len__(self):
+        return self.n_added
+
+    def close(self):
+        for array in (self._node_edges, self._edge_keys, self._edge_targets, self._ruleset_rules, self._rules): array.release()
+        self._mmap.close()
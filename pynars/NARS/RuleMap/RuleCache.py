@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from typing import Hashable, List, Union
+
+from pynars.Narsese import term_table
+from .add_rule import RuleCallable
+
+_missing = object()
+
+
+class RuleCache:
+    '''
+    An LRU cache of the rules matched for the premises, keyed by the signature of the premises, i.e., the IDs of the terms (see `TermTable`), the types of the links and the type of the sentence, on which alone the matched rules depend.
+    Since the IDs of the terms released are reused (see `TermTable`), the keys with the IDs recycled are purged once the generation of the term table changes.
+    The numbers of hits and misses are counted, see `info`.
+    '''
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._rules: OrderedDict = OrderedDict()
+        self._generation = term_table.generation
+        self.hits = 0
+        self.misses = 0
+
+    def _purge(self):
+        '''remove the keys which may refer to the IDs recycled since the last check, or all the keys if more than one generation has passed.'''
+        if term_table.generation == self._generation + 1:
+            ids = term_table.ids_recycled
+            for key in [key for key in self._rules if any(type(value) is int and value in ids for value in key)]:
+                del self._rules[key]
+        else:
+            self._rules.clear()
+        self._generation = term_table.generation
+
+    def get(self, key: Hashable, default=None) -> Union[List[RuleCallable], None]:
+        '''the cached rules, or `default` if the key is missed. Note that the cached rules may be `None`.'''
+        if self._generation != term_table.generation: self._purge()
+        rules = self._rules.get(key, _missing)
+        if rules is _missing:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._rules.move_to_end(key)
+        return rules
+
+    def put(self, key: Hashable, rules: Union[List[RuleCallable], None]):
+        self._rules[key] = rules
+        if len(self._rules) > self.capacity: self._rules.popitem(last=False)
+
+    def clear(self):
+        self._rules.clear()
+        self._generation = term_table.generation
+        self.hits = self.misses = 0
+
+    def info(self):
+        return dict(hits=self.hits, misses=self.misses, size=len(self._rules), capacity=self.capacity)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rules
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __repr__(self) -> str:
+        return f'<RuleCache: hits={self.hits}, misses={self.misses}, size={len(self)}/{self.capacity}>'
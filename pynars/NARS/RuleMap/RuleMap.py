@@ -1,15 +1,17 @@
+import os
+from hashlib import blake2b
 from pathlib import Path
 from typing import Any, Callable, Iterable, List, Tuple, Union
 from collections import OrderedDict
+from typing import TYPE_CHECKING
 
-
-from sparse_lut import SparseLUT
-from pynars.Config import Enable
+if TYPE_CHECKING: from sparse_lut import SparseLUT
+from pynars.Config import Config, Enable
+from .CompiledLUT import CompiledLUT, VERSION
 
 from pynars.utils.Print import out_print, PrintType
 
 import time
-from datetime import datetime
 import sty
 
 
@@ -26,55 +28,78 @@ class RuleMap:
         slots (List[Tuple[object, str, int]]): each slot is filled in with the type, which is a int number, of an object.
         '''
         self.structure = OrderedDict([(slot[0], tuple(slot[1:])) for slot in slots])
-        shape = tuple([n_type for *_, n_type in slots])
-        self.map = SparseLUT(shape)
+        self.shape = tuple([n_type for *_, n_type in slots])
+        self.map = None
+        self._file_path = None
         pass
 
 
-    def build(self, clear=True):
-        name_cache = self.name
+    @property
+    def cache_dir(self) -> Path:
+        '''the directory of the compiled rule-maps, by `Config.cache_dir`, or the environment variable `PYNARS_CACHE_DIR`, or `~/.cache/pynars`.'''
+        cache_dir = Config.cache_dir or os.environ.get('PYNARS_CACHE_DIR', None)
+        return Path(cache_dir) if cache_dir else Path.home()/'.cache'/'pynars'
+
+
+    def digest(self, *keys) -> str:
+        '''
+        the content hash of the sources of the rules, i.e., `root_rules/NAL*.py`, `add_rule.py` and the interfaces, together with the structure, the format of the file and the `keys` (e.g., which rules are added), so that a compiled rule-map is rebuilt whenever any of them changes.
+        '''
         root_path = Path(__file__).parent
-        def check_update():
-            if self.root_rules is None: return True
+        filepaths = [root_path/'add_rule.py', *sorted((root_path/'Interface').glob('*.py'))]
+        if self.root_rules is not None: filepaths += sorted(Path(self.root_rules).glob("NAL*.py"))
+        h = blake2b(digest_size=16)
+        h.update(repr((VERSION, self.name, [(key, type_.__name__, n) for key, (type_, n) in self.structure.items()], keys)).encode())
+        for filepath in filepaths:
+            h.update(filepath.name.encode())
+            h.update(filepath.read_bytes())
+        return h.hexdigest()
 
-            cache_path = root_path/f'{name_cache}.pkl'
+
+    def open(self, *keys) -> bool:
+        '''
+        load the compiled rule-map keyed by the digest (see `digest`) if it exists, so that the rules need not be added and built. Otherwise, an empty `SparseLUT` is created, where the rules should be added before `build`, which compiles it.
+        Return whether the compiled rule-map is loaded.
+        '''
+        self._file_path = self.cache_dir/f'{self.name}-{self.digest(*keys)}.rulemap'
+        if self._file_path.exists():
             try:
-                if not cache_path.exists(): return True
-                # this_filepath = Path(__file__)
-                filepaths = Path(self.root_rules).glob("NAL*.py")
-                mtime_cache = datetime.fromtimestamp(cache_path.stat().st_mtime)
-                for filepath in filepaths:
-                    mtime_this = datetime.fromtimestamp(filepath.stat().st_mtime)
-                    if mtime_this > mtime_cache:
-                        return True
-                return False
-            except: 
-                if not cache_path.exists(): return True
-                else: return False
-                
-        if check_update():
-            self.rebuild(root_path, clear)
-        else:
-            self.load(str(root_path))
+                self.load(self._file_path)
+                return True
+            except Exception as e:
+                if Enable.debug: out_print(PrintType.ERROR, f'Failed to load RuleMap <{self._file_path}>: {e}')
+        from sparse_lut import SparseLUT # `sparse_lut` pulls in `networkx`, which is imported only when the map is built
+        self.map = SparseLUT(self.shape)
+        return False
+
+
+    def build(self, clear=True):
+        if not isinstance(self.map, CompiledLUT): self.rebuild(clear)
 
         # if Enable.debug: out_print(PrintType.INFO, f'The size of map: {get_size(self.map.lut)/1024/1024:.6f}MB')
         
-    def load(self, root_path: str):
-        if Enable.debug: out_print(PrintType.INFO, f'Loading RuleMap <{self.name}.pkl>...')
+    def load(self, file_path: Union[str, Path]):
+        if Enable.debug: out_print(PrintType.INFO, f'Loading RuleMap <{Path(file_path).name}>...')
         t_start = time.time()
-        self.map.load(str(root_path), self.name)
+        self.map = CompiledLUT(file_path)
         t_end = time.time()
         if Enable.debug: out_print(PrintType.INFO, f'Done. Time-cost: {t_end-t_start}s.')
 
-    def rebuild(self, root_path: str, clear=True):
-        ''''''
-        if Enable.debug: out_print(PrintType.INFO, f'Building RuleMap <{self.name}.pkl>...')
+    def rebuild(self, clear=True):
+        '''build the rules added to the `SparseLUT`, and compile it into the cache directory, which is then loaded. The `SparseLUT` is kept if the cache directory is not writable.'''
+        if Enable.debug: out_print(PrintType.INFO, f'Building RuleMap <{self.name}>...')
         t_start = time.time()
         self.map.build(clear)
         t_end = time.time()
         if Enable.debug: out_print(PrintType.INFO, f'Done. Time-cost: {t_end-t_start}s.')
-        if Enable.debug: out_print(PrintType.INFO, f'Saving RuleMap...')
-        self.map.dump(str(root_path), self.name)
+        if self._file_path is None: self._file_path = self.cache_dir/f'{self.name}-{self.digest()}.rulemap'
+        if Enable.debug: out_print(PrintType.INFO, f'Saving RuleMap <{self._file_path}>...')
+        try:
+            CompiledLUT.compile(self.map, self._file_path)
+            self.map = CompiledLUT(self._file_path)
+        except (OSError, ValueError) as e:
+            if Enable.debug: out_print(PrintType.ERROR, f'Failed to save RuleMap <{self._file_path}>: {e}')
+            return
         if Enable.debug: out_print(PrintType.INFO, f'Done.')
 
 
@@ -107,9 +132,3 @@ class RuleMap:
     
     def __getitem__(self, item: Iterable):
         return self.map[tuple(item)]
-
-
-if __name__ == '__main__':
-    root_path = Path(__file__).parent
-    rulemap = RuleMap(build=False)
-    rulemap.rebuild(root_path)
@@ -0,0 +1,109 @@
+from time import perf_counter
+from typing import Dict, List, Union
+
+from pynars.Narsese import Task
+from .add_rule import RuleCallable
+
+
+class RuleProfiler:
+    '''
+    Count the calls, the time, the tasks derived and the tasks accepted (i.e., whose budgets are above the threshold, see `Budget.is_above_thresh`, without which a task is dropped by the memory) of each rule, by calling the rules matched for the premises through `run`.
+    In the sampling mode, i.e., `sampling > 1`, only one in every `sampling` runs is profiled, and the others call the rules as they are, so that the profiler is cheap enough to be left on. The numbers reported are then estimated by scaling those of the runs profiled.
+    '''
+    def __init__(self, sampling: int = 1) -> None:
+        self.sampling = max(int(sampling), 1)
+        self.n_runs = 0
+        self.n_profiled = 0
+        self._countdown = 1
+        self._stats: Dict[RuleCallable, List[Union[int, float]]] = {} # rule -> [calls, time, derived, accepted]
+
+    def run(self, rules: List[RuleCallable], task: Task, belief, task_link, term_link) -> List[Task]:
+        '''call each of the rules on the premises, as `GeneralEngine.inference` does, and return the tasks derived.'''
+        self.n_runs += 1
+        self._countdown -= 1
+        if self._countdown > 0: return [rule(task, belief, task_link, term_link) for rule in rules]
+        self._countdown = self.sampling
+        self.n_profiled += 1
+
+        stats = self._stats
+        tasks_derived = []
+        for rule in rules:
+            stat = stats.get(rule, None)
+            if stat is None: stat = stats[rule] = [0, 0.0, 0, 0]
+            stat[0] += 1
+            t_start = perf_counter()
+            try:
+                task_derived = rule(task, belief, task_link, term_link)
+            finally:
+                stat[1] += perf_counter() - t_start
+            if task_derived is not None:
+                stat[2] += 1
+                if task_derived.budget.is_above_thresh: stat[3] += 1
+            tasks_derived.append(task_derived)
+        return tasks_derived
+
+    def run_batch(self, rule: RuleCallable, premises: list, survived: List[bool]) -> List[Union[Task, None]]:
+        '''call the rule on each pair of premises which survives the budget threshold, as `GeneralEngine.inference_batch` does, and return the tasks derived, or `None` for the pairs which do not survive, where only the calls are counted.'''
+        self.n_runs += 1
+        self._countdown -= 1
+        if self._countdown > 0: return [rule(*premise) if is_survived else None for premise, is_survived in zip(premises, survived)]
+        self._countdown = self.sampling
+        self.n_profiled += 1
+
+        stat = self._stats.get(rule, None)
+        if stat is None: stat = self._stats[rule] = [0, 0.0, 0, 0]
+        tasks_derived = []
+        for premise, is_survived in zip(premises, survived):
+            if not is_survived:
+                tasks_derived.append(None)
+                continue
+            stat[0] += 1
+            t_start = perf_counter()
+            try:
+                task_derived = rule(*premise)
+            finally:
+                stat[1] += perf_counter() - t_start
+            if task_derived is not None:
+                stat[2] += 1
+                if task_derived.budget.is_above_thresh: stat[3] += 1
+            tasks_derived.append(task_derived)
+        return tasks_derived
+
+    def report(self, sort: str = 'time', top: int = None) -> List[dict]:
+        '''
+        the numbers of each rule, sorted by `sort` (one of `calls`, `time`, `derived` and `accepted`) in descending order, where the time is in seconds.
+        '''
+        scale = self.n_runs / self.n_profiled if self.n_profiled > 0 else 0
+        rows = [
+            dict(
+                rule=f'{rule.__module__}.{rule.__qualname__}',
+                calls=calls*scale,
+                time=time*scale,
+                time_per_call=time/calls if calls > 0 else 0.0,
+                derived=derived*scale,
+                accepted=accepted*scale
+            ) for rule, (calls, time, derived, accepted) in self._stats.items()
+        ]
+        rows.sort(key=lambda row: -row[sort])
+        return rows[:top] if top is not None else rows
+
+    def format(self, sort: str = 'time', top: int = 20) -> str:
+        '''the report as a table.'''
+        lines = [f'{"calls":>10} {"time(ms)":>10} {"us/call":>8} {"derived":>10} {"accepted":>10}  rule']
+        for row in self.report(sort, top):
+            lines.append(f'{row["calls"]:10.0f} {row["time"]*1e3:10.2f} {row["time_per_call"]*1e6:8.1f} {row["derived"]:10.0f} {row["accepted"]:10.0f}  {row["rule"]}')
+        return '\n'.join(lines)
+
+    def clear(self):
+        self._stats.clear()
+        self.n_runs = self.n_profiled = 0
+        self._countdown = 1
+
+    def info(self):
+        return dict(runs=self.n_runs, profiled=self.n_profiled, sampling=self.sampling, rules=len(self._stats))
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __repr__(self) -> str:
+        return f'<RuleProfiler: runs={self.n_runs}, profiled={self.n_profiled}, sampling={self.sampling}, #rules={len(self)}>'
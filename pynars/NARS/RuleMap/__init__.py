@@ -1,2 +1,5 @@
 from .RuleMap import RuleMap
-from .add_rule import *
\ No newline at end of file
+from .add_rule import *
+from .RuleCache import RuleCache
+from .RuleProfiler import RuleProfiler
+from .CompiledLUT import CompiledLUT
@@ -2,21 +2,30 @@ from pynars.Narsese import Term, Judgement, Tense, Statement, Copula, Truth, Sta
 from pynars.Narsese import Base, Operation, Budget, Task, Goal, Punctuation, Question, Quest, Sentence, VarPrefix, Variable, Connector, Compound, SELF
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict, deque
+from copy import copy
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Union
+import gzip
+import re
 from pynars import Config, Global
 
+if TYPE_CHECKING: from concurrent.futures import Future
+
 root_path = Path(__file__).parent
 narsese_path = root_path/Path('./narsese.lark')
+narsese_py_path = root_path/Path('./narsese_lark.py')
 
 
-narsese_py_path = root_path/Path('./narsese_lark.py')
-# get the last modified time of the file
-mtime_lark = datetime.fromtimestamp(narsese_path.stat().st_mtime)
-mtime_py = datetime.fromtimestamp(narsese_py_path.stat().st_mtime)
-if mtime_lark > mtime_py:
-    # re-generate the ``nasese_lark.py'' file
-    import os
-    print(f'generating [{narsese_py_path}] ...')
-    os.system(f'python -m lark.tools.standalone {narsese_path} > {narsese_py_path}')
+def generate():
+    '''re-generate the ``narsese_lark.py'' file if ``narsese.lark'' has been modified since then. It is not done on importing, so run `python -m pynars.Narsese.Parser.parser` after editing the grammar.'''
+    # get the last modified time of the file
+    mtime_lark = datetime.fromtimestamp(narsese_path.stat().st_mtime)
+    mtime_py = datetime.fromtimestamp(narsese_py_path.stat().st_mtime)
+    if mtime_lark > mtime_py:
+        import os
+        print(f'generating [{narsese_py_path}] ...')
+        os.system(f'python -m lark.tools.standalone {narsese_path} > {narsese_py_path}')
 
 import sys
 try:
@@ -431,10 +440,60 @@ class TreeToNarsese(Transformer):
     #     return Compound(Connector.List, *terms, is_input=True)
 
 
+class SimpleParser:
+    '''
+    A recognizer of the most common form of Narsese, i.e., a statement of two atomic terms, with an optional budget, tense and truth, e.g., `$0.8;0.5$ <robin --> bird>. :|: %0.9;0.8%`.
+    The task is built directly by the `TreeToNarsese`, without any parse tree. `None` is returned for the text not in the form, which is then parsed by Lark.
+    '''
+    _word = r'([^\-+<>="&|!.?@~%;,:/\\*#$\[\]{}() ^]+)'
+    _number1 = r'([0]?\.[0-9]+|1\.[0]*|1|0)' # 0 <= x <= 1
+    _number2 = r'([0]?\.[0]*[1-9][0-9]*)' # 0 < x < 1
+    _pattern = re.compile(
+        rf' *(?:\$ *{_number1} *(?:; *{_number2} *(?:; *{_number1} *)?)?\$)?' # budget
+        rf' *< *{_word} *(-->|<->|==>|=/>|=\|>|=\\>|<=>|</>|<\|>) *{_word} *>' # statement
+        r' *([.?!@])' # punctuation
+        r' *(?::(\||/|\\):|:! *([+-]?[0-9]+) *:)?' # tense
+        rf' *(?:% *{_number1} *(?:; *{_number2} *(?:; *([1-9][0-9]*) *)?)?%)? *' # truth
+    )
+    _copulas = {
+        '-->': Copula.Inheritance, '<->': Copula.Similarity, '==>': Copula.Implication, '=/>': Copula.PredictiveImplication, '=|>': Copula.ConcurrentImplication, 
+        '=\\>': Copula.RetrospectiveImplication, '<=>': Copula.Equivalence, '</>': Copula.PredictiveEquivalence, '<|>': Copula.ConcurrentEquivalence
+    }
+
+    def __init__(self, transformer: TreeToNarsese) -> None:
+        self._transformer = transformer
+        self._tenses = {'|': transformer.tense_present, '/': transformer.tense_future, '\\': transformer.tense_past}
+        self._sentences = {'.': transformer.judgement, '?': transformer.question, '!': transformer.goal, '@': transformer.quest}
+
+    def parse(self, text: str) -> Union[Task, None]:
+        match = self._pattern.fullmatch(text)
+        if match is None: return None
+        p, d, q, word1, copula, word2, punct, tense, time, f, c, k = match.groups()
+        if f is not None and punct in '?@': return None # a question or a quest has no truth.
+
+        transformer = self._transformer
+        statement = Statement(Term(word1, is_input=True), self._copulas[copula], Term(word2, is_input=True), is_input=True)
+        args = []
+        if tense is not None: args.append(self._tenses[tense]())
+        elif time is not None: args.append(('tense', int(time)))
+        if f is not None: args.append(('truth', (float(f), float(c) if c is not None else None, float(k) if k is not None else transformer.k)))
+        args = [self._sentences[punct](statement, *args)]
+        if p is not None: args.append(('budget', (float(p), float(d) if d is not None else None, float(q) if q is not None else None)))
+        return transformer.task(*args)
+
+
 class LarkParser:
     def __init__(self) -> None:
         self.config()
-        self._parser = Lark_StandAlone(transformer=TreeToNarsese())
+        self._transformer = TreeToNarsese()
+        self._parser_lark = None
+        self._parser_simple = SimpleParser(self._transformer)
+
+    @property
+    def _parser(self):
+        '''the Lark parser, which is constructed on the first use, since most of the lines are handled by `SimpleParser`.'''
+        if self._parser_lark is None: self._parser_lark = Lark_StandAlone(transformer=self._transformer)
+        return self._parser_lark
 
     def config(self, config_path='./config.json'):
         Config.load(config_path)
@@ -460,14 +519,116 @@ class LarkParser:
 
 
     def parse(self, text: str) -> Task:
-        return self._parser.parse(text)
+        task = self._parser_simple.parse(text)
+        return task if task is not None else self._parser.parse(text)
 
 parser = LarkParser()
 def parse(text: str): return parser.parse(text)
 
+
+class ParseCache:
+    '''
+    An LRU cache of the tasks parsed from the texts, so that a repeated text is parsed only once. A text failed to be parsed is cached as `None`.
+    The cached tasks are templates, which are not put into the reasoner directly, see `instantiate`.
+    '''
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._tasks: OrderedDict = OrderedDict()
+
+    def get(self, text: str, default=None) -> Union[Task, None]:
+        task = self._tasks.get(text, default)
+        if text in self._tasks: self._tasks.move_to_end(text)
+        return task
+
+    def put(self, text: str, task: Union[Task, None]):
+        self._tasks[text] = task
+        self._tasks.move_to_end(text)
+        if len(self._tasks) > self.capacity: self._tasks.popitem(last=False)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._tasks
+
+    def __len__(self):
+        return len(self._tasks)
+
+parse_cache = ParseCache(1<<16)
+
+
+def instantiate(task: Task) -> Task:
+    '''a new task from a parsed one, e.g., a template in the `ParseCache` or one parsed by a worker process, with a new input ID and its time relative to the current time, as if the text had just been parsed.'''
+    sentence = task.sentence
+    stamp = sentence.stamp
+    t_occurrence = Global.time + (stamp.t_occurrence - stamp.t_creation) if stamp.t_occurrence is not None else None
+    stamp = Stamp(Global.time, t_occurrence, None, Base((Global.get_input_id(),)))
+    sentence = type(sentence)(sentence.term, stamp, copy(sentence.truth) if sentence.truth is not None else None)
+    return Task(sentence, task.budget)
+
+
+def parse_cached(text: str) -> Union[Task, None]:
+    '''parse the text with the `parse_cache`. Returns `None` if the text fails to be parsed.'''
+    if text not in parse_cache: parse_cache.put(text, _parse_or_none(text))
+    task = parse_cache.get(text)
+    return instantiate(task) if task is not None else None
+
+
+def _parse_or_none(text: str) -> Union[Task, None]:
+    try: return parser.parse(text)
+    except: return None
+
+
+def _parse_batch(texts: List[str]) -> List[Union[Task, None]]:
+    '''parse a batch of texts, in a worker process.'''
+    return [_parse_or_none(text) for text in texts]
+
+
+def read_lines(source: Union[str, Path, Iterable[str]]) -> Iterator[str]:
+    '''
+    stream the lines of Narsese from a file, which is read as gzip if it ends with `.gz`, or from an iterable of lines.
+    The empty lines, the comments (`//...`, `\'...`) and the numbers of cycles are skipped.
+    '''
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        with (gzip.open(path, 'rt') if path.suffix == '.gz' else open(path, 'r')) as f:
+            yield from read_lines(f)
+        return
+    for line in source:
+        line = line.strip(' \n')
+        if len(line) == 0 or line.startswith("//") or line.startswith("'") or line.isdigit(): continue
+        yield line
+
+
+def parse_lines(lines: Iterable[str], workers: int=1, batch_size: int=1024) -> Iterator[Tuple[List[str], List[Union[Task, None]]]]:
+    '''
+    parse the lines of Narsese in batches, yielding `(lines, tasks)` for each batch in order, where a task is `None` if the line fails to be parsed.
+    The lines are streamed, and each distinct line is parsed only once (see `parse_cache`). If `workers > 1`, the lines not in the cache are parsed in a pool of processes, with at most `2*workers` batches in flight.
+    '''
+    lines = iter(lines)
+    batches = iter(lambda: list(islice(lines, batch_size)), [])
+    if workers <= 1:
+        for batch in batches:
+            yield batch, [parse_cached(line) for line in batch]
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    def collect(batch: List[str], texts: List[str], future: 'Future'):
+        for text, task in zip(texts, future.result()): parse_cache.put(text, task)
+        return batch, [parse_cached(line) for line in batch]
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for batch in batches:
+            texts = [text for text in dict.fromkeys(batch) if text not in parse_cache]
+            pending.append((batch, texts, executor.submit(_parse_batch, texts)))
+            if len(pending) >= 2*workers: yield collect(*pending.popleft())
+        while len(pending) > 0: yield collect(*pending.popleft())
+
 # from lark import Lark, Transformer 
 # parser = Lark.open(narsese_path, parser='lalr')
 
+if __name__ == '__main__':
+    generate()
+
 # if __name__ == '__main__':
 #     with open(sys.argv[1]) as f:
 #         print(parser.parse(f.read()))
\ No newline at end of file
@@ -5,14 +5,16 @@ from .Truth import Truth
 
 
 class Budget:
-    priority: float = 0.9
-    durability: float = 0.9
-    quality: float = 0.5
+    __slots__ = ('priority', 'durability', 'quality')
+
+    priority_default: float = 0.9
+    durability_default: float = 0.9
+    quality_default: float = 0.5
 
     def __init__(self, priority: float, durability: float, quality: float):
-        self.priority = priority if priority is not None else Budget.priority
-        self.durability = durability if durability is not None else Budget.durability
-        self.quality = quality if durability is not None else Budget.quality
+        self.priority = priority if priority is not None else Budget.priority_default
+        self.durability = durability if durability is not None else Budget.durability_default
+        self.quality = quality if durability is not None else Budget.quality_default
 
     @property
     def summary(self) -> float:
@@ -2,11 +2,10 @@
 from copy import copy
 import enum
 
-from matplotlib.pyplot import axis
 from pynars.Config import Enable
 from pynars.Narsese._py.Interval import Interval
 from pynars.utils.IndexVar import IndexVar
-from .Term import Term, TermType, place_holder
+from .Term import Term, TermType, place_holder, hash_code, hash_ints
 from .Terms import Terms
 from .Connector import Connector
 from typing import Iterable, List, Type, Union
@@ -18,6 +17,8 @@ import numpy as np
 
 
 class Compound(Term):  # , OrderedSet):
+    __slots__ = ('connector', '_terms', '_is_commutative', '_is_higher_order', '_is_single_only', '_is_double_only', '_is_multiple_only')
+
     type = TermType.COMPOUND
 
     _terms: Terms
@@ -26,20 +27,17 @@ class Compound(Term):  # , OrderedSet):
         ''''''
         self._is_commutative = connector.is_commutative
         terms = Terms(terms, self._is_commutative, is_input)
-        self.connector, self._terms = self.prepocess_terms(connector, terms,
-                                                           is_input)  # the connector may be changed, for example, (|, {A}, {B}) is changed into {A, B}.
+        connector, terms = self.prepocess_terms(connector, terms,
+                                                is_input)  # the connector may be changed, for example, (|, {A}, {B}) is changed into {A, B}.
+        self._init_terms(connector, terms)
 
-        terms = self._terms
-        word = self._terms_to_word(*terms)
-        if self.is_commutative:
-            terms_sorted = sorted(terms, key=hash)
-            word_sorted = self._terms_to_word(*terms_sorted)
-        else:
-            word_sorted = None
-        Term.__init__(self, word, word_sorted=word_sorted)
+    def _init_terms(self, connector: Connector, terms: Terms):
+        self.connector, self._terms = connector, terms
+
+        Term.__init__(self, None)
 
         compound: Set[Term] = self
-        self._components = OrderedSet(term for component in compound for term in component.sub_terms)
+        self._build_index_components(terms)
 
         self._complexity += sum(term.complexity for term in terms)
         self._is_higher_order = False  # connector.is_higher_order
@@ -52,6 +50,26 @@ class Compound(Term):  # , OrderedSet):
             self.handle_variables(compound)
             # self.handle_index_var(compound, is_input)
 
+    @classmethod
+    def build(cls, connector: Connector, *terms: Term) -> Type['Compound']:
+        '''
+        build a compound from the components which are already normalized, e.g., the components of the premises in an inference rule, so that the pre-processing in `Compound.__init__` is skipped.
+        The result is the same as `Compound(connector, *terms)`. The full construction is used instead whenever the pre-processing may change the components in a way other than unfolding and de-duplicating, i.e., if there are variables, or a commutative compound in the components of a commutative compound.
+        '''
+        if len(terms) == 0 or any(term.has_var for term in terms): return Compound(connector, *terms)
+        if connector.is_commutative:
+            if any(term.is_compound and term.is_commutative for term in terms): return Compound(connector, *terms)
+            # the components are de-duplicated by their IDs, keeping the first occurrences in order.
+            terms = tuple(dict.fromkeys(terms))
+            if len(terms) < 2: return Compound(connector, *terms)
+        else:
+            # e.g. (&/, (&/, A, B), (&|, C, D), E) is built as (&/, A, B, (&|, C, D), E)
+            terms = tuple(component for term in terms for component in (term.terms if term.is_compound and term.connector is connector else (term,)))
+        compound = Compound.__new__(Compound)
+        compound._is_commutative = connector.is_commutative
+        compound._init_terms(connector, Terms.build(terms, connector.is_commutative))
+        return compound
+
     @property
     def copula(self):
         return self.connector
@@ -221,6 +239,16 @@ class Compound(Term):  # , OrderedSet):
 
             return connector_parent, Terms(terms, is_commutative=False, is_input=is_input)
 
+    def _structure(self):
+        ids = tuple(hash(term) for term in self.terms)
+        if self.is_commutative: ids = tuple(sorted(ids))
+        return (Compound, self.connector, ids, self.index_var.postions_normalized)
+
+    def _do_hashing64(self):
+        hashes = [term.hash64 for term in self.terms]
+        if self.is_commutative: hashes.sort()
+        return hash_ints((hash_code(Compound.__name__), hash_code(self.connector.value), len(hashes), *hashes, *self._layout_var()))
+
     def count_components(self):
         return len(self.terms)  # OrderedSet.__len__(self)
 
@@ -264,7 +292,7 @@ class Compound(Term):  # , OrderedSet):
         if self.is_multiple_only and len(terms) == 1:
             result = terms[0]
         else:
-            result = Compound(self.connector, *terms)
+            result = Compound.build(self.connector, *terms)
         return result
 
     def __rsub__(self, s: Term) -> Union[Type['Compound'], Term]:
@@ -283,15 +311,15 @@ class Compound(Term):  # , OrderedSet):
         create a new list, but each element in the list is identical to that in the input(old) one correspondingly.
         returns a shallow copy of the input compound.
         '''
-        return cls(compound.connector, *compound)
+        return cls.build(compound.connector, *compound)
 
     def replace(self, term_old: Term, term_new: Term, connector: Connector = None, idx: int = None) -> Type['Compound']:
         # if term_old.is_atom: term_old = (term_old,)
         # elif term_old.is_compo
         terms: Union[OrderedSet, list] = self.terms
         idx = terms.index(term_old) if idx is None else idx
-        return Compound(self.connector if connector is None else connector,
-                        *(term if i != idx else term_new for i, term in enumerate(self)))
+        return Compound.build(self.connector if connector is None else connector,
+                              *(term if i != idx else term_new for i, term in enumerate(self)))
 
     def equal(self, o: Type['Compound']) -> bool:
         '''
@@ -325,6 +353,9 @@ class Compound(Term):  # , OrderedSet):
     def __repr__(self) -> str:
         return f'<Compound: {self.repr()}>'
 
+    def _render_word(self) -> str:
+        return self._terms_to_word(*self._terms)
+
     def _terms_to_word(self, *terms: Term):
         connector = self.connector
         if connector == Connector.ExtensionalSet:
@@ -359,11 +390,11 @@ class Compound(Term):  # , OrderedSet):
 
     @classmethod
     def ExtensionalSet(cls, *terms: Term) -> Type['Compound']:
-        return cls._convert(Compound(Connector.ExtensionalSet, *terms))
+        return cls._convert(Compound.build(Connector.ExtensionalSet, *terms))
 
     @classmethod
     def IntensionalSet(cls, *terms: Term) -> Type['Compound']:
-        return cls._convert(Compound(Connector.IntensionalSet, *terms))
+        return cls._convert(Compound.build(Connector.IntensionalSet, *terms))
 
     @classmethod
     def Instance(cls, term: Term) -> Type['Compound']:
@@ -385,7 +416,7 @@ class Compound(Term):  # , OrderedSet):
         elif terms is not None:
             if idx is not None:
                 terms: list = [*terms[:idx], place_holder, *terms[idx:]]
-            compound = Compound(Connector.ExtensionalImage, term_relation, *terms)
+            compound = Compound.build(Connector.ExtensionalImage, term_relation, *terms)
         return cls._convert(compound)
 
     @classmethod
@@ -400,7 +431,7 @@ class Compound(Term):  # , OrderedSet):
         elif terms is not None:
             if idx is not None:
                 terms: list = [*terms[:idx], place_holder, *terms[idx:]]
-            compound = Compound(Connector.IntensionalImage, term_relation, *terms)
+            compound = Compound.build(Connector.IntensionalImage, term_relation, *terms)
         return cls._convert(compound)
 
     @classmethod
@@ -408,8 +439,8 @@ class Compound(Term):  # , OrderedSet):
         '''Convert Image to Image'''
         idx_replaced = compound_image.terms.index(replaced_term) if idx_replaced is None else idx_replaced
 
-        compound = Compound(compound_image.connector,
-                            *((place_holder if i == idx_replaced else tm if tm != place_holder else replaced_term) for
+        compound = Compound.build(compound_image.connector,
+                                  *((place_holder if i == idx_replaced else tm if tm != place_holder else replaced_term) for
                               i, tm in enumerate(compound_image)))
 
         return cls._convert(compound)
@@ -420,7 +451,7 @@ class Compound(Term):  # , OrderedSet):
             idx = compound_image.terms.index(place_holder) - 1 if idx is None else idx
             compound = Compound.Product(*((tm if i != idx else term) for i, tm in enumerate(compound_image.terms[1:])))
         else:
-            compound = Compound(Connector.Product, term, *terms)
+            compound = Compound.build(Connector.Product, term, *terms)
         return cls._convert(compound)
 
     @classmethod
@@ -428,50 +459,50 @@ class Compound(Term):  # , OrderedSet):
         if term.is_compound and term.connector == Connector.Negation:
             compound = term[0]
         else:
-            compound = Compound(Connector.Negation, term)
+            compound = Compound.build(Connector.Negation, term)
         return cls._convert(compound)
 
     @classmethod
     def Conjunction(cls, *terms: Union[Term, Type['Compound']]) -> Type['Compound']:
         terms = (term for compound in terms for term in
                  (compound if compound.is_compound and compound.connector == Connector.Conjunction else (compound,)))
-        return cls._convert(Compound(Connector.Conjunction, *terms))
+        return cls._convert(Compound.build(Connector.Conjunction, *terms))
 
     @classmethod
     def Disjunction(cls, *terms: Union[Term, Type['Compound']]) -> Type['Compound']:
         terms = (term for compound in terms for term in
                  (compound if compound.is_compound and compound.connector == Connector.Disjunction else (compound,)))
-        return cls._convert(Compound(Connector.Disjunction, *terms))
+        return cls._convert(Compound.build(Connector.Disjunction, *terms))
 
     @classmethod
     def IntensionalIntersection(cls, *terms: Union[Term, Type['Compound']]) -> Type['Compound']:
         terms = (term for compound in terms for term in (
             compound if compound.is_compound and compound.connector == Connector.IntensionalIntersection else (
             compound,)))
-        return cls._convert(Compound(Connector.IntensionalIntersection, *terms))
+        return cls._convert(Compound.build(Connector.IntensionalIntersection, *terms))
 
     @classmethod
     def ExtensionalIntersection(cls, *terms: Union[Term, Type['Compound']]) -> Type['Compound']:
         terms = (term for compound in terms for term in (
             compound if compound.is_compound and compound.connector == Connector.ExtensionalIntersection else (
             compound,)))
-        return cls._convert(Compound(Connector.ExtensionalIntersection, *terms))
+        return cls._convert(Compound.build(Connector.ExtensionalIntersection, *terms))
 
     @classmethod
     def ExtensionalDifference(cls, term1: Term, term2: Term) -> Type['Compound']:
-        return cls._convert(Compound(Connector.ExtensionalDifference, term1, term2))
+        return cls._convert(Compound.build(Connector.ExtensionalDifference, term1, term2))
 
     @classmethod
     def IntensionalDifference(cls, term1: Term, term2: Term) -> Type['Compound']:
-        return cls._convert(Compound(Connector.IntensionalDifference, term1, term2))
+        return cls._convert(Compound.build(Connector.IntensionalDifference, term1, term2))
 
     @classmethod
     def SequentialEvents(cls, *terms: Union[Term, Interval]) -> Type['Compound']:
-        return cls._convert(Compound(Connector.SequentialEvents, *terms))
+        return cls._convert(Compound.build(Connector.SequentialEvents, *terms))
 
     @classmethod
     def ParallelEvents(cls, *terms: Term) -> Type['Compound']:
-        return cls._convert(Compound(Connector.ParallelEvents, *terms))
+        return cls._convert(Compound.build(Connector.ParallelEvents, *terms))
 
     def clone(self):
         if not self.has_var: return self
@@ -6,7 +6,6 @@ from enum import Enum
 from .Tense import Tense
 from typing import Tuple, Type, Set, List, Union
 
-from ordered_set import OrderedSet
 # from .Evidence import Base
 # from .Task import *
 
@@ -22,55 +21,81 @@ from pynars import Global
 #         return (self._hash_task==evidence._hash_task) and (self._input_id==evidence._input_id)
 
 class Base:
-    '''Evidential Base'''
+    '''
+    Evidential Base
+    The IDs of the evidence are stored as a sorted tuple, no longer than `Config.max_evidence_length`, so that the overlap of two bases is checked by a linear merge. Since the IDs of the inputs increase with time, the evidence with smaller IDs is the older one, and it's dropped first when a base overflows (see `interleave`).
+    '''
+    __slots__ = ('_ids', '_hash')
+
     def __init__(self, terms: Tuple[int]=tuple()) -> None:
         # TODO: DOUBT --
         # IF `<A-->B>.`, `<B-->C>.`, `<C--D>.`, THEN it can be derived in a single that `<A-->C>.`, `<B-->D>.`.
         # In the second step, it can be derived that `{<A-->B>. <B-->D>.} |- (1) <A-->D>.`, and `{<A-->C>. <C-->D>.} |- (2) <A-->D>.`
         # Is it reasonable theoretically to apply revision rules between (1) and (2)?
 
-        self._set: Set[int] = OrderedSet(terms)
+        # an evidence which is not an ID is stored by its hash.
+        ids = sorted({evidence if type(evidence) is int else hash(evidence) for evidence in terms})
+        self._ids: Tuple[int] = tuple(ids[-Config.max_evidence_length:]) if len(ids) > Config.max_evidence_length else tuple(ids)
         self._hash = None
-    
+
     @classmethod
-    def interleave(self, base1, base2) -> Type['Base']:
-        '''interleave two bases'''
+    def interleave(cls, base1: Type['Base'], base2: Type['Base']) -> Type['Base']:
+        '''
+        interleave two bases, from the newest evidence of each to the oldest, until the base is full, so that both bases keep their most recent evidence when the base overflows.
+        Ref: OpenNARS 3.1.0 Stamp.java line 178~187.
+        '''
         # TODO: DOUBT --
         # What if some evidence is lost (because of forgetting)?
-
-        # TODO: DOUBT --
-        # Is the base ordered? What kind of evidence should overflow?
-        
-
-        # TODO: Ref: OpenNARS 3.1.0 Stamp.java line 178~187.
-        # TODO: Optimize this loop with cython (with python-style).
-        # while (j < baseLength) {
-        #     if(i2 < secondLength) {
-        #         evidentialBase[j++] = secondBase[i2++];
-        #     }
-        #     if(i1 < firstLength) {
-        #         evidentialBase[j++] = firstBase[i1++];
-        #     }
-        # }
+        base = cls.__new__(cls)
+        base._hash = None
+        ids1, ids2 = base1._ids, base2._ids
+        max_length = Config.max_evidence_length
+        if len(ids1) + len(ids2) <= max_length:
+            base._ids = tuple(sorted(set(ids1).union(ids2)))
+            return base
+        ids = set()
+        i1, i2 = len(ids1) - 1, len(ids2) - 1
+        while len(ids) < max_length and (i1 >= 0 or i2 >= 0):
+            if i2 >= 0:
+                ids.add(ids2[i2])
+                i2 -= 1
+            if i1 >= 0 and len(ids) < max_length:
+                ids.add(ids1[i1])
+                i1 -= 1
+        base._ids = tuple(sorted(ids))
+        return base
 
     def add(self, id_evidence: int):
         self._hash = None
-        self._set.add(id_evidence)
+        self._ids = Base.interleave(Base((id_evidence,)), self)._ids
         return self
     
     def extend(self, base: Union[Type['Base'] , None]):
+        if base is None: return self
         self._hash = None
-        self._set = self._set.union(base._set)
+        self._ids = Base.interleave(self, base)._ids
         return self
 
     def is_overlaped(self, base: Union[Type['Base'], None]) -> bool:
         ''' Check whether another `Base` object is overlapped with `self`.
-        Complexity: O(N) N=min(len(self), len(o))
+        Complexity: O(N+M), by a linear merge of the sorted IDs, and O(1) if the ranges of the IDs are disjoint.
         '''
-        return not self._set.isdisjoint(base._set) if base is not None else False
+        if base is None: return False
+        ids1, ids2 = self._ids, base._ids
+        if len(ids1) == 0 or len(ids2) == 0 or ids1[-1] < ids2[0] or ids2[-1] < ids1[0]: return False
+        n1, n2 = len(ids1), len(ids2)
+        # for long bases, the loop in Python is slower than a set.
+        if n1 + n2 > 16: return not set(ids1).isdisjoint(ids2)
+        i1 = i2 = 0
+        while i1 < n1 and i2 < n2:
+            id1, id2 = ids1[i1], ids2[i2]
+            if id1 == id2: return True
+            elif id1 < id2: i1 += 1
+            else: i2 += 1
+        return False
     
     def do_hashing(self):
-        self._hash = hash(frozenset(self._set))
+        self._hash = hash(self._ids)
         return self._hash
 
     def __eq__(self, o: Type['Base']) -> bool:
@@ -79,21 +104,28 @@ class Base:
             return True
         elif hash(self) != hash(o):
             return False
-        return self._set == o._set
+        return self._ids == o._ids
     
     def __or__(self, base: Type['Base']) -> Type['Base']:
-        return Base(self._set | base._set)
+        return Base.interleave(self, base)
 
     def __ior__(self, base: Type['Base']) -> Type['Base']:
-        self._hash = None
-        self._set |= base._set
-        return self
+        return self.extend(base)
 
     def __hash__(self) -> int:
         return self._hash if self._hash is not None else self.do_hashing()
 
+    def __iter__(self):
+        return iter(self._ids)
+
     def __len__(self) -> int:
-        return len(self._set)
+        return len(self._ids)
+
+    def __deepcopy__(self, memo):
+        # the IDs are immutable, and are shared by the copy.
+        base = Base.__new__(Base)
+        base._ids, base._hash = self._ids, self._hash
+        return base
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({len(self._set)})"
+        return f"{self.__class__.__name__}({len(self._ids)})"
@@ -3,9 +3,11 @@ from .Term import Term
 
 
 class Interval(Term):
+    __slots__ = ('interval',)
+
     is_interval: bool = True
-    def __init__(self, interval, do_hashing=False, word_sorted=None, is_input=False) -> None:
-        super().__init__("+"+str(interval), do_hashing=do_hashing, word_sorted=word_sorted, is_input=is_input)
+    def __init__(self, interval, do_hashing=False, is_input=False) -> None:
+        super().__init__("+"+str(interval), do_hashing=do_hashing, is_input=is_input)
         self.interval = int(interval)
 
     def __repr__(self) -> str:
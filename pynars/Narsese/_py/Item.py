@@ -2,10 +2,14 @@ from .Budget import Budget
 from typing import Type
 from pynars.Config import Config
 from copy import deepcopy
+from pynars import Global
 class Item:
+    __slots__ = ('_hash_value', 't_touched', 'budget')
+
     def __init__(self, hash_value, budget: Budget=None, copy_budget=True) -> None:
         budget = (deepcopy(budget) if copy_budget else budget) if budget is not None else Budget(Config.priority, Config.durability, Config.quality)
         self._hash_value = hash_value
+        self.t_touched = Global.time  # the cycle when the item was last forgotten, in the lazy forgetting mode
         self.set_budget(budget)
 
     def set_budget(self, budget: Budget):
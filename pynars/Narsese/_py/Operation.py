@@ -1,7 +1,8 @@
 from .Term import Term
 
 class Operation(Term):
-    
+    __slots__ = ('_is_mental_operation',)
+
     is_operation = True
 
     def __init__(self, word, do_hashing=False, is_mental_operation=False) -> None:
@@ -18,10 +19,6 @@ class Operation(Term):
     def __repr__(self) -> str:
         return f'<Operation: {str(self)}>'
 
-    def do_hashing(self):
-        self._hash_value = hash(str(self))
-        return self._hash_value
-
 
 Anticipate = Operation('anticipate', True, is_mental_operation=True)
 Believe    = Operation('believe',    True, is_mental_operation=True)
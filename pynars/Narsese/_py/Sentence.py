@@ -37,6 +37,7 @@ class Punctuation(Enum):
 
 
 class Stamp:
+    __slots__ = ('t_creation', 't_occurrence', 't_put', 'evidential_base', 'is_external')
 
     def __init__(self, t_creation: int, t_occurrence: int, t_put: int, evidential_base: Type['Base'],
                  is_external: bool = True) -> None:
@@ -84,14 +85,20 @@ Doubt that are Question and Quest have got a tense?
 
 
 class Sentence:
-    truth: Truth = None
+    __slots__ = ('term', 'punct', 'stamp', 'truth')
+
+    truth: Truth
 
     def __init__(self, term: Term, punct: Punctuation, stamp: Stamp, do_hashing: bool = False) -> None:
         ''''''
-        self.term = term
-        self.word = term.word + str(punct.value)
+        self.term = term = term.intern()
         self.punct = punct
         self.stamp: Stamp = stamp
+        self.truth = None
+
+    @property
+    def word(self) -> str:
+        return self.term.word + str(self.punct.value)
 
     @property
     def evidential_base(self):
@@ -157,6 +164,8 @@ class Sentence:
 
 
 class Judgement(Sentence):
+    __slots__ = ()
+
     def __init__(self, term: Term, stamp: Stamp = None, truth: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None)
@@ -171,6 +180,8 @@ class Judgement(Sentence):
 
 
 class Goal(Sentence):
+    __slots__ = ()
+
     def __init__(self, term: Term, stamp: Stamp = None, desire: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None, None)
@@ -185,12 +196,15 @@ class Goal(Sentence):
 
 
 class Question(Sentence):
-    answer_best: Sentence = None
+    __slots__ = ('answer_best', 'is_query')
+
+    answer_best: Sentence
 
     def __init__(self, term: Term, stamp: Stamp = None, curiosiry: Truth = None) -> None:
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None, None)
         # stamp.set_eternal()
         Sentence.__init__(self, term, Punctuation.Question, stamp)
+        self.answer_best = None
         self.is_query = False  # TODO: if there is a query variable in the sentence, then `self.is_query=True`
 
     def __str__(self) -> str:
@@ -202,6 +216,8 @@ class Question(Sentence):
 
 
 class Quest(Sentence):
+    __slots__ = ('is_query',)
+
     def __init__(self, term: Term, stamp: Stamp = None, curiosiry: Truth = None) -> None:
         ''''''
         stamp = stamp if stamp is not None else Stamp(Global.time, None, None, None, None)
@@ -3,29 +3,26 @@ import enum
 from lib2to3.pgen2.tokenize import StopTokenizing
 from pynars.Config import Enable
 from pynars.utils.IndexVar import IndexVar
-from .Term import Term, TermType
+from .Term import Term, TermType, hash_code, hash_ints
 from .Copula import Copula
 from typing import List, Type
 # from .Compound import *f
 from ordered_set import OrderedSet
 
 class Statement(Term):
+    __slots__ = ('subject', 'copula', 'predicate', '_is_commutative', '_is_higher_order', 'is_operation')
+
     type = TermType.STATEMENT
     
     def __init__(self, subject: Term, copula: Copula, predicate: Term, is_input: bool=False) -> None:
         self._is_commutative = copula.is_commutative
-        word = "<"+str(subject)+str(copula.value)+str(predicate)+">"
-        if self.is_commutative:
-            subject_word, predicate_word = sorted((subject, predicate), key=hash)
-            word_sorted = "<"+subject_word.word_sorted+str(copula.value)+predicate_word.word_sorted+">"
-        else: word_sorted = "<"+subject.word_sorted+str(copula.value)+predicate.word_sorted+">"
-        super().__init__(word, word_sorted=word_sorted)
+        super().__init__(None)
 
         self.subject = subject
         self.copula = copula
         self.predicate = predicate
 
-        self._components = OrderedSet((*self.subject.sub_terms, *self.predicate.sub_terms))
+        self._build_index_components((subject, predicate))
         self._complexity += (subject.complexity + predicate.complexity)
         self._is_higher_order = copula.is_higher_order
 
@@ -59,6 +56,19 @@ class Statement(Term):
     def terms(self):
         return (self.subject, self.predicate)
 
+    def _render_word(self) -> str:
+        return "<"+str(self.subject)+str(self.copula.value)+str(self.predicate)+">"
+
+    def _structure(self):
+        ids = (hash(self.subject), hash(self.predicate))
+        if self.is_commutative: ids = tuple(sorted(ids))
+        return (Statement, self.copula, *ids, self.index_var.postions_normalized if self.index_var is not None else None)
+
+    def _do_hashing64(self):
+        hashes = (self.subject.hash64, self.predicate.hash64)
+        if self.is_commutative: hashes = sorted(hashes)
+        return hash_ints((hash_code(Statement.__name__), hash_code(self.copula.value), *hashes, *self._layout_var()))
+
     def equal(self, o: Type['Statement']) -> bool:
         '''
         Return:
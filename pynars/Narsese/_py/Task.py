@@ -24,16 +24,16 @@ class Task(Item):
     one.
     """
 
-    input_id = -1
+    __slots__ = ('parent_task', 'generated_tasks', 'sentence', 'input_id')
 
-    def __init__(self, sentence: Sentence, budget: Budget = None, input_id: int = None) -> None:
-        super().__init__(hash(sentence), budget)
+    def __init__(self, sentence: Sentence, budget: Budget = None, input_id: int = None, copy_budget: bool = True) -> None:
+        super().__init__(hash(sentence), budget, copy_budget)
 
         self.parent_task = None
         self.generated_tasks = []  # so far it is only for the backward tasks, say questions, goals, queries.
 
         self.sentence: Sentence = sentence
-        self.input_id = self.input_id if input_id is None else input_id
+        self.input_id = -1 if input_id is None else input_id
 
     def withdraw_brothers(self):
         """
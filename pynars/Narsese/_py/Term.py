@@ -1,13 +1,36 @@
 from pynars.Narsese._py.Connector import Connector
 from .Copula import Copula
-from pynars.Config import Enable
-from typing import Iterable, List, Set, Type
+from pynars.Config import Config, Enable
+from typing import Dict, Iterable, List, Set, Type
 from enum import Enum
 from pynars.utils.IndexVar import IndexVar
+from .TermTable import term_table
 from numpy import prod
 from ordered_set import OrderedSet
 # from pynars.utils.tools import find_pos_with_pos, find_var_with_pos
 from copy import copy, deepcopy
+from hashlib import blake2b
+from struct import pack
+
+def hash_bytes(data: bytes) -> int:
+    '''a 64-bit hash value of the bytes, which is the same across processes and runs, unlike `hash(str)`.'''
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), 'little')
+
+
+def hash_ints(values: Iterable[int]) -> int:
+    '''a 64-bit hash value of the sequence of non-negative 64-bit integers, see `hash_bytes`.'''
+    values = tuple(values)
+    return hash_bytes(pack(f'<{len(values)}Q', *values))
+
+
+_codes = {}
+def hash_code(name: str) -> int:
+    '''the 64-bit code of a name, e.g., a class name or the value of a connector/copula.'''
+    code = _codes.get(name, None)
+    if code is None:
+        code = _codes[name] = hash_bytes(name.encode())
+    return code
+
 
 class TermType(Enum):
     ATOM = 0
@@ -15,15 +38,16 @@ class TermType(Enum):
     COMPOUND = 2
 
 class Term:
+    __slots__ = ('_word', '_repr', '_index_components', '_hash_value', '_hash64', '_index_var', '_complexity', 'has_var', 'has_ivar', 'has_dvar', 'has_qvar', '_canonical', '__weakref__')
 
     type = TermType.ATOM
     copula: Copula = None
     connector: Connector = None
-    _complexity: float = 1.0 # The complexity of the term. Read only.
-    has_var: bool = False # Whether the term contains variable(s).
-    has_ivar: bool = False # Whether the term contains independent variable(s).
-    has_dvar: bool = False # Whether the term contains dependent variable(s).
-    has_qvar: bool = False # Whether the term contains query variable(s).
+    _complexity: float # The complexity of the term. Read only.
+    has_var: bool # Whether the term contains variable(s).
+    has_ivar: bool # Whether the term contains independent variable(s).
+    has_dvar: bool # Whether the term contains dependent variable(s).
+    has_qvar: bool # Whether the term contains query variable(s).
     is_var: bool = False
     is_ivar: bool = False
     is_dvar: bool = False
@@ -33,15 +57,18 @@ class Term:
     is_interval: bool = False
 
     is_operation = False 
-    _index_var: IndexVar = None
+    _index_var: IndexVar
+    _canonical: 'Term' # the canonical term with the same structure, held so that the ID of the term is not released before the term, or `None` if the term is the canonical one, see `TermTable`.
     
-    def __init__(self, word, do_hashing=False, word_sorted=None, is_input=False) -> None:
-        self.word = word
-        self.word_sorted = word_sorted if word_sorted is not None else word
-        self._components: Set[Term] = None
+    def __init__(self, word, do_hashing=False, is_input=False) -> None:
+        self._word = word # `None` if the word is rendered on demand, see `Term.word`.
+        self._repr = None
+        self._index_components: Dict[Term, List[tuple]] = None # the positions of each component, including the components of components, etc.
+        self._hash64 = None
+        self._complexity = 1.0
+        self.has_var = self.has_ivar = self.has_dvar = self.has_qvar = False
 
-        if Enable.variable:
-            if self._index_var is None: self._index_var = IndexVar()
+        self._index_var = IndexVar() if Enable.variable else None
 
         if do_hashing:
             self.do_hashing()
@@ -49,6 +76,15 @@ class Term:
             self._hash_value = None
         
 
+    @property
+    def word(self) -> str:
+        '''the string of the term, which is rendered on the first access and then cached, since most of the derived terms are never printed. It is never used for hashing or comparing compounds and statements.'''
+        if self._word is None: self._word = self._render_word()
+        return self._word
+
+    def _render_word(self) -> str:
+        return self._word
+
     @property
     def sub_terms(self) -> Set[Type['Term']]:
         return (self, *self._components) if self._components is not None else set((self, ))
@@ -56,6 +92,33 @@ class Term:
     @property
     def components(self) ->Set[Type['Term']]:
         return self._components
+
+    @property
+    def _components(self) -> Set[Type['Term']]:
+        '''the components (including the components of components, etc.), in the order of depth-first search, which is a set-like view of `self._index_components`.'''
+        return self._index_components.keys() if self._index_components is not None else None
+
+    def _build_index_components(self, terms: Iterable[Type['Term']]):
+        '''Build the positions of all the components from those of the direct components `terms`, once the term is constructed.'''
+        index_components = {}
+        for i, term in enumerate(terms):
+            positions = index_components.get(term, None)
+            if positions is None: index_components[term] = positions = []
+            positions.append((i,))
+            if term._index_components is None: continue
+            for component, positions_sub in term._index_components.items():
+                positions = index_components.get(component, None)
+                if positions is None: index_components[component] = positions = []
+                positions.extend((i, *position) for position in positions_sub)
+        self._index_components = index_components
+
+    def get_positions(self, term: Type['Term']) -> List[tuple]:
+        '''
+        Get all the positions of the term within this term, e.g., the positions of `A` within `<(&,B,A)-->(&,A,C)>` are `[(0,1), (1,0)]`, and the position of this term itself is `[()]`.
+        Returns `None` if the term is not in this term.
+        '''
+        if term == self: return [()]
+        return self._index_components.get(term, None) if self._index_components is not None else None
     
 
     def count(self):
@@ -109,7 +172,7 @@ class Term:
         return False
 
     def identical(self, o: Type['Term']) -> bool:
-        return hash(o) == hash(self) # and hash(o.index_var) == hash(self.index_var)
+        return self is o or hash(o) == hash(self) # and hash(o.index_var) == hash(self.index_var)
 
     def equal(self, o: Type['Term']) -> bool:
         '''
@@ -135,18 +198,63 @@ class Term:
         if not term.is_atom: return False
         return self == term
 
+    @property
+    def id(self) -> int:
+        '''the dense integer ID of the structure of the term, see `TermTable`.'''
+        return hash(self)
+
+    def _structure(self):
+        '''the key of the term in the `TermTable`, which is made of the IDs of the components rather than the components themselves.'''
+        return (self.__class__, self.word)
+
+    @property
+    def hash64(self) -> int:
+        '''
+        the 64-bit structural hash value of the term, which is computed bottom-up from the hash values of the components, the code of the connector/copula and the layout of the variables.
+        Unlike `hash(term)` (see `TermTable`), it is the same across processes and runs, so that it can be used for sharding, persistence or exchanging terms between processes; however, different terms may happen to share the same value.
+        '''
+        if self._hash64 is None: self._hash64 = self._do_hashing64()
+        return self._hash64
+
+    def _do_hashing64(self):
+        return hash_ints((hash_code(self.__class__.__name__), hash_bytes(self.word.encode())))
+
+    def _layout_var(self):
+        '''the layout of the variables, flattened as integers'''
+        index_var = self.index_var
+        if index_var is None: return ()
+        return tuple(value for positions in index_var.postions_normalized for value in (len(positions), *positions))
+
+    def intern(self) -> Type['Term']:
+        '''
+        Return the canonical term with the same structure, so that the duplicate terms are released.
+        A term with variable(s) is returned as it is, since such terms are cloned and modified in place (e.g., the variables are renamed); it still gets its ID.
+        '''
+        return term_table.intern(self) if not self.has_var else self
+
     def do_hashing(self):
-        self._hash_value = hash(self.word_sorted+str(self.index_var.postions_normalized))
+        self._hash_value = term_table.id(self)
         return self._hash_value
 
     def __hash__(self) -> int:
         return self._hash_value if self._hash_value is not None else self.do_hashing()
-    
+
+    def __getstate__(self):
+        '''the ID (see `TermTable`) is local to the process, so it is dropped when the term is pickled, e.g., sent to or from a worker process, and assigned again on the first hashing after unpickling.'''
+        state = {name: getattr(self, name) for cls in type(self).__mro__ for name in cls.__dict__.get('__slots__', ()) if name != '__weakref__' and hasattr(self, name)}
+        state['_hash_value'] = None
+        state['_canonical'] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items(): setattr(self, name, value)
+
+
     def __eq__(self, o: Type['Term']) -> bool:
         return self.identical(o)
 
     def __contains__(self, term: Type['Term']) -> bool:
-        return term in self.sub_terms
+        return term == self or (self._index_components is not None and term in self._index_components)
 
     def __str__(self) -> str:
         return self.word
@@ -162,7 +270,12 @@ class Term:
         return self
 
     def repr(self, is_input=False):
-        return str(self) if not self.has_var else self.repr_with_var(self.index_var, [])
+        if not self.has_var: return str(self)
+        # the variables may be renumbered in place (see `IndexVar.remap`), so the cached string is checked against them.
+        key = (self.index_var.layout.variables, Config.variable_repr_normalized)
+        if self._repr is None or self._repr[0] != key:
+            self._repr = (key, self.repr_with_var(self.index_var, []))
+        return self._repr[1]
 
     def repr_with_var(self, index_var: IndexVar, pos: list):
         ''''''
@@ -177,28 +290,8 @@ class Term:
         self.has_qvar = bool(sum(tuple(term.has_qvar for term in terms)))
 
     def handle_index_var(self, terms: Iterable['Term'], is_input: bool):
-        if self.index_var is None: self._index_var = IndexVar()
         self.handle_variables(terms)
-        
-        indices_var_to_merge = []
-        for i, component in enumerate(terms):
-            if component.is_atom and component.is_var: 
-                if component.is_ivar: self.index_var.add_ivar([i], name=repr(component))
-                elif component.is_dvar: self.index_var.add_dvar([i], name=repr(component))
-                elif component.is_qvar: self.index_var.add_qvar([i], name=repr(component))
-            elif component.has_var: # but component itself is not variable
-                if component.has_ivar:
-                    for index in component.index_var.positions_ivar:
-                        self.index_var.add_ivar([i]+index)
-                if component.has_dvar:
-                    for index in component.index_var.positions_dvar:
-                        self.index_var.add_dvar([i]+index)
-                if component.has_qvar:
-                    for index in component.index_var.positions_qvar:
-                        self.index_var.add_qvar([i]+index)
-                indices_var_to_merge.append(component.index_var)
-        self.index_var.merge(*indices_var_to_merge, is_input=is_input)
-        self.index_var.normalize()
+        self._index_var = IndexVar.build(terms, is_input)
 
     def clone(self):
         # clone = copy(self)
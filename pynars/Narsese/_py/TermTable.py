@@ -0,0 +1,109 @@
+from typing import Dict, FrozenSet, Hashable, List, Tuple, Type, Union
+from weakref import ref
+
+
+class _Reference(ref):
+    '''a weak reference to the canonical term of an ID, which knows the ID, and whether the term has been interned.'''
+    __slots__ = ('term_id', 'interned')
+
+
+class TermTable:
+    '''
+    A hash-consing table of terms.
+
+    Each structure of term (see `Term._structure`) is assigned a dense integer ID, which is used as the hash value of the term, so that two terms are equal if and only if they have the same structure, and a bag, a table or an array can be keyed on the ID without any collision.
+    The first term assigned an ID, or later the first one interned, is the canonical term of the ID, which is held weakly, so that a term is not kept alive by the table. Any other term with the same structure holds the canonical one (see `Term._canonical`), so the canonical term is the last one holding the ID to be released, and the liveness of an ID is tracked by a single weak reference rather than one per term.
+    Once the canonical term is released, the structure is forgotten and the ID is released, so that the table is bounded by the terms alive rather than by all the terms ever seen.
+    The IDs released are recycled in batches of `n_recycle`, and the `generation` is increased by each batch, so that a cache keyed by the IDs (e.g., `RuleCache`) can tell that some of its keys (those in `ids_recycled`) may refer to other structures from then on.
+    '''
+
+    def __init__(self, n_recycle: int=1<<12) -> None:
+        self.n_recycle = n_recycle
+        self.generation = 0
+        self.ids_recycled: FrozenSet[int] = frozenset()  # the IDs recycled in the latest generation
+        self._ids: Dict[Tuple[Hashable, ...], int] = {}  # the ID of each structure
+        self._structures: List[Tuple[Hashable, ...]] = []  # the structure of each ID, or `None` if the ID is released
+        self._terms: List[Union[_Reference, None]] = []  # the weak reference to the canonical term of each ID, or `None` if the ID is released
+        self._released: List[int] = []  # the IDs released, to be recycled
+        self._free: List[int] = []  # the IDs recycled, to be reused
+
+    def id(self, term: Type['Term']) -> int:
+        '''Get the ID of the structure of the term, where a new one is assigned, with the term being the canonical one, if the structure has not been seen or has been released.'''
+        structure = term._structure()
+        term_id = self._ids.get(structure, None)
+        if term_id is not None:
+            canonical = self._terms[term_id]()
+            if canonical is not None:
+                term._canonical = canonical if canonical is not term else None
+                return term_id
+            # the canonical term is dead, but the ID has not been released yet, e.g., during a garbage collection.
+            self._release(term_id)
+        if len(self._free) > 0:
+            term_id = self._free.pop()
+            self._structures[term_id] = structure
+        else:
+            term_id = len(self._structures)
+            self._structures.append(structure)
+            self._terms.append(None)
+        self._ids[structure] = term_id
+        self._terms[term_id] = self._reference(term, term_id)
+        term._canonical = None
+        return term_id
+
+    def _reference(self, term: Type['Term'], term_id: int, interned: bool=False) -> _Reference:
+        reference = _Reference(term, self._on_release)
+        reference.term_id = term_id
+        reference.interned = interned
+        return reference
+
+    def _on_release(self, reference: _Reference):
+        '''called when the canonical term of an ID is released.'''
+        if self._terms[reference.term_id] is reference: self._release(reference.term_id)
+
+    def _release(self, term_id: int):
+        del self._ids[self._structures[term_id]]
+        self._structures[term_id] = None
+        self._terms[term_id] = None
+        self._released.append(term_id)
+        if len(self._released) >= self.n_recycle: self._recycle()
+
+    def _recycle(self):
+        self.ids_recycled = frozenset(self._released)
+        self._free.extend(self._released)
+        self._released = []
+        self.generation += 1
+
+    def intern(self, term: Type['Term']) -> Type['Term']:
+        '''Get the canonical term with the same structure as the given one. The given term becomes the canonical one if no term with the structure has been interned.'''
+        term_id = hash(term)
+        reference = self._terms[term_id]
+        if not reference.interned:
+            canonical = reference()
+            if canonical is not term:
+                # the former canonical term, which the other terms may hold, holds the new one instead.
+                canonical._canonical = term
+                term._canonical = None
+                reference = self._terms[term_id] = self._reference(term, term_id, True)
+            else: reference.interned = True
+            return term
+        canonical = term._canonical
+        if canonical is None: return term
+        # a term hashed before the canonical term changed holds the former one.
+        return canonical._canonical if canonical._canonical is not None else canonical
+
+    def get(self, id: int) -> Type['Term']:
+        '''Get the canonical term of the ID, or `None` if there is no such term alive.'''
+        reference = self._terms[id] if 0 <= id < len(self._terms) else None
+        return reference() if reference is not None else None
+
+    def __contains__(self, term: Type['Term']) -> bool:
+        return term._structure() in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f'<TermTable: #ids={len(self)}, #free={len(self._free)}, generation={self.generation}>'
+
+
+term_table = TermTable()
@@ -3,6 +3,7 @@ from typing import Type
 import numpy as np
 
 class Truth:
+    __slots__ = ('f', 'c', 'k')
     # analytic: Type['Truth']
     def __init__(self, f, c, k) -> None:
         self.f = f 
@@ -13,14 +13,16 @@ class VarPrefix(Enum):
 
 
 class Variable(Term):
+    __slots__ = ('prefix', 'name', 'dependents', 'is_ivar', 'is_dvar', 'is_qvar')
+
     is_var: bool = True
-    has_var: bool = True
     
     def __init__(self, prefix: VarPrefix, word: str, do_hashing=False, is_input=False) -> None:
         self.prefix = prefix
         self.name = str(word)
         word = prefix.value
         super().__init__(word, do_hashing=do_hashing)
+        self.has_var = True
         self.dependents = [] # only for dependent variable. TODO: implement son classes of Variable, including DependentVar, IndependentVar, QueryVar.
         # self.has_variable: bool = True
 
@@ -76,5 +78,5 @@ class Variable(Term):
     
     def clone(self) -> Type['Variable']:
         clone = copy(self)
-        clone._index_var = deepcopy(self._index_var)
+        clone._index_var = self._index_var.clone() if self._index_var is not None else None
         return clone
\ No newline at end of file
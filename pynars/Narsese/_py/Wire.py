@@ -0,0 +1,298 @@
+from enum import IntEnum
+from struct import Struct
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .Budget import Budget
+from .Compound import Compound
+from .Connector import Connector
+from .Copula import Copula
+from .Evidence import Base
+from .Interval import Interval
+from .Operation import Operation
+from .Sentence import Sentence, Judgement, Goal, Question, Quest, Punctuation, Stamp
+from .Statement import Statement
+from .Task import Task
+from .Term import Term
+from .Terms import Terms
+from .Truth import Truth
+from .Variable import Variable, VarPrefix
+
+
+class Opcode(IntEnum):
+    '''the first byte of each term in the binary format.'''
+    ATOM = 0        # u16 length, utf-8 word
+    VARIABLE = 1    # u8 prefix, u16 variable
+    INTERVAL = 2    # i64 interval
+    OPERATION = 3   # u8 is_mental_operation, u16 length, utf-8 word
+    STATEMENT = 4   # u8 copula, subject, predicate
+    COMPOUND = 5    # u8 connector, u16 number of components, components
+    REFERENCE = 6   # u32 index of a term already in the stream
+
+
+_opcode = Struct('<B')
+_opcode_u8 = Struct('<BB')
+_opcode_u16 = Struct('<BH')
+_opcode_u32 = Struct('<BI')
+_opcode_i64 = Struct('<Bq')
+_opcode_u8_u16 = Struct('<BBH')
+_u8 = Struct('<B')
+_u8_u16 = Struct('<BH')
+_u16 = Struct('<H')
+_u32 = Struct('<I')
+_i64 = Struct('<q')
+_f64x3 = Struct('<3d')
+_f64x2_i64 = Struct('<2dq')
+_header = Struct('<4sH')  # magic number, version
+
+_MAGIC = b'NARW'
+_VERSION = 1
+
+_copulas: Tuple[Copula] = tuple(Copula)
+_connectors: Tuple[Connector] = tuple(Connector)
+_prefixes: Tuple[VarPrefix] = (VarPrefix.Independent, VarPrefix.Dependent, VarPrefix.Query)
+_puncts: Tuple[Punctuation] = tuple(Punctuation)
+_sentences = {Punctuation.Judgement: Judgement, Punctuation.Question: Question, Punctuation.Goal: Goal, Punctuation.Quest: Quest}
+
+# the flags of a stamp
+_HAS_CREATION = 1
+_HAS_OCCURRENCE = 2
+_HAS_PUT = 4
+_HAS_BASE = 8
+_IS_EXTERNAL = 16
+
+
+class WireEncoder:
+    '''
+    Encode tasks, sentences, terms, truth-values, budgets and stamps into a compact binary format, appended to `self.buffer`.
+
+    A stream starts with a header of a magic number and the version of the format, which is checked by the decoder.
+    A term is a tree of opcodes (see `Opcode`), where a compound is prefixed by the number of its components. Each term without variables is written only once by an encoder, and then referred to by its order of appearance in the stream, so that a stream of tasks sharing a lot of terms is kept small. The process-local IDs of the terms (see `TermTable`) are never written, so the buffer can be decoded in any other process.
+    Truth-values and budgets are written as fixed-width floats (except the evidential horizon `k`, which is an integer), and the other numbers as fixed-width integers, all little-endian.
+    '''
+
+    def __init__(self) -> None:
+        self.buffer = bytearray(_header.pack(_MAGIC, _VERSION))
+        self._references: Dict[Term, int] = {}
+
+    def write_task(self, task: Task):
+        self.buffer += _f64x3.pack(*task.budget)
+        self.buffer += _i64.pack(task.input_id)
+        self.write_sentence(task.sentence)
+
+    def write_sentence(self, sentence: Sentence):
+        self.buffer += _u8.pack(_puncts.index(sentence.punct))
+        self.write_term(sentence.term)
+        if sentence.is_judgement or sentence.is_goal: self.write_truth(sentence.truth)
+        self.write_stamp(sentence.stamp)
+
+    def write_truth(self, truth: Truth):
+        self.buffer += _f64x2_i64.pack(truth.f, truth.c, truth.k)
+
+    def write_budget(self, budget: Budget):
+        self.buffer += _f64x3.pack(*budget)
+
+    def write_stamp(self, stamp: Stamp):
+        base = stamp.evidential_base
+        flags = (_HAS_CREATION if stamp.t_creation is not None else 0) | (_HAS_OCCURRENCE if stamp.t_occurrence is not None else 0) | (_HAS_PUT if stamp.t_put is not None else 0) | (_HAS_BASE if base is not None else 0) | (_IS_EXTERNAL if stamp.is_external else 0)
+        buffer = self.buffer
+        buffer += _u8.pack(flags)
+        if stamp.t_creation is not None: buffer += _i64.pack(stamp.t_creation)
+        if stamp.t_occurrence is not None: buffer += _i64.pack(stamp.t_occurrence)
+        if stamp.t_put is not None: buffer += _i64.pack(stamp.t_put)
+        if base is not None:
+            buffer += _u32.pack(len(base))
+            buffer += Struct(f'<{len(base)}q').pack(*base)
+
+    def write_term(self, term: Term):
+        variables = self._variables(term) if term.has_var and term.index_var is not None else None
+        self._write_term(term, variables, ())
+
+    def _write_term(self, term: Term, variables: Union[Dict[tuple, Tuple[int, int]], None], position: tuple):
+        '''
+        variables: the (prefix, variable) at each position within the root term, if it has variables.
+        position: the position of `term` within the root term.
+        '''
+        buffer = self.buffer
+        if not term.has_var:
+            index = self._references.get(term, None)
+            if index is not None:
+                buffer += _opcode_u32.pack(Opcode.REFERENCE, index)
+                return
+
+        if term.is_statement:
+            buffer += _opcode_u8.pack(Opcode.STATEMENT, int(term.copula))
+            self._write_term(term.subject, variables, (*position, 0))
+            self._write_term(term.predicate, variables, (*position, 1))
+        elif term.is_compound:
+            terms = term.terms
+            buffer += _opcode_u8_u16.pack(Opcode.COMPOUND, int(term.connector), len(terms))
+            for i, component in enumerate(terms):
+                self._write_term(component, variables, (*position, i))
+        elif term.is_var:
+            prefix, var = variables.get(position, (_prefixes.index(term.prefix), 0)) if variables is not None else (_prefixes.index(term.prefix), 0)
+            buffer += _opcode_u8.pack(Opcode.VARIABLE, prefix)
+            buffer += _u16.pack(var)
+        elif term.is_interval:
+            buffer += _opcode_i64.pack(Opcode.INTERVAL, int(term))
+        elif term.is_operation:
+            word = term.word.encode()
+            buffer += _opcode_u8.pack(Opcode.OPERATION, term.is_mental_operation)
+            buffer += _u16.pack(len(word))
+            buffer += word
+        else:
+            word = term.word.encode()
+            buffer += _opcode_u16.pack(Opcode.ATOM, len(word))
+            buffer += word
+
+        # the decoder registers the terms in the same (post-)order
+        if not term.has_var: self._references[term] = len(self._references)
+
+    @staticmethod
+    def _variables(term: Term) -> Dict[tuple, Tuple[int, int]]:
+        '''the (prefix, variable) at each position, where the variables are normalized (see `IndexVar.normalize`), so that they are the same for the equal terms.'''
+        index_var = term.index_var
+        variables = {}
+        for prefix, (positions, variables_normalized) in enumerate(zip((index_var.positions_ivar, index_var.positions_dvar, index_var.positions_qvar), index_var.postions_normalized)):
+            for position, var in zip(positions, variables_normalized):
+                variables[tuple(position)] = (prefix, var)
+        return variables
+
+    def write_tasks(self, tasks: Iterable[Task]):
+        for task in tasks: self.write_task(task)
+
+    def __len__(self):
+        return len(self.buffer)
+
+
+class WireDecoder:
+    '''
+    Decode what is encoded by `WireEncoder`, reading from `self.offset` onwards. The buffer is read through a `memoryview`, so that it is not copied, e.g., a `bytes`, a `bytearray` or a `mmap`.
+    A decoder has to read a stream from the start, since the terms may be referred to by their order of appearance in the stream; the header of the stream is checked when the decoder is created.
+    A buffer which is truncated, corrupted, or of another version of the format, raises `ValueError`.
+    '''
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]) -> None:
+        self.buffer = memoryview(buffer)
+        self.offset = 0
+        self._references: List[Term] = []
+        magic, version = self._unpack(_header)
+        if magic != _MAGIC: raise ValueError('Invalid buffer: not encoded by `WireEncoder`.')
+        if version != _VERSION: raise ValueError(f'Invalid buffer: version {version} of the format is not supported (expected {_VERSION}).')
+
+    @property
+    def is_end(self) -> bool:
+        return self.offset >= len(self.buffer)
+
+    def _unpack(self, struct: Struct) -> tuple:
+        if self.offset + struct.size > len(self.buffer): raise ValueError(f'Invalid buffer: truncated at offset {self.offset}.')
+        values = struct.unpack_from(self.buffer, self.offset)
+        self.offset += struct.size
+        return values
+
+    def _read_str(self, length: int) -> str:
+        if self.offset + length > len(self.buffer): raise ValueError(f'Invalid buffer: truncated at offset {self.offset}.')
+        try:
+            word = str(self.buffer[self.offset:self.offset+length], 'utf-8')
+        except UnicodeDecodeError as e:
+            raise ValueError(f'Invalid buffer: malformed word at offset {self.offset}.') from e
+        self.offset += length
+        return word
+
+    def _get(self, values: Union[tuple, list], index: int, name: str):
+        '''the value at the index just read, which is checked to be in range.'''
+        if index >= len(values): raise ValueError(f'Invalid buffer: {name} {index} out of range before offset {self.offset}.')
+        return values[index]
+
+    def read_task(self) -> Task:
+        budget = self.read_budget()
+        input_id, = self._unpack(_i64)
+        sentence = self.read_sentence()
+        return Task(sentence, budget, input_id, copy_budget=False)
+
+    def read_sentence(self) -> Sentence:
+        punct, = self._unpack(_u8)
+        punct = self._get(_puncts, punct, 'punctuation')
+        term = self.read_term()
+        truth = self.read_truth() if punct in (Punctuation.Judgement, Punctuation.Goal) else None
+        stamp = self.read_stamp()
+        return _sentences[punct](term, stamp, truth)
+
+    def read_truth(self) -> Truth:
+        return Truth(*self._unpack(_f64x2_i64))
+
+    def read_budget(self) -> Budget:
+        return Budget(*self._unpack(_f64x3))
+
+    def read_stamp(self) -> Stamp:
+        flags, = self._unpack(_u8)
+        t_creation = self._unpack(_i64)[0] if flags & _HAS_CREATION else None
+        t_occurrence = self._unpack(_i64)[0] if flags & _HAS_OCCURRENCE else None
+        t_put = self._unpack(_i64)[0] if flags & _HAS_PUT else None
+        if flags & _HAS_BASE:
+            n, = self._unpack(_u32)
+            base = Base(self._unpack(Struct(f'<{n}q')))
+        else: base = None
+        return Stamp(t_creation, t_occurrence, t_put, base, bool(flags & _IS_EXTERNAL))
+
+    def read_term(self) -> Term:
+        opcode, = self._unpack(_opcode)
+        if opcode == Opcode.REFERENCE:
+            index, = self._unpack(_u32)
+            return self._get(self._references, index, 'reference')
+
+        if opcode == Opcode.STATEMENT:
+            copula, = self._unpack(_u8)
+            subject = self.read_term()
+            predicate = self.read_term()
+            # the variables are named by their normalized numbers, so they are identified by their names as those of an input
+            term = Statement(subject, self._get(_copulas, copula, 'copula'), predicate, is_input=True)
+        elif opcode == Opcode.COMPOUND:
+            connector, n = self._unpack(_u8_u16)
+            connector = self._get(_connectors, connector, 'connector')
+            term = self._compound(connector, [self.read_term() for _ in range(n)])
+        elif opcode == Opcode.VARIABLE:
+            prefix, = self._unpack(_u8)
+            var, = self._unpack(_u16)
+            term = Variable(self._get(_prefixes, prefix, 'prefix'), str(var))
+        elif opcode == Opcode.INTERVAL:
+            interval, = self._unpack(_i64)
+            term = Interval(interval)
+        elif opcode == Opcode.OPERATION:
+            is_mental_operation, length = self._unpack(_u8_u16)
+            term = Operation(self._read_str(length), is_mental_operation=bool(is_mental_operation))
+        elif opcode == Opcode.ATOM:
+            length, = self._unpack(_u16)
+            term = Term(self._read_str(length), is_input=True)
+        else: raise ValueError(f'Invalid buffer: opcode {opcode} before offset {self.offset}.')
+
+        if not term.has_var: self._references.append(term)
+        return term
+
+    @staticmethod
+    def _compound(connector: Connector, terms: List[Term]) -> Compound:
+        '''
+        the compound of the components as they were encoded. The pre-processing in `Compound.__init__` is skipped, since the components of a compound have been processed when it was constructed; moreover, a derived compound is not always the same after being processed again, e.g., `(&, {A}, {B})`, and it may even have no component, e.g., `{}`.
+        '''
+        compound = Compound.__new__(Compound)
+        compound._is_commutative = connector.is_commutative
+        if any(term.has_var for term in terms): terms = Terms(terms, connector.is_commutative, is_input=True)
+        else: terms = Terms.build(terms, connector.is_commutative)
+        compound._init_terms(connector, terms)
+        return compound
+
+    def read_tasks(self) -> List[Task]:
+        tasks = []
+        while not self.is_end: tasks.append(self.read_task())
+        return tasks
+
+
+def encode_tasks(tasks: Iterable[Task]) -> bytes:
+    '''encode the tasks into a single buffer, where the common terms are written only once.'''
+    encoder = WireEncoder()
+    encoder.write_tasks(tasks)
+    return bytes(encoder.buffer)
+
+
+def decode_tasks(buffer: Union[bytes, bytearray, memoryview]) -> List[Task]:
+    '''decode all the tasks in a buffer encoded by `encode_tasks`.'''
+    return WireDecoder(buffer).read_tasks()
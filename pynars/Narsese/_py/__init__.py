@@ -13,9 +13,11 @@ from .Evidence import *
 from .Operation import *
 from .Interval import *
 from .Terms import *
+from .TermTable import *
 
 SELF = Compound(Connector.ExtensionalSet, Term('SELF', do_hashing=True))
 
 TRUE = Term('TRUE', do_hashing=True)
 FALSE = Term('FALSE', do_hashing=True)
 UNSURE = Term('UNSURE', do_hashing=True)
+from .Wire import *
@@ -1,81 +1,18 @@
-from copy import deepcopy
-from typing import Union
-import enum
-from typing import Callable, List, Tuple, Type
-from ordered_set import OrderedSet
-from bidict import bidict
-
-from numpy import prod
-
-class IntVar:
-    def __init__(self, num: int) -> None:
-        self.num = int(num)
-    
-    def __eq__(self, o: Type['IntVar']) -> bool:
-        if isinstance(o, IntVar): return self.num == o.num  
-        else: return self.num == o
-    
-    def __int__(self) -> bool:
-        return self.num
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Type
 
-    def __hash__(self) -> int:
-        return hash(self.num)
-
-    def __repr__(self) -> str:
-        return str(self.num)
-
-    def __call__(self, num: Union[int, None]):
-        if num is not None: self.num = int(num)
-        return self
-
-    def __gt__(self, o: Type['IntVar']):
-        if isinstance(o, IntVar): o = int(o)
-        return self.num > int(o)
-
-    def __ge__(self, o: Type['IntVar']):
-        if isinstance(o, IntVar): o = int(o)
-        return self.num >= int(o)
-
-    def __lt__(self, o: Type['IntVar']):
-        if isinstance(o, IntVar): o = int(o)
-        return self.num < int(o)
-
-    def __le__(self, o: Type['IntVar']):
-        return self.num <= int(o)
-
-    def __ne__(self, o: Type['IntVar']):
-        if isinstance(o, IntVar): o = int(o)
-        return self.num != int(o)
-
-    def __add__(self, o: Type['IntVar']):
-        return self.num + o
-
-    def __radd__(self, o: int):
-        return self + o
-
-    def __sub__(self, o: Type['IntVar']):
-        return self.num - o
 
-    def __rsub__(self, o: int):
-        return -self.num + o
-
-    def __mul__(self, o: Type['IntVar']):
-        return self.num * o
-
-    def __rmul__(self, o: Type['IntVar']):
-        return o * self.num
-
-    def __div__(self, o: Type['IntVar']):
-        return self.num / o
-
-    def __rdiv__(self, o: Type['IntVar']):
-        return  o / self.num
-
-    def __pos__(self, o: Type['IntVar']):
-        return  self
+class Layout(NamedTuple):
+    '''
+    The layout of the variables of a term, made up of plain integer tuples, so that it can be used as a key of a cache.
+    positions: the positions of the independent, dependent and query variables.
+    variables: the independent, dependent and query variables in each position.
+    names: the (name, variable) pairs.
+    '''
+    positions: Tuple[Tuple[Tuple[int, ...], ...], ...]
+    variables: Tuple[Tuple[int, ...], ...]
+    names: Tuple[Tuple[str, int], ...]
 
-    def __neg__(self, o: Type['IntVar']):
-        return IntVar(-self.num)
 
 class IndexVar:
     '''
@@ -90,35 +27,28 @@ class IndexVar:
         positions_unfolded = [[0], [1, 2], [3]]
         variables = [[0, 1], 1, 2]
         variables_unfolded = [0, 1, 1, 2]
+
+    The variables are plain integers. When the variables of a component are renumbered (see `merge` and `remap`), those of the components of the component are renumbered as well, so that the variables of a term and its components are kept consistent.
     '''
 
     _positions_normalized: tuple = None
     _hash_value = None
+    _layout: Layout = None
 
     def __init__(self) -> None:
         self.positions_dvar = [] # the positions of each dependent variable
         self.positions_ivar = [] # the positions of each independent variable
         self.positions_qvar = [] # the positions of each query variable
-        
-        self.var_dependent = [] # the dependent variable in each position.
-        self.var_independent = [] # the independent variable in each position.
-        self.var_query = [] # the query variable in each position.
-
-        self.dependents: List[tuple] = []
-
-        self.names_var: bidict = bidict()
 
+        self.var_dependent: List[int] = [] # the dependent variable in each position.
+        self.var_independent: List[int] = [] # the independent variable in each position.
+        self.var_query: List[int] = [] # the query variable in each position.
 
-    # def add_position_ivar(self, index: int):
-    #     self.positions_ivar.append(index)
-
-
-    # def add_position_dvar(self, index: int):
-    #     self.positions_dvar.append(index)
+        self.dependents: List[tuple] = []
 
+        self.names_var: Dict[str, int] = {} # the variable of each name
 
-    # def add_position_qvar(self, index: int):
-    #     self.positions_qvar.append(index)
+        self._components: Tuple[IndexVar] = () # the indices of the components merged into this one
 
 
     def add_ivar(self, index: int, name: str=None, index_var_component: Type['IndexVar']=None):
@@ -134,68 +64,107 @@ class IndexVar:
 
 
     def _add_var(self, positions: list, variables: list, index, name: str=None, index_var_component: Type['IndexVar']=None):
+        self._layout = None
         positions.append(index)
         if name is not None:
-            if name not in self.names_var: 
+            if name not in self.names_var:
                 self.names_var[name] = len(self.names_var)
-            variables.append(IntVar(self.names_var[name]))
-        # if index_var_component is not None:
-        #     pass
-        
+            variables.append(self.names_var[name])
+
+
     def merge(self, *indices_var: Type['IndexVar'], is_input: bool, substitution=None):
         if isinstance(indices_var, IndexVar): indices_var: Tuple[IndexVar] = (indices_var,)
         if len(indices_var) == 0: return
+        if substitution is not None: raise # TODO
+
+        layout = _merge(self.layout, tuple(index_var.layout for index_var in indices_var), is_input)
+        self.var_independent, self.var_dependent, self.var_query = (list(variables) for variables in layout.variables)
+        self.names_var = dict(layout.names)
+        self._components = (*self._components, *indices_var)
+        self._layout = layout
+        if is_input: self._renumber(indices_var)
+
+
+    def _renumber(self, indices_var: Tuple['IndexVar']):
+        '''renumber the variables of the components by their names, so that the same name is the same variable in the term and its components.'''
+        visited = set()
+        for index_var in indices_var:
+            mapping = {var: self.names_var[name] for name, var in index_var.names_var.items()}
+            index_var._remap(mapping, mapping, mapping, visited)
+            index_var.names_var.update({name: mapping[var] for name, var in index_var.names_var.items()})
+
+
+    def remap(self, mapping_ivar: Dict[int, int]=None, mapping_dvar: Dict[int, int]=None, mapping_qvar: Dict[int, int]=None):
+        '''renumber the variables in place, including those of the components merged into this one. A variable not in the mapping is left unchanged.'''
+        self._remap(mapping_ivar, mapping_dvar, mapping_qvar, set())
+
+
+    def _remap(self, mapping_ivar: Dict[int, int], mapping_dvar: Dict[int, int], mapping_qvar: Dict[int, int], visited: set):
+        # a component shared by several terms is renumbered only once
+        if id(self) in visited: return
+        visited.add(id(self))
+        if mapping_ivar is not None: self.var_independent = [mapping_ivar.get(var, var) for var in self.var_independent]
+        if mapping_dvar is not None: self.var_dependent = [mapping_dvar.get(var, var) for var in self.var_dependent]
+        if mapping_qvar is not None: self.var_query = [mapping_qvar.get(var, var) for var in self.var_query]
+        self._layout = None
+        for index_var in self._components:
+            index_var._remap(mapping_ivar, mapping_dvar, mapping_qvar, visited)
+
+
+    @classmethod
+    def build(cls, terms: Iterable[Type['Term']], is_input: bool) -> Type['IndexVar']:
+        '''
+        build the index of the variables of a term from its components.
+        The layout is looked up in a cache keyed by the layouts of the components, where the names of the variables are replaced by their order of appearance, so that the work is not repeated for the terms of the same shape, e.g., `<<$x-->A>==><$x-->B>>` and `<<$y-->C>==><$y-->D>>`.
+        '''
+        index_var = cls()
+        keys = []
+        indices_var = []
+        names: Dict[str, int] = {} # the names are replaced by their order of appearance in the key
+        for term in terms:
+            if term.is_atom and term.is_var:
+                keys.append((0 if term.is_ivar else 1 if term.is_dvar else 2, names.setdefault(repr(term), len(names))))
+            elif term.has_var: # but the term itself is not variable
+                layout = term.index_var.layout
+                keys.append(layout._replace(names=tuple((names.setdefault(name, len(names)), var) for name, var in layout.names)))
+                indices_var.append(term.index_var)
+            else:
+                keys.append(None)
+        layout = _build(tuple(keys), is_input)
+        names = tuple(names)
+        layout = layout._replace(names=tuple((names[name], var) for name, var in layout.names))
+        index_var._set_layout(layout)
+        index_var._components = tuple(indices_var)
+        if is_input: index_var._renumber(index_var._components)
+        index_var.normalize()
+        return index_var
+
+
+    def _set_layout(self, layout: Layout):
+        self.positions_ivar, self.positions_dvar, self.positions_qvar = ([list(position) for position in positions] for positions in layout.positions)
+        self.var_independent, self.var_dependent, self.var_query = (list(variables) for variables in layout.variables)
+        self.names_var = dict(layout.names)
+        self._layout = layout
 
-        # ivar_new = []
-        # dvar_new = []
-        # qvar_new = []
-        ivar_new = self.var_independent
-        dvar_new = self.var_dependent
-        qvar_new = self.var_query
-
-        set_names = OrderedSet(name for index_var in indices_var for name in index_var.names_var.keys())
 
-        names_var_new = bidict({name_var: i for i, name_var in enumerate(set_names-set(self.names_var.keys()), start=len(self.names_var))})
-        # self.names_var = names_var_new
-        self.names_var.update(names_var_new)
-        if is_input:
-
-            # mapping: Callable[[int, IndexVar], Int] = lambda var, index_var:  names_var_new[index_var.names_var.inverse[int(var)]]
-            mapping: Callable[[int, IndexVar], IntVar] = lambda var, index_var: var(names_var_new[index_var.names_var.inverse[int(var)]])
-
-            for index_var in indices_var:
-                ivar_new.extend([mapping(var, index_var) for var in index_var.var_independent])
-                dvar_new.extend([mapping(var, index_var) for var in index_var.var_dependent])
-                qvar_new.extend([mapping(var, index_var) for var in index_var.var_query])
-                index_var.names_var.update({key:value for key, value in names_var_new.items() if key in index_var.names_var})
-
-                
-                
-        elif substitution is not None:
-            raise # TODO
-        else:
-            for index_var in indices_var:
-                ivar_new.extend(index_var.var_independent)
-                dvar_new.extend(index_var.var_dependent)
-                qvar_new.extend(index_var.var_query)
-
-        
-        
-        self.var_independent = ivar_new
-        self.var_dependent = dvar_new
-        self.var_query = qvar_new
-
-
-        # for index_var in indices_var: index_var.names_var = None # the names of variables are discarded.
+    @property
+    def layout(self) -> Layout:
+        if self._layout is None:
+            self._layout = Layout(
+                (tuple(map(tuple, self.positions_ivar)), tuple(map(tuple, self.positions_dvar)), tuple(map(tuple, self.positions_qvar))),
+                (tuple(self.var_independent), tuple(self.var_dependent), tuple(self.var_query)),
+                tuple(self.names_var.items())
+            )
+        return self._layout
 
 
     def normalize(self):
         '''normalize the index, so that the index is unique in terms of one statement which has variable(s).'''
         if self._positions_normalized is None:
             self._positions_normalized = (
-                _normalize([int(var) for var in self.var_independent]), 
-                _normalize([int(var) for var in self.var_dependent]), 
-                _normalize([int(var) for var in self.var_query])
+                _normalize(tuple(self.var_independent)),
+                _normalize(tuple(self.var_dependent)),
+                _normalize(tuple(self.var_query))
             )
         return self._positions_normalized
 
@@ -218,11 +187,65 @@ class IndexVar:
         return hash(self) == hash(o)
 
     def clone(self):
-        return deepcopy(self)
+        '''the variables of the clone are renumbered independently of the components.'''
+        clone = IndexVar()
+        clone.positions_ivar, clone.positions_dvar, clone.positions_qvar = list(self.positions_ivar), list(self.positions_dvar), list(self.positions_qvar)
+        clone.var_independent, clone.var_dependent, clone.var_query = list(self.var_independent), list(self.var_dependent), list(self.var_query)
+        clone.dependents = list(self.dependents)
+        clone.names_var = self.names_var.copy()
+        clone._positions_normalized = self._positions_normalized
+        clone._hash_value = self._hash_value
+        clone._layout = self._layout
+        return clone
+
+
+@lru_cache(maxsize=4096)
+def _build(keys: Tuple, is_input: bool) -> Layout:
+    '''
+    the layout of a term, given the keys of its components, each of which is `(kind, name)` of a variable-component, the layout of a term with variables, or `None`.
+    The variables of the variable-components come first, and then those of the other components, which are renumbered by their names if `is_input` is true.
+    '''
+    positions = ([], [], [])
+    variables = ([], [], [])
+    names: Dict[str, int] = {}
+    layouts: List[Layout] = []
+    for i, key in enumerate(keys):
+        if key is None: continue
+        if isinstance(key, Layout):
+            for positions_kind, positions_component in zip(positions, key.positions):
+                positions_kind.extend((i, *position) for position in positions_component)
+            layouts.append(key)
+        else:
+            kind, name = key
+            positions[kind].append((i,))
+            if name not in names: names[name] = len(names)
+            variables[kind].append(names[name])
+    return _merge(Layout(tuple(map(tuple, positions)), tuple(map(tuple, variables)), tuple(names.items())), tuple(layouts), is_input)
+
+
+@lru_cache(maxsize=4096)
+def _merge(layout: Layout, layouts: Tuple[Layout], is_input: bool) -> Layout:
+    '''the layout after merging the variables of the components into that of the term.'''
+    if len(layouts) == 0: return layout
+    names = dict(layout.names)
+    for layout_component in layouts:
+        for name, _ in layout_component.names:
+            if name not in names: names[name] = len(names)
+    variables = tuple(list(variables_kind) for variables_kind in layout.variables)
+    for layout_component in layouts:
+        if is_input:
+            mapping = {var: names[name] for name, var in layout_component.names}
+            for variables_kind, variables_component in zip(variables, layout_component.variables):
+                variables_kind.extend(mapping[var] for var in variables_component)
+        else:
+            for variables_kind, variables_component in zip(variables, layout_component.variables):
+                variables_kind.extend(variables_component)
+    return Layout(layout.positions, tuple(map(tuple, variables)), tuple(names.items()))
 
 
-def _normalize(variables):
-    p1 = list(OrderedSet(variables))
-    p2 = list(range(len(p1)))
-    mapping = dict(zip(p1, p2))
-    return tuple(mapping[p] for p in variables)
\ No newline at end of file
+@lru_cache(maxsize=4096)
+def _normalize(variables: Tuple[int, ...]) -> Tuple[int, ...]:
+    mapping = {}
+    for var in variables:
+        if var not in mapping: mapping[var] = len(mapping)
+    return tuple(mapping[var] for var in variables)
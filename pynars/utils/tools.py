@@ -25,8 +25,11 @@ def get_size(obj, seen=None):
     if isinstance(obj, dict):
         size += sum([get_size(v, seen) for v in obj.values()])
         size += sum([get_size(k, seen) for k in obj.keys()])
-    elif hasattr(obj, '__dict__'):
-        size += get_size(obj.__dict__, seen)
+    elif hasattr(obj, '__dict__') or hasattr(obj, '__slots__'):
+        if hasattr(obj, '__dict__'): size += get_size(obj.__dict__, seen)
+        # the attributes stored in the slots, e.g., those of `Term`, `Task`, `Truth`, etc.
+        names_slot = (name for cls in type(obj).__mro__ for name in cls.__dict__.get('__slots__', ()) if name not in ('__dict__', '__weakref__'))
+        size += sum(get_size(getattr(obj, name), seen) for name in names_slot if hasattr(obj, name))
     elif hasattr(obj, '__iter__') and not isinstance(obj, (str, bytes, bytearray)):
         size += sum([get_size(i, seen) for i in obj])
 